@@ -39,13 +39,19 @@ class KBProcessor:
         """
         self.settings = settings or ConfigSelector.create(provider="dynaconf")
 
-        # Initialize vector store
+        # Initialize vector store (persist_dir only applies to the numpy provider)
+        vectordb_options = {}
+        if self.settings.ingestor.vectordb.get("persist_dir"):
+            vectordb_options["persist_dir"] = self.settings.ingestor.vectordb.persist_dir
+
         self.vector_store = VectorStoreSelector.create(
             provider=self.settings.ingestor.vectordb.provider,
             host=self.settings.ingestor.vectordb.host,
             port=self.settings.ingestor.vectordb.port,
             collection_name=self.settings.ingestor.vectordb.collection_name,
             vector_size=self.settings.ingestor.embedding.vector_size,
+            sparse_model=self.settings.ingestor.vectordb.get("sparse_model"),
+            **vectordb_options,
         )
 
         # Initialize LLM client for embeddings
@@ -56,11 +62,17 @@ class KBProcessor:
             api_key=self.settings.ingestor.litellm.api_key,
         )
 
-        # Initialize text chunker
+        # Initialize text chunker (encoding_name only applies to the markdown provider)
+        chunking = self.settings.ingestor.chunking
+        chunker_options = {}
+        if chunking.get("encoding_name"):
+            chunker_options["encoding_name"] = chunking.encoding_name
+
         self.chunker = TextChunkerSelector.create(
-            provider="recursive",
-            chunk_size=self.settings.ingestor.chunking.chunk_size,
-            chunk_overlap=self.settings.ingestor.chunking.chunk_overlap,
+            provider=chunking.get("provider", "recursive"),
+            chunk_size=chunking.chunk_size,
+            chunk_overlap=chunking.chunk_overlap,
+            **chunker_options,
         )
 
         logger.info(
@@ -108,7 +120,10 @@ class KBProcessor:
     def process(self) -> int:
         """Process and ingest all KB articles.
 
-        Loads articles, chunks them, generates embeddings, and stores in vector database.
+        Loads articles, chunks them, generates embeddings, and stores them in a
+        new versioned collection. The collection alias is swapped only after
+        all chunks are written, so search keeps serving the previous version
+        during re-embedding.
 
         Returns:
             Number of successfully ingested chunks.
@@ -128,7 +143,8 @@ class KBProcessor:
 
         for article in articles:
             # Combine title and content for better semantic search
-            doc_text = f"{article['title']}\n\n{article['content']}"
+            # (title as h1 so heading-aware chunkers include it in heading_path)
+            doc_text = f"# {article['title']}\n\n{article['content']}"
 
             # Split document into chunks
             chunks = self.chunker.split(
@@ -158,13 +174,30 @@ class KBProcessor:
         logger.info("Generating embeddings...")
         embeddings = self.llm_client.embed(all_chunks)
 
-        # Add to vector store
+        # Add to a staging collection, then swap the alias atomically
         logger.info("Adding to vector store...")
-        self.vector_store.add(
-            embeddings=embeddings,
-            metadata=all_metadata,
-            ids=all_ids,
-        )
+        staging_collection = self.vector_store.create_versioned_collection()
+        try:
+            self.vector_store.add(
+                embeddings=embeddings,
+                metadata=all_metadata,
+                ids=all_ids,
+                collection_name=staging_collection,
+                texts=all_chunks,
+            )
+            self.vector_store.swap_alias(
+                staging_collection,
+                delete_previous=self.settings.ingestor.vectordb.get(
+                    "delete_previous_collection", True
+                ),
+            )
+        except Exception:
+            # Don't leave a half-filled version behind on every failed run
+            try:
+                self.vector_store.drop_collection(staging_collection)
+            except Exception as e:
+                logger.error(f"Failed to drop staging collection '{staging_collection}': {e}")
+            raise
 
         logger.info(f"Successfully ingested {len(all_chunks)} chunks")
         return len(all_chunks)
@@ -1,7 +1,8 @@
 """Base abstraction for key-value databases."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Any, Optional
 
 
 class BaseKeyValueClient(ABC):
@@ -50,6 +51,58 @@ class BaseKeyValueClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def mget(self, **kwargs) -> list[Any]:
+        """Get values for several keys in one round trip.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., keys)
+
+        Returns:
+            Values in key order, None for missing keys.
+        """
+        pass
+
+    @abstractmethod
+    def mset(self, **kwargs) -> bool:
+        """Set several key-value pairs in one round trip.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., mapping, ttl)
+
+        Returns:
+            True if successful.
+        """
+        pass
+
+    @abstractmethod
+    def pipeline(self, **kwargs) -> AbstractContextManager[Any]:
+        """Batch operations into a single round trip.
+
+        The context yields a batch exposing the queueable subset of the
+        client's methods (same arguments); calls are queued and sent
+        together when the context exits.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., transaction)
+
+        Returns:
+            Context manager yielding the batching client.
+        """
+        pass
+
+    @abstractmethod
+    def expire(self, **kwargs) -> bool:
+        """Set a key's time-to-live.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, ttl)
+
+        Returns:
+            True if the key exists and the TTL was set.
+        """
+        pass
+
     @abstractmethod
     def scan(self, **kwargs) -> list[Any]:
         """Scan keys matching criteria.
@@ -61,3 +114,580 @@ class BaseKeyValueClient(ABC):
             List of matching keys or values.
         """
         pass
+
+    @abstractmethod
+    def hset(self, **kwargs) -> int:
+        """Set fields of a hash.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, mapping)
+
+        Returns:
+            Number of new fields added.
+        """
+        pass
+
+    @abstractmethod
+    def hgetall(self, **kwargs) -> dict[str, Any]:
+        """Get all fields of a hash.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key)
+
+        Returns:
+            Field to value mapping (empty if key does not exist).
+        """
+        pass
+
+    @abstractmethod
+    def hdel(self, **kwargs) -> int:
+        """Delete fields from a hash.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, fields)
+
+        Returns:
+            Number of fields removed.
+        """
+        pass
+
+    @abstractmethod
+    def zadd(self, **kwargs) -> int:
+        """Add members to a sorted set, or update their scores.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, mapping)
+
+        Returns:
+            Number of new members added.
+        """
+        pass
+
+    @abstractmethod
+    def zrem(self, **kwargs) -> int:
+        """Remove members from a sorted set.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, members)
+
+        Returns:
+            Number of members removed.
+        """
+        pass
+
+    @abstractmethod
+    def zremrangebyscore(self, **kwargs) -> int:
+        """Remove sorted set members within a score range.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, min_score, max_score)
+
+        Returns:
+            Number of members removed.
+        """
+        pass
+
+    @abstractmethod
+    def zrange(self, **kwargs) -> list[Any]:
+        """Get sorted set members by rank.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, start, end)
+
+        Returns:
+            List of members ordered by score.
+        """
+        pass
+
+    @abstractmethod
+    def zrangebyscore(self, **kwargs) -> list[Any]:
+        """Get sorted set members within a score range.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, min_score, max_score, limit)
+
+        Returns:
+            List of members ordered by score.
+        """
+        pass
+
+    @abstractmethod
+    def zscore(self, **kwargs) -> Optional[float]:
+        """Get the score of a sorted set member.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, member)
+
+        Returns:
+            Member score, or None if the member is not in the set.
+        """
+        pass
+
+    @abstractmethod
+    def sadd(self, **kwargs) -> int:
+        """Add members to a set.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, members)
+
+        Returns:
+            Number of new members added.
+        """
+        pass
+
+    @abstractmethod
+    def smembers(self, **kwargs) -> list[Any]:
+        """Get all members of a set.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key)
+
+        Returns:
+            List of set members.
+        """
+        pass
+
+    @abstractmethod
+    def unlink(self, **kwargs) -> int:
+        """Remove keys without blocking on memory reclamation.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., keys, batch_size)
+
+        Returns:
+            Number of keys removed.
+        """
+        pass
+
+    @abstractmethod
+    def xadd(self, **kwargs) -> str:
+        """Append an entry to a stream.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, fields, maxlen)
+
+        Returns:
+            ID of the new entry.
+        """
+        pass
+
+    @abstractmethod
+    def xgroup_create(self, **kwargs) -> bool:
+        """Create a consumer group on a stream (and the stream if missing).
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, group)
+
+        Returns:
+            True if created, False if the group already exists.
+        """
+        pass
+
+    @abstractmethod
+    def xreadgroup(self, **kwargs) -> list[tuple[str, dict]]:
+        """Read new stream entries as a consumer group member.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, group, consumer, count, block_ms)
+
+        Returns:
+            List of (entry ID, fields) tuples.
+        """
+        pass
+
+    @abstractmethod
+    def xautoclaim(self, **kwargs) -> list[tuple[str, dict]]:
+        """Take over entries another consumer read but never acknowledged.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, group, consumer, min_idle_ms, count)
+
+        Returns:
+            List of (entry ID, fields) tuples.
+        """
+        pass
+
+    @abstractmethod
+    def xpending(self, **kwargs) -> list[tuple[str, int]]:
+        """List pending stream entries with their delivery counts.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, group, start, end, count)
+
+        Returns:
+            List of (entry ID, times delivered) tuples.
+        """
+        pass
+
+    @abstractmethod
+    def xack(self, **kwargs) -> int:
+        """Acknowledge processed stream entries.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, group, ids)
+
+        Returns:
+            Number of entries acknowledged.
+        """
+        pass
+
+    @abstractmethod
+    def xdel(self, **kwargs) -> int:
+        """Delete stream entries.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, ids)
+
+        Returns:
+            Number of entries deleted.
+        """
+        pass
+
+
+class BaseAsyncKeyValueClient(ABC):
+    """Abstract base class for asyncio key-value clients.
+
+    Same operations as ``BaseKeyValueClient``, each awaitable, so code typed
+    against either base knows whether it gets results or coroutines.
+    """
+
+    @abstractmethod
+    async def get(self, **kwargs) -> Any:
+        """Get value by key.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key)
+
+        Returns:
+            Value if found, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, **kwargs) -> bool:
+        """Set key-value pair.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, value, ttl)
+
+        Returns:
+            True if successful.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, **kwargs) -> bool:
+        """Delete key(s).
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, pattern)
+
+        Returns:
+            True if key was deleted.
+        """
+        pass
+
+    @abstractmethod
+    async def mget(self, **kwargs) -> list[Any]:
+        """Get values for several keys in one round trip.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., keys)
+
+        Returns:
+            Values in key order, None for missing keys.
+        """
+        pass
+
+    @abstractmethod
+    async def mset(self, **kwargs) -> bool:
+        """Set several key-value pairs in one round trip.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., mapping, ttl)
+
+        Returns:
+            True if successful.
+        """
+        pass
+
+    @abstractmethod
+    def pipeline(self, **kwargs) -> AbstractAsyncContextManager[Any]:
+        """Batch operations into a single round trip.
+
+        The context yields a batch exposing the queueable subset of the
+        client's methods (same arguments, awaited); calls are queued and
+        sent together when the context exits.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., transaction)
+
+        Returns:
+            Async context manager yielding the batching client.
+        """
+        pass
+
+    @abstractmethod
+    async def expire(self, **kwargs) -> bool:
+        """Set a key's time-to-live.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, ttl)
+
+        Returns:
+            True if the key exists and the TTL was set.
+        """
+        pass
+
+    @abstractmethod
+    async def scan(self, **kwargs) -> list[Any]:
+        """Scan keys matching criteria.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., pattern)
+
+        Returns:
+            List of matching keys or values.
+        """
+        pass
+
+    @abstractmethod
+    async def hset(self, **kwargs) -> int:
+        """Set fields of a hash.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, mapping)
+
+        Returns:
+            Number of new fields added.
+        """
+        pass
+
+    @abstractmethod
+    async def hgetall(self, **kwargs) -> dict[str, Any]:
+        """Get all fields of a hash.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key)
+
+        Returns:
+            Field to value mapping (empty if key does not exist).
+        """
+        pass
+
+    @abstractmethod
+    async def hdel(self, **kwargs) -> int:
+        """Delete fields from a hash.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, fields)
+
+        Returns:
+            Number of fields removed.
+        """
+        pass
+
+    @abstractmethod
+    async def zadd(self, **kwargs) -> int:
+        """Add members to a sorted set, or update their scores.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, mapping)
+
+        Returns:
+            Number of new members added.
+        """
+        pass
+
+    @abstractmethod
+    async def zrem(self, **kwargs) -> int:
+        """Remove members from a sorted set.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, members)
+
+        Returns:
+            Number of members removed.
+        """
+        pass
+
+    @abstractmethod
+    async def zremrangebyscore(self, **kwargs) -> int:
+        """Remove sorted set members within a score range.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, min_score, max_score)
+
+        Returns:
+            Number of members removed.
+        """
+        pass
+
+    @abstractmethod
+    async def zrange(self, **kwargs) -> list[Any]:
+        """Get sorted set members by rank.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, start, end)
+
+        Returns:
+            List of members ordered by score.
+        """
+        pass
+
+    @abstractmethod
+    async def zrangebyscore(self, **kwargs) -> list[Any]:
+        """Get sorted set members within a score range.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, min_score, max_score, limit)
+
+        Returns:
+            List of members ordered by score.
+        """
+        pass
+
+    @abstractmethod
+    async def zscore(self, **kwargs) -> Optional[float]:
+        """Get the score of a sorted set member.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, member)
+
+        Returns:
+            Member score, or None if the member is not in the set.
+        """
+        pass
+
+    @abstractmethod
+    async def sadd(self, **kwargs) -> int:
+        """Add members to a set.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, members)
+
+        Returns:
+            Number of new members added.
+        """
+        pass
+
+    @abstractmethod
+    async def smembers(self, **kwargs) -> list[Any]:
+        """Get all members of a set.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key)
+
+        Returns:
+            List of set members.
+        """
+        pass
+
+    @abstractmethod
+    async def unlink(self, **kwargs) -> int:
+        """Remove keys without blocking on memory reclamation.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., keys, batch_size)
+
+        Returns:
+            Number of keys removed.
+        """
+        pass
+
+    @abstractmethod
+    async def xadd(self, **kwargs) -> str:
+        """Append an entry to a stream.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, fields, maxlen)
+
+        Returns:
+            ID of the new entry.
+        """
+        pass
+
+    @abstractmethod
+    async def xgroup_create(self, **kwargs) -> bool:
+        """Create a consumer group on a stream (and the stream if missing).
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, group)
+
+        Returns:
+            True if created, False if the group already exists.
+        """
+        pass
+
+    @abstractmethod
+    async def xreadgroup(self, **kwargs) -> list[tuple[str, dict]]:
+        """Read new stream entries as a consumer group member.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, group, consumer, count, block_ms)
+
+        Returns:
+            List of (entry ID, fields) tuples.
+        """
+        pass
+
+    @abstractmethod
+    async def xautoclaim(self, **kwargs) -> list[tuple[str, dict]]:
+        """Take over entries another consumer read but never acknowledged.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, group, consumer, min_idle_ms, count)
+
+        Returns:
+            List of (entry ID, fields) tuples.
+        """
+        pass
+
+    @abstractmethod
+    async def xpending(self, **kwargs) -> list[tuple[str, int]]:
+        """List pending stream entries with their delivery counts.
+
+        Args:
+            **kwargs: Implementation-specific parameters
+                      (e.g., key, group, start, end, count)
+
+        Returns:
+            List of (entry ID, times delivered) tuples.
+        """
+        pass
+
+    @abstractmethod
+    async def xack(self, **kwargs) -> int:
+        """Acknowledge processed stream entries.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, group, ids)
+
+        Returns:
+            Number of entries acknowledged.
+        """
+        pass
+
+    @abstractmethod
+    async def xdel(self, **kwargs) -> int:
+        """Delete stream entries.
+
+        Args:
+            **kwargs: Implementation-specific parameters (e.g., key, ids)
+
+        Returns:
+            Number of entries deleted.
+        """
+        pass
@@ -0,0 +1,814 @@
+"""Asyncio Redis client implementation."""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, List
+
+import redis.asyncio as aioredis
+
+from libs.database.keyvalue_db.base import BaseAsyncKeyValueClient
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncRedisClient(BaseAsyncKeyValueClient):
+    """Asyncio Redis key-value client implementation.
+
+    Same surface as ``RedisClient`` with every operation awaitable, built on
+    ``redis.asyncio`` over an explicitly sized connection pool.
+
+    Attributes:
+        client: Async Redis client instance.
+    """
+
+    def __init__(
+        self,
+        host: str = "redis",
+        port: int = 6379,
+        db: int = 0,
+        decode_responses: bool = True,
+        max_connections: int = 50,
+        socket_timeout: Optional[float] = 5.0,
+        socket_connect_timeout: Optional[float] = 5.0,
+        socket_keepalive: bool = True,
+        health_check_interval: int = 30,
+        **kwargs
+    ):
+        """Initialize async Redis client.
+
+        Connections are opened lazily on first use.
+
+        Args:
+            host: Redis host.
+            port: Redis port.
+            db: Redis database number.
+            decode_responses: Decode byte responses to strings.
+            max_connections: Connection pool size.
+            socket_timeout: Seconds to wait for a command reply.
+            socket_connect_timeout: Seconds to wait for a connection.
+            socket_keepalive: Enable TCP keepalive on pooled connections.
+            health_check_interval: Seconds a connection may sit idle before
+                it is pinged on checkout (0 disables).
+            **kwargs: Additional Redis connection parameters.
+        """
+        pool = aioredis.ConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            decode_responses=decode_responses,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            socket_keepalive=socket_keepalive,
+            health_check_interval=health_check_interval,
+            **kwargs
+        )
+        self.client = aioredis.Redis(connection_pool=pool)
+        logger.info(
+            f"AsyncRedisClient configured for {host}:{port} "
+            f"(max_connections={max_connections})"
+        )
+
+    async def get(self, key: str = None, **kwargs) -> Optional[Any]:
+        """Get value by key.
+
+        Args:
+            key: Key to retrieve.
+
+        Returns:
+            Value if found, None otherwise.
+        """
+        if not key:
+            raise ValueError("key is required")
+        return await self.client.get(key)
+
+    async def set(
+        self,
+        key: str = None,
+        value: Any = None,
+        ttl: Optional[int] = None,
+        **kwargs
+    ) -> bool:
+        """Set key-value pair.
+
+        Args:
+            key: Key to set.
+            value: Value to store.
+            ttl: Time-to-live in seconds.
+
+        Returns:
+            True if successful.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if ttl:
+            return await self.client.setex(key, ttl, value)
+        return await self.client.set(key, value)
+
+    async def delete(self, key: str = None, pattern: str = None, **kwargs) -> bool:
+        """Delete key(s).
+
+        Args:
+            key: Single key to delete.
+            pattern: Pattern to match and delete multiple keys.
+
+        Returns:
+            True if any keys were deleted.
+        """
+        if key:
+            return await self.client.delete(key) > 0
+        if pattern:
+            return await self.unlink(keys=await self.scan(pattern=pattern)) > 0
+        raise ValueError("Either key or pattern is required")
+
+    async def mget(self, keys: List[str] = None, **kwargs) -> List[Optional[Any]]:
+        """Get values for several keys in one round trip.
+
+        Args:
+            keys: Keys to retrieve.
+
+        Returns:
+            Values in key order, None for missing keys.
+        """
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def mset(
+        self,
+        mapping: Dict[str, Any] = None,
+        ttl: Optional[int] = None,
+        **kwargs
+    ) -> bool:
+        """Set several key-value pairs in one round trip.
+
+        MSET has no expiry, so with a TTL the SETEX commands are pipelined.
+
+        Args:
+            mapping: Key to value mapping.
+            ttl: Time-to-live in seconds applied to every key.
+
+        Returns:
+            True if successful.
+        """
+        if not mapping:
+            return True
+        if not ttl:
+            return await self.client.mset(mapping)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, value)
+            return all(await pipe.execute())
+
+    @asynccontextmanager
+    async def pipeline(
+        self,
+        transaction: bool = False,
+        **kwargs
+    ) -> AsyncIterator["AsyncRedisPipeline"]:
+        """Batch operations into a single round trip.
+
+        Example:
+            >>> async with client.pipeline() as batch:
+            ...     await batch.zadd(key="a", mapping={"x": 1.0})
+            ...     await batch.hdel(key="b", fields=["x"])
+            >>> batch.results
+
+        Args:
+            transaction: Wrap the batch in MULTI/EXEC.
+
+        Yields:
+            AsyncRedisPipeline with the same methods; results are in
+            ``results`` after the context exits.
+        """
+        async with self.client.pipeline(transaction=transaction) as pipe:
+            batch = AsyncRedisPipeline(pipe)
+            yield batch
+            batch.results = await pipe.execute()
+
+    async def expire(self, key: str = None, ttl: int = None, **kwargs) -> bool:
+        """Set a key's time-to-live.
+
+        Args:
+            key: Key to expire.
+            ttl: Time-to-live in seconds.
+
+        Returns:
+            True if the key exists and the TTL was set.
+        """
+        if not key or not ttl:
+            raise ValueError("key and ttl are required")
+        return await self.client.expire(key, ttl)
+
+    async def scan(self, pattern: str = "*", **kwargs) -> List[str]:
+        """Scan keys matching pattern.
+
+        Args:
+            pattern: Pattern to match (e.g., "session:*").
+
+        Returns:
+            List of matching keys.
+        """
+        return [key async for key in self.client.scan_iter(pattern)]
+
+    async def hset(self, key: str = None, mapping: dict = None, **kwargs) -> int:
+        """Set fields of a hash.
+
+        Args:
+            key: Hash key.
+            mapping: Field to value mapping.
+
+        Returns:
+            Number of new fields added.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if not mapping:
+            return 0
+        return await self.client.hset(key, mapping=mapping)
+
+    async def hgetall(self, key: str = None, **kwargs) -> Dict[str, Any]:
+        """Get all fields of a hash.
+
+        Args:
+            key: Hash key.
+
+        Returns:
+            Field to value mapping (empty if key does not exist).
+        """
+        if not key:
+            raise ValueError("key is required")
+        return await self.client.hgetall(key)
+
+    async def hdel(self, key: str = None, fields: List[str] = None, **kwargs) -> int:
+        """Delete fields from a hash.
+
+        Args:
+            key: Hash key.
+            fields: Fields to delete.
+
+        Returns:
+            Number of fields removed.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if not fields:
+            return 0
+        return await self.client.hdel(key, *fields)
+
+    async def zadd(
+        self,
+        key: str = None,
+        mapping: dict = None,
+        nx: bool = False,
+        **kwargs
+    ) -> int:
+        """Add members to a sorted set, or update their scores.
+
+        Args:
+            key: Sorted set key.
+            mapping: Member to score mapping.
+            nx: Only add new members; existing scores are left unchanged.
+
+        Returns:
+            Number of new members added.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if not mapping:
+            return 0
+        return await self.client.zadd(key, mapping, nx=nx)
+
+    async def zrem(self, key: str = None, members: List[str] = None, **kwargs) -> int:
+        """Remove members from a sorted set.
+
+        Args:
+            key: Sorted set key.
+            members: Members to remove.
+
+        Returns:
+            Number of members removed.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if not members:
+            return 0
+        return await self.client.zrem(key, *members)
+
+    async def zremrangebyscore(
+        self,
+        key: str = None,
+        min_score: float = float("-inf"),
+        max_score: float = float("inf"),
+        **kwargs
+    ) -> int:
+        """Remove sorted set members within a score range.
+
+        Args:
+            key: Sorted set key.
+            min_score: Minimum score (inclusive).
+            max_score: Maximum score (inclusive).
+
+        Returns:
+            Number of members removed.
+        """
+        if not key:
+            raise ValueError("key is required")
+        return await self.client.zremrangebyscore(key, min_score, max_score)
+
+    async def zrange(
+        self,
+        key: str = None,
+        start: int = 0,
+        end: int = -1,
+        desc: bool = False,
+        **kwargs
+    ) -> List[str]:
+        """Get sorted set members by rank.
+
+        Args:
+            key: Sorted set key.
+            start: Start rank (inclusive).
+            end: End rank (inclusive, -1 for last).
+            desc: Order by descending score.
+
+        Returns:
+            List of members ordered by score.
+        """
+        if not key:
+            raise ValueError("key is required")
+        return await self.client.zrange(key, start, end, desc=desc)
+
+    async def zrangebyscore(
+        self,
+        key: str = None,
+        min_score: float = float("-inf"),
+        max_score: float = float("inf"),
+        limit: Optional[int] = None,
+        withscores: bool = False,
+        **kwargs
+    ) -> List[Any]:
+        """Get sorted set members within a score range.
+
+        Args:
+            key: Sorted set key.
+            min_score: Minimum score (inclusive).
+            max_score: Maximum score (inclusive).
+            limit: Maximum number of members to return.
+            withscores: Return (member, score) tuples.
+
+        Returns:
+            List of members (or (member, score) tuples) ordered by
+            ascending score.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if limit is None:
+            return await self.client.zrangebyscore(
+                key, min_score, max_score, withscores=withscores
+            )
+        return await self.client.zrangebyscore(
+            key, min_score, max_score, start=0, num=limit, withscores=withscores
+        )
+
+    async def zscore(self, key: str = None, member: str = None, **kwargs) -> Optional[float]:
+        """Get the score of a sorted set member.
+
+        Args:
+            key: Sorted set key.
+            member: Member to look up.
+
+        Returns:
+            Member score, or None if the member is not in the set.
+        """
+        if not key:
+            raise ValueError("key is required")
+        return await self.client.zscore(key, member)
+
+    async def sadd(self, key: str = None, members: List[str] = None, **kwargs) -> int:
+        """Add members to a set.
+
+        Args:
+            key: Set key.
+            members: Members to add.
+
+        Returns:
+            Number of new members added.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if not members:
+            return 0
+        return await self.client.sadd(key, *members)
+
+    async def smembers(self, key: str = None, **kwargs) -> List[str]:
+        """Get all members of a set.
+
+        Args:
+            key: Set key.
+
+        Returns:
+            List of set members (empty if key does not exist).
+        """
+        if not key:
+            raise ValueError("key is required")
+        return list(await self.client.smembers(key))
+
+    async def unlink(
+        self,
+        keys: List[str] = None,
+        batch_size: int = 500,
+        **kwargs
+    ) -> int:
+        """Remove keys with pipelined UNLINK in batches.
+
+        Args:
+            keys: Keys to remove.
+            batch_size: Keys per UNLINK command.
+
+        Returns:
+            Number of keys removed.
+        """
+        if not keys:
+            return 0
+        async with self.client.pipeline(transaction=False) as pipe:
+            for i in range(0, len(keys), batch_size):
+                pipe.unlink(*keys[i:i + batch_size])
+            return sum(await pipe.execute())
+
+    async def xadd(
+        self,
+        key: str = None,
+        fields: Dict[str, Any] = None,
+        maxlen: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """Append an entry to a stream.
+
+        Args:
+            key: Stream key.
+            fields: Entry field-value pairs.
+            maxlen: Approximate cap on stream length (oldest entries trimmed).
+
+        Returns:
+            ID of the new entry.
+        """
+        if not key:
+            raise ValueError("key is required")
+        return await self.client.xadd(key, fields, maxlen=maxlen, approximate=True)
+
+    async def xgroup_create(self, key: str = None, group: str = None, **kwargs) -> bool:
+        """Create a consumer group reading from the start of the stream.
+
+        The stream is created if it does not exist.
+
+        Args:
+            key: Stream key.
+            group: Consumer group name.
+
+        Returns:
+            True if created, False if the group already exists.
+        """
+        if not key or not group:
+            raise ValueError("key and group are required")
+        try:
+            await self.client.xgroup_create(key, group, id="0", mkstream=True)
+            return True
+        except aioredis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+            return False
+
+    async def xreadgroup(
+        self,
+        key: str = None,
+        group: str = None,
+        consumer: str = None,
+        count: int = 10,
+        block_ms: Optional[int] = None,
+        **kwargs
+    ) -> List[tuple]:
+        """Read entries never delivered to the group.
+
+        Args:
+            key: Stream key.
+            group: Consumer group name.
+            consumer: Consumer name within the group.
+            count: Maximum entries to read.
+            block_ms: Milliseconds to wait for entries (None returns at once).
+                Keep below the client's socket timeout.
+
+        Returns:
+            List of (entry ID, fields) tuples.
+        """
+        if not key or not group or not consumer:
+            raise ValueError("key, group and consumer are required")
+        response = await self.client.xreadgroup(
+            group, consumer, {key: ">"}, count=count, block=block_ms
+        )
+        if isinstance(response, dict):
+            entries = [entry for stream in response.values() for entry in stream[0]]
+        else:
+            entries = [entry for _, stream in response or [] for entry in stream]
+        return [(entry_id, fields) for entry_id, fields in entries if fields]
+
+    async def xautoclaim(
+        self,
+        key: str = None,
+        group: str = None,
+        consumer: str = None,
+        min_idle_ms: int = 60000,
+        count: int = 10,
+        **kwargs
+    ) -> List[tuple]:
+        """Take over entries pending longer than ``min_idle_ms``.
+
+        Entries read by a consumer that died before acknowledging them are
+        handed to ``consumer``.
+
+        Args:
+            key: Stream key.
+            group: Consumer group name.
+            consumer: Consumer taking over the entries.
+            min_idle_ms: Minimum time since the entry was last delivered.
+            count: Maximum entries to claim.
+
+        Returns:
+            List of (entry ID, fields) tuples.
+        """
+        if not key or not group or not consumer:
+            raise ValueError("key, group and consumer are required")
+        response = await self.client.xautoclaim(
+            key, group, consumer, min_idle_ms, start_id="0-0", count=count
+        )
+        # Entries deleted from the stream come back without fields
+        return [(entry_id, fields) for entry_id, fields in response[1] if fields]
+
+    async def xpending(
+        self,
+        key: str = None,
+        group: str = None,
+        start: str = "-",
+        end: str = "+",
+        count: int = 10,
+        **kwargs
+    ) -> List[tuple]:
+        """List pending entries (read, not acknowledged) with delivery counts.
+
+        Args:
+            key: Stream key.
+            group: Consumer group name.
+            start: Lowest entry ID (inclusive, "-" for the first).
+            end: Highest entry ID (inclusive, "+" for the last).
+            count: Maximum entries to list.
+
+        Returns:
+            List of (entry ID, times delivered) tuples, oldest first.
+        """
+        if not key or not group:
+            raise ValueError("key and group are required")
+        response = await self.client.xpending_range(key, group, start, end, count)
+        return [(entry["message_id"], entry["times_delivered"]) for entry in response]
+
+    async def xack(
+        self,
+        key: str = None,
+        group: str = None,
+        ids: List[str] = None,
+        **kwargs
+    ) -> int:
+        """Acknowledge processed stream entries.
+
+        Args:
+            key: Stream key.
+            group: Consumer group name.
+            ids: Entry IDs to acknowledge.
+
+        Returns:
+            Number of entries acknowledged.
+        """
+        if not key or not group:
+            raise ValueError("key and group are required")
+        if not ids:
+            return 0
+        return await self.client.xack(key, group, *ids)
+
+    async def xdel(self, key: str = None, ids: List[str] = None, **kwargs) -> int:
+        """Delete stream entries.
+
+        Args:
+            key: Stream key.
+            ids: Entry IDs to delete.
+
+        Returns:
+            Number of entries deleted.
+        """
+        if not key:
+            raise ValueError("key is required")
+        if not ids:
+            return 0
+        return await self.client.xdel(key, *ids)
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self.client.aclose()
+
+    def get_raw_client(self) -> aioredis.Redis:
+        """Get the underlying async Redis client for direct operations.
+
+        Returns:
+            Async Redis client instance.
+        """
+        return self.client
+
+
+class AsyncRedisPipeline:
+    """Queued async Redis commands sent as one round trip.
+
+    Created by ``AsyncRedisClient.pipeline()``. Wraps a redis.asyncio
+    pipeline and exposes only commands that can be queued; SCAN-based,
+    blocking and post-processed reads (``scan``, pattern deletes,
+    ``xreadgroup``, ``xautoclaim``) stay on ``AsyncRedisClient``. Methods
+    are awaitable like the client's and return None; replies are in
+    ``results`` after the context exits, in call order. Calls with nothing
+    to do (empty mapping, fields or keys) queue nothing.
+
+    Attributes:
+        pipe: Async Redis pipeline instance.
+        results: Raw command replies in call order, set on execute.
+    """
+
+    def __init__(self, pipe: aioredis.client.Pipeline):
+        """Wrap an async Redis pipeline.
+
+        Args:
+            pipe: Async Redis pipeline to queue commands on.
+        """
+        self.pipe = pipe
+        self.results: List[Any] = []
+
+    @asynccontextmanager
+    async def pipeline(self, **kwargs) -> AsyncIterator["AsyncRedisPipeline"]:
+        """Nested pipelines share the enclosing batch."""
+        yield self
+
+    async def get(self, key: str = None, **kwargs) -> None:
+        """Queue GET."""
+        if not key:
+            raise ValueError("key is required")
+        self.pipe.get(key)
+
+    async def set(
+        self,
+        key: str = None,
+        value: Any = None,
+        ttl: Optional[int] = None,
+        **kwargs
+    ) -> None:
+        """Queue SET, or SETEX with a TTL."""
+        if not key:
+            raise ValueError("key is required")
+        if ttl:
+            self.pipe.setex(key, ttl, value)
+        else:
+            self.pipe.set(key, value)
+
+    async def delete(self, key: str = None, **kwargs) -> None:
+        """Queue a single-key DEL (pattern deletes need a SCAN first)."""
+        if not key:
+            raise ValueError("key is required in a pipeline")
+        self.pipe.delete(key)
+
+    async def mget(self, keys: List[str] = None, **kwargs) -> None:
+        """Queue MGET."""
+        if keys:
+            self.pipe.mget(keys)
+
+    async def mset(
+        self,
+        mapping: Dict[str, Any] = None,
+        ttl: Optional[int] = None,
+        **kwargs
+    ) -> None:
+        """Queue MSET, or one SETEX per key when a TTL is given."""
+        if not mapping:
+            return
+        if not ttl:
+            self.pipe.mset(mapping)
+            return
+        for key, value in mapping.items():
+            self.pipe.setex(key, ttl, value)
+
+    async def hset(self, key: str = None, mapping: dict = None, **kwargs) -> None:
+        """Queue HSET."""
+        if not key:
+            raise ValueError("key is required")
+        if mapping:
+            self.pipe.hset(key, mapping=mapping)
+
+    async def hgetall(self, key: str = None, **kwargs) -> None:
+        """Queue HGETALL."""
+        if not key:
+            raise ValueError("key is required")
+        self.pipe.hgetall(key)
+
+    async def hdel(self, key: str = None, fields: List[str] = None, **kwargs) -> None:
+        """Queue HDEL."""
+        if not key:
+            raise ValueError("key is required")
+        if fields:
+            self.pipe.hdel(key, *fields)
+
+    async def zadd(
+        self,
+        key: str = None,
+        mapping: dict = None,
+        nx: bool = False,
+        **kwargs
+    ) -> None:
+        """Queue ZADD (``nx``: only add new members)."""
+        if not key:
+            raise ValueError("key is required")
+        if mapping:
+            self.pipe.zadd(key, mapping, nx=nx)
+
+    async def expire(self, key: str = None, ttl: int = None, **kwargs) -> None:
+        """Queue EXPIRE."""
+        if not key or not ttl:
+            raise ValueError("key and ttl are required")
+        self.pipe.expire(key, ttl)
+
+    async def zrem(self, key: str = None, members: List[str] = None, **kwargs) -> None:
+        """Queue ZREM."""
+        if not key:
+            raise ValueError("key is required")
+        if members:
+            self.pipe.zrem(key, *members)
+
+    async def zremrangebyscore(
+        self,
+        key: str = None,
+        min_score: float = float("-inf"),
+        max_score: float = float("inf"),
+        **kwargs
+    ) -> None:
+        """Queue ZREMRANGEBYSCORE."""
+        if not key:
+            raise ValueError("key is required")
+        self.pipe.zremrangebyscore(key, min_score, max_score)
+
+    async def zscore(self, key: str = None, member: str = None, **kwargs) -> None:
+        """Queue ZSCORE."""
+        if not key:
+            raise ValueError("key is required")
+        self.pipe.zscore(key, member)
+
+    async def sadd(self, key: str = None, members: List[str] = None, **kwargs) -> None:
+        """Queue SADD."""
+        if not key:
+            raise ValueError("key is required")
+        if members:
+            self.pipe.sadd(key, *members)
+
+    async def smembers(self, key: str = None, **kwargs) -> None:
+        """Queue SMEMBERS (the reply is a set)."""
+        if not key:
+            raise ValueError("key is required")
+        self.pipe.smembers(key)
+
+    async def unlink(self, keys: List[str] = None, batch_size: int = 500, **kwargs) -> None:
+        """Queue one UNLINK per ``batch_size`` keys."""
+        for i in range(0, len(keys or []), batch_size):
+            self.pipe.unlink(*keys[i:i + batch_size])
+
+    async def xadd(
+        self,
+        key: str = None,
+        fields: Dict[str, Any] = None,
+        maxlen: Optional[int] = None,
+        **kwargs
+    ) -> None:
+        """Queue XADD with an approximate length cap."""
+        if not key:
+            raise ValueError("key is required")
+        self.pipe.xadd(key, fields, maxlen=maxlen, approximate=True)
+
+    async def xack(
+        self,
+        key: str = None,
+        group: str = None,
+        ids: List[str] = None,
+        **kwargs
+    ) -> None:
+        """Queue XACK."""
+        if not key or not group:
+            raise ValueError("key and group are required")
+        if ids:
+            self.pipe.xack(key, group, *ids)
+
+    async def xdel(self, key: str = None, ids: List[str] = None, **kwargs) -> None:
+        """Queue XDEL."""
+        if not key:
+            raise ValueError("key is required")
+        if ids:
+            self.pipe.xdel(key, *ids)
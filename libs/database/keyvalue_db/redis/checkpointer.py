@@ -0,0 +1,685 @@
+"""LangGraph Redis checkpointers with per-thread key tracking."""
+
+import hashlib
+import json
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Union
+
+import orjson
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.redis import AsyncRedisSaver, RedisSaver
+from langgraph.checkpoint.redis.key_registry import CheckpointKeyRegistry
+from langgraph.checkpoint.redis.util import (
+    safely_decode,
+    to_storage_safe_id,
+    to_storage_safe_str,
+)
+
+from libs.database.keyvalue_db.redis.serializer import CompactRedisSerializer
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Set per thread: members = every Redis key written for that thread
+CHECKPOINT_KEYS_PREFIX = "checkpoint_keys"
+
+# String per shared channel value: checkpoint_shared:{thread_id}:{digest}
+CHECKPOINT_SHARED_PREFIX = "checkpoint_shared"
+
+# List per thread and namespace: checkpoint IDs, newest first (keep_last only)
+CHECKPOINT_RECENT_PREFIX = "checkpoint_recent"
+
+# Marker fields inside a checkpoint's channel_values
+COMPACT_VALUES_FIELD = "__compact__"
+SHARED_REF_FIELD = "__shared__"
+
+
+def tracked_keys_key(thread_id: str) -> str:
+    """Build the tracked key set name for a thread.
+
+    Args:
+        thread_id: LangGraph thread ID.
+
+    Returns:
+        Redis key of the thread's tracked key set.
+    """
+    return f"{CHECKPOINT_KEYS_PREFIX}:{thread_id}"
+
+
+class _KeyTrackingMixin:
+    """Key names written by RedisSaver/AsyncRedisSaver for a put or put_writes.
+
+    Key names mirror langgraph-checkpoint-redis 0.1.x: checkpoint documents,
+    the latest-checkpoint pointer, pending writes and the write key registry.
+
+    Also stores checkpoints compactly. With a compressing serde, a
+    checkpoint's channel values are written as one compressed field instead
+    of inline JSON. Values of ``shared_channels`` are written once per
+    thread under a content digest and referenced from each checkpoint, so
+    an unchanged value (e.g. the input ticket) is not copied into every
+    checkpoint of a run.
+
+    With ``keep_last``, only the newest N checkpoints of each thread and
+    namespace are kept; older checkpoint documents and their pending writes
+    are unlinked after each put. History (time travel, replay from an older
+    checkpoint) is lost.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        serde: Optional[CompactRedisSerializer] = None,
+        shared_channels: Sequence[str] = (),
+        keep_last: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """Initialize the saver.
+
+        Args:
+            *args: Passed to the saver.
+            serde: Serializer; defaults to a non-compressing
+                CompactRedisSerializer, which still reads compact data.
+            shared_channels: Channels stored once per thread by digest.
+            keep_last: Checkpoints kept per thread and namespace
+                (None keeps all).
+            **kwargs: Passed to the saver.
+        """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+        super().__init__(*args, **kwargs)
+        self.serde = serde or CompactRedisSerializer(enabled=False)
+        self._shared_channels = tuple(shared_channels)
+        self._keep_last = keep_last
+
+    def _dump_checkpoint(self, checkpoint: Checkpoint) -> dict[str, Any]:
+        """Convert a checkpoint to its Redis document.
+
+        Args:
+            checkpoint: Checkpoint to store.
+
+        Returns:
+            Checkpoint document, with compressed channel values when the
+            serde compresses.
+        """
+        if not self.serde.enabled:
+            return super()._dump_checkpoint(checkpoint)
+
+        # Mirrors BaseRedisSaver._dump_checkpoint for everything but the values
+        shell = {**checkpoint, "channel_values": {}}
+        checkpoint_data = orjson.loads(self.serde.dumps(shell))
+        checkpoint_data["channel_versions"] = {
+            k: str(v) for k, v in checkpoint_data.get("channel_versions", {}).items()
+        }
+        checkpoint_data["channel_values"] = {
+            COMPACT_VALUES_FIELD: list(
+                self.serde.dumps_typed(checkpoint.get("channel_values") or {})
+            )
+        }
+        return {"type": "json", **checkpoint_data, "pending_sends": []}
+
+    def _load_checkpoint(
+        self,
+        checkpoint: Union[dict[str, Any], str],
+        channel_values: dict[str, Any],
+        pending_sends: list[Any],
+    ) -> Checkpoint:
+        """Build a checkpoint from its document, expanding compact values.
+
+        Args:
+            checkpoint: Checkpoint document or its JSON.
+            channel_values: Stored channel values.
+            pending_sends: Stored pending sends.
+
+        Returns:
+            Loaded checkpoint.
+        """
+        if isinstance(channel_values, dict) and COMPACT_VALUES_FIELD in channel_values:
+            type_, data = channel_values[COMPACT_VALUES_FIELD]
+            channel_values = self.serde.loads_typed((type_, data))
+        return super()._load_checkpoint(checkpoint, channel_values, pending_sends)
+
+    def _share_channels(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+    ) -> tuple[Checkpoint, dict[str, str]]:
+        """Replace shared channel values with references.
+
+        Args:
+            config: Runnable config with thread_id.
+            checkpoint: Checkpoint to store.
+
+        Returns:
+            Checkpoint with references, and shared key to stored value.
+        """
+        channel_values = checkpoint.get("channel_values") or {}
+        channels = [c for c in self._shared_channels if channel_values.get(c) is not None]
+        if not channels:
+            return checkpoint, {}
+
+        thread_id = to_storage_safe_id(config["configurable"]["thread_id"])
+        channel_values = dict(channel_values)
+        shared = {}
+        for channel in channels:
+            type_, data = self.serde.dumps_typed(channel_values[channel])
+            digest = hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+            key = f"{CHECKPOINT_SHARED_PREFIX}:{thread_id}:{digest}"
+            channel_values[channel] = {SHARED_REF_FIELD: key}
+            shared[key] = json.dumps([type_, data])
+        return {**checkpoint, "channel_values": channel_values}, shared
+
+    def _shared_refs(self, checkpoint_tuple: Optional[CheckpointTuple]) -> dict[str, str]:
+        """Find shared value references in a loaded checkpoint.
+
+        Args:
+            checkpoint_tuple: Loaded checkpoint tuple.
+
+        Returns:
+            Channel to shared key mapping.
+        """
+        if checkpoint_tuple is None:
+            return {}
+        channel_values = checkpoint_tuple.checkpoint.get("channel_values") or {}
+        return {
+            channel: value[SHARED_REF_FIELD]
+            for channel, value in channel_values.items()
+            if isinstance(value, dict) and SHARED_REF_FIELD in value
+        }
+
+    def _apply_shared(
+        self,
+        checkpoint_tuple: CheckpointTuple,
+        refs: dict[str, str],
+        stored: list[Optional[Union[str, bytes]]],
+    ) -> CheckpointTuple:
+        """Put shared values back in place of their references.
+
+        Args:
+            checkpoint_tuple: Loaded checkpoint tuple.
+            refs: Channel to shared key mapping.
+            stored: Stored values in refs order.
+
+        Returns:
+            The checkpoint tuple, updated in place.
+        """
+        channel_values = checkpoint_tuple.checkpoint["channel_values"]
+        for (channel, key), raw in zip(refs.items(), stored):
+            if raw is None:
+                logger.warning(f"Shared checkpoint value {key} is missing")
+                channel_values.pop(channel, None)
+                continue
+            type_, data = json.loads(raw)
+            channel_values[channel] = self.serde.loads_typed((type_, data))
+        return checkpoint_tuple
+
+    def _checkpoint_keys(self, next_config: RunnableConfig) -> list[str]:
+        """Keys written by put.
+
+        Args:
+            next_config: Config returned by put.
+
+        Returns:
+            Checkpoint document key and latest-checkpoint pointer.
+        """
+        configurable = next_config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable["checkpoint_ns"]
+        keys = [
+            self._make_redis_checkpoint_key(
+                thread_id, checkpoint_ns, configurable["checkpoint_id"]
+            ),
+            f"checkpoint_latest:{to_storage_safe_id(thread_id)}:"
+            f"{to_storage_safe_str(checkpoint_ns)}",
+        ]
+        if self._keep_last:
+            keys.append(self._recent_checkpoints_key(thread_id, checkpoint_ns))
+        return keys
+
+    def _write_keys(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+    ) -> list[str]:
+        """Keys written by put_writes.
+
+        Args:
+            config: Config of the parent checkpoint.
+            writes: (channel, value) pairs.
+            task_id: Task that produced the writes.
+
+        Returns:
+            Write keys plus the checkpoint's write key registry.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        keys = [
+            self._make_redis_checkpoint_writes_key(
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+            )
+            for idx, (channel, _) in enumerate(writes)
+        ]
+        if keys and self._key_registry:
+            keys.append(CheckpointKeyRegistry.make_write_keys_zset_key(
+                thread_id, checkpoint_ns, checkpoint_id
+            ))
+        return keys
+
+    def _recent_checkpoints_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        """Build the recent checkpoint list name for a thread and namespace.
+
+        Args:
+            thread_id: LangGraph thread ID.
+            checkpoint_ns: Checkpoint namespace.
+
+        Returns:
+            Redis key of the list of checkpoint IDs, newest first.
+        """
+        return (
+            f"{CHECKPOINT_RECENT_PREFIX}:{to_storage_safe_id(thread_id)}:"
+            f"{to_storage_safe_str(checkpoint_ns)}"
+        )
+
+    def _pruned_keys(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_ids: list[Any],
+    ) -> tuple[list[str], list[str]]:
+        """Keys of checkpoints dropped by keep_last.
+
+        Args:
+            thread_id: LangGraph thread ID.
+            checkpoint_ns: Checkpoint namespace.
+            checkpoint_ids: Dropped checkpoint IDs.
+
+        Returns:
+            Checkpoint document keys, and their write key registries (whose
+            members are the pending write keys).
+        """
+        checkpoint_ids = [safely_decode(c) for c in checkpoint_ids]
+        document_keys = [
+            self._make_redis_checkpoint_key(thread_id, checkpoint_ns, c)
+            for c in checkpoint_ids
+        ]
+        registry_keys = [
+            CheckpointKeyRegistry.make_write_keys_zset_key(thread_id, checkpoint_ns, c)
+            for c in checkpoint_ids
+        ]
+        return document_keys, registry_keys
+
+    def _tracked_ttl_seconds(self) -> Optional[int]:
+        """TTL for the tracked key set, matching the checkpoint TTL."""
+        if self.ttl_config and "default_ttl" in self.ttl_config:
+            return int(self.ttl_config["default_ttl"] * 60)
+        return None
+
+    def _refresh_on_read(self) -> bool:
+        """Whether reads refresh the checkpoint TTL."""
+        return bool(self.ttl_config and self.ttl_config.get("refresh_on_read"))
+
+
+class TrackedRedisSaver(_KeyTrackingMixin, RedisSaver):
+    """RedisSaver that records every key it writes in a per-thread set.
+
+    Cleanup can then read the set with SMEMBERS and UNLINK the keys directly
+    instead of scanning the keyspace for the thread's checkpoint history.
+    When a ``ttl`` config is given, the tracked set expires with the keys.
+    """
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint and track its keys.
+
+        Args:
+            config: Runnable config with thread_id and checkpoint_ns.
+            checkpoint: Checkpoint to store.
+            metadata: Checkpoint metadata.
+            new_versions: New channel versions.
+
+        Returns:
+            Config pointing at the stored checkpoint.
+        """
+        checkpoint, shared = self._share_channels(config, checkpoint)
+        if shared:
+            # Written before the checkpoint that references them
+            self._track_keys(config["configurable"]["thread_id"], [], values=shared)
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        self._track_keys(
+            next_config["configurable"]["thread_id"],
+            self._checkpoint_keys(next_config),
+        )
+        if self._keep_last:
+            self._prune_checkpoints(next_config)
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes and track their keys.
+
+        Args:
+            config: Runnable config of the parent checkpoint.
+            writes: (channel, value) pairs.
+            task_id: Task that produced the writes.
+            task_path: Task path.
+        """
+        super().put_writes(config, writes, task_id, task_path)
+        self._track_keys(
+            config["configurable"]["thread_id"],
+            self._write_keys(config, writes, task_id),
+        )
+
+    def _track_keys(
+        self,
+        thread_id: str,
+        keys: list[str],
+        values: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Add keys to the thread's tracked key set.
+
+        Args:
+            thread_id: LangGraph thread ID.
+            keys: Keys written for the thread.
+            values: Keys to write and track in the same round trip.
+        """
+        keys = keys + list(values or {})
+        if not keys:
+            return
+        tracked_key = tracked_keys_key(thread_id)
+        ttl_seconds = self._tracked_ttl_seconds()
+        with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in (values or {}).items():
+                pipe.set(key, value, ex=ttl_seconds)
+            pipe.sadd(tracked_key, *keys)
+            if ttl_seconds:
+                pipe.expire(tracked_key, ttl_seconds)
+            pipe.execute()
+
+    def _prune_checkpoints(self, next_config: RunnableConfig) -> None:
+        """Unlink checkpoints older than the newest keep_last.
+
+        Args:
+            next_config: Config returned by put.
+        """
+        configurable = next_config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable["checkpoint_ns"]
+        recent_key = self._recent_checkpoints_key(thread_id, checkpoint_ns)
+        ttl_seconds = self._tracked_ttl_seconds()
+
+        with self._redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(recent_key, configurable["checkpoint_id"])
+            pipe.lrange(recent_key, self._keep_last, -1)
+            pipe.ltrim(recent_key, 0, self._keep_last - 1)
+            if ttl_seconds:
+                pipe.expire(recent_key, ttl_seconds)
+            stale_ids = pipe.execute()[1]
+        if not stale_ids:
+            return
+
+        document_keys, registry_keys = self._pruned_keys(
+            thread_id, checkpoint_ns, stale_ids
+        )
+        with self._redis.pipeline(transaction=False) as pipe:
+            for registry_key in registry_keys:
+                pipe.zrange(registry_key, 0, -1)
+            write_keys = [k for keys in pipe.execute() for k in keys]
+
+        keys = document_keys + registry_keys + write_keys
+        with self._redis.pipeline(transaction=False) as pipe:
+            pipe.unlink(*keys)
+            pipe.srem(tracked_keys_key(thread_id), *keys)
+            pipe.execute()
+        logger.debug(f"Pruned {len(stale_ids)} checkpoints of thread {thread_id}")
+
+    def _resolve_shared(
+        self,
+        checkpoint_tuple: Optional[CheckpointTuple],
+    ) -> Optional[CheckpointTuple]:
+        """Load shared values referenced by a checkpoint.
+
+        Args:
+            checkpoint_tuple: Loaded checkpoint tuple.
+
+        Returns:
+            The checkpoint tuple with shared values in place.
+        """
+        refs = self._shared_refs(checkpoint_tuple)
+        if not refs:
+            return checkpoint_tuple
+        ttl_seconds = self._tracked_ttl_seconds()
+        with self._redis.pipeline(transaction=False) as pipe:
+            for key in refs.values():
+                if ttl_seconds and self._refresh_on_read():
+                    pipe.getex(key, ex=ttl_seconds)
+                else:
+                    pipe.get(key)
+            stored = pipe.execute()
+        return self._apply_shared(checkpoint_tuple, refs, stored)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get a checkpoint tuple with shared values resolved.
+
+        Args:
+            config: Runnable config with thread_id and optional checkpoint_id.
+
+        Returns:
+            Checkpoint tuple, or None if not found.
+        """
+        return self._resolve_shared(super().get_tuple(config))
+
+    def list(self, *args: Any, **kwargs: Any) -> Iterator[CheckpointTuple]:
+        """List checkpoint tuples with shared values resolved.
+
+        Args:
+            *args: Passed through to RedisSaver.list.
+            **kwargs: Passed through to RedisSaver.list.
+
+        Yields:
+            Checkpoint tuples, newest first.
+        """
+        for checkpoint_tuple in super().list(*args, **kwargs):
+            yield self._resolve_shared(checkpoint_tuple)
+
+
+class TrackedAsyncRedisSaver(_KeyTrackingMixin, AsyncRedisSaver):
+    """AsyncRedisSaver that records every key it writes in a per-thread set.
+
+    Same tracked key sets as ``TrackedRedisSaver``, so cleanup works the same
+    for threads checkpointed by either saver. Must be created inside a
+    running event loop and set up with ``await saver.asetup()``.
+    """
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+        *args: Any,
+        **kwargs: Any,
+    ) -> RunnableConfig:
+        """Store a checkpoint and track its keys.
+
+        Args:
+            config: Runnable config with thread_id and checkpoint_ns.
+            checkpoint: Checkpoint to store.
+            metadata: Checkpoint metadata.
+            new_versions: New channel versions.
+            *args: Passed through to AsyncRedisSaver.aput.
+            **kwargs: Passed through to AsyncRedisSaver.aput.
+
+        Returns:
+            Config pointing at the stored checkpoint.
+        """
+        checkpoint, shared = self._share_channels(config, checkpoint)
+        if shared:
+            # Written before the checkpoint that references them
+            await self._atrack_keys(
+                config["configurable"]["thread_id"], [], values=shared
+            )
+        next_config = await super().aput(
+            config, checkpoint, metadata, new_versions, *args, **kwargs
+        )
+        await self._atrack_keys(
+            next_config["configurable"]["thread_id"],
+            self._checkpoint_keys(next_config),
+        )
+        if self._keep_last:
+            await self._aprune_checkpoints(next_config)
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes and track their keys.
+
+        Args:
+            config: Runnable config of the parent checkpoint.
+            writes: (channel, value) pairs.
+            task_id: Task that produced the writes.
+            task_path: Task path.
+        """
+        await super().aput_writes(config, writes, task_id, task_path)
+        await self._atrack_keys(
+            config["configurable"]["thread_id"],
+            self._write_keys(config, writes, task_id),
+        )
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get a checkpoint tuple with shared values resolved.
+
+        Args:
+            config: Runnable config with thread_id and optional checkpoint_id.
+
+        Returns:
+            Checkpoint tuple, or None if not found.
+        """
+        return await self._aresolve_shared(await super().aget_tuple(config))
+
+    async def alist(self, *args: Any, **kwargs: Any) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoint tuples with shared values resolved.
+
+        Args:
+            *args: Passed through to AsyncRedisSaver.alist.
+            **kwargs: Passed through to AsyncRedisSaver.alist.
+
+        Yields:
+            Checkpoint tuples, newest first.
+        """
+        async for checkpoint_tuple in super().alist(*args, **kwargs):
+            yield await self._aresolve_shared(checkpoint_tuple)
+
+    async def _atrack_keys(
+        self,
+        thread_id: str,
+        keys: list[str],
+        values: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Add keys to the thread's tracked key set.
+
+        Args:
+            thread_id: LangGraph thread ID.
+            keys: Keys written for the thread.
+            values: Keys to write and track in the same round trip.
+        """
+        keys = keys + list(values or {})
+        if not keys:
+            return
+        tracked_key = tracked_keys_key(thread_id)
+        ttl_seconds = self._tracked_ttl_seconds()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in (values or {}).items():
+                pipe.set(key, value, ex=ttl_seconds)
+            pipe.sadd(tracked_key, *keys)
+            if ttl_seconds:
+                pipe.expire(tracked_key, ttl_seconds)
+            await pipe.execute()
+
+    async def _aprune_checkpoints(self, next_config: RunnableConfig) -> None:
+        """Unlink checkpoints older than the newest keep_last.
+
+        Args:
+            next_config: Config returned by aput.
+        """
+        configurable = next_config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable["checkpoint_ns"]
+        recent_key = self._recent_checkpoints_key(thread_id, checkpoint_ns)
+        ttl_seconds = self._tracked_ttl_seconds()
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(recent_key, configurable["checkpoint_id"])
+            pipe.lrange(recent_key, self._keep_last, -1)
+            pipe.ltrim(recent_key, 0, self._keep_last - 1)
+            if ttl_seconds:
+                pipe.expire(recent_key, ttl_seconds)
+            stale_ids = (await pipe.execute())[1]
+        if not stale_ids:
+            return
+
+        document_keys, registry_keys = self._pruned_keys(
+            thread_id, checkpoint_ns, stale_ids
+        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for registry_key in registry_keys:
+                pipe.zrange(registry_key, 0, -1)
+            write_keys = [k for keys in await pipe.execute() for k in keys]
+
+        keys = document_keys + registry_keys + write_keys
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.unlink(*keys)
+            pipe.srem(tracked_keys_key(thread_id), *keys)
+            await pipe.execute()
+        logger.debug(f"Pruned {len(stale_ids)} checkpoints of thread {thread_id}")
+
+    async def _aresolve_shared(
+        self,
+        checkpoint_tuple: Optional[CheckpointTuple],
+    ) -> Optional[CheckpointTuple]:
+        """Load shared values referenced by a checkpoint.
+
+        Args:
+            checkpoint_tuple: Loaded checkpoint tuple.
+
+        Returns:
+            The checkpoint tuple with shared values in place.
+        """
+        refs = self._shared_refs(checkpoint_tuple)
+        if not refs:
+            return checkpoint_tuple
+        ttl_seconds = self._tracked_ttl_seconds()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in refs.values():
+                if ttl_seconds and self._refresh_on_read():
+                    pipe.getex(key, ex=ttl_seconds)
+                else:
+                    pipe.get(key)
+            stored = await pipe.execute()
+        return self._apply_shared(checkpoint_tuple, refs, stored)
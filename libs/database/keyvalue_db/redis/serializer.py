@@ -0,0 +1,132 @@
+"""Compact serializer for LangGraph Redis checkpoints."""
+
+import base64
+import threading
+from typing import Any, Dict, Union
+
+import zstandard
+from langgraph.checkpoint.redis.jsonplus_redis import JsonPlusRedisSerializer
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Type tag for zstd-compressed msgpack, base64 encoded
+COMPACT_TYPE = "zmsgpack"
+
+
+class CompactRedisSerializer(JsonPlusRedisSerializer):
+    """msgpack + zstd serializer for checkpoint values and pending writes.
+
+    RedisSaver stores checkpoints as RedisJSON documents, so payloads stay
+    strings: values are packed with LangGraph's msgpack encoding, compressed
+    with zstd and base64 encoded. Packed values below ``min_size`` bytes are
+    written as plain JSON, where compression does not pay off. Anything
+    written by the stock ``JsonPlusRedisSerializer`` still loads, and with
+    ``enabled=False`` nothing is compressed but compact data still loads.
+
+    Attributes:
+        enabled: Compress values on write.
+        level: zstd compression level.
+        min_size: Smallest packed size, in bytes, that is compressed.
+        log_every: Log ``stats()`` after every this many compressed values
+            (0 disables).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        level: int = 3,
+        min_size: int = 256,
+        log_every: int = 0,
+        **kwargs
+    ):
+        """Initialize compact serializer.
+
+        Args:
+            enabled: Compress values on write.
+            level: zstd compression level (1-22).
+            min_size: Smallest packed size, in bytes, that is compressed.
+            log_every: Log ``stats()`` at INFO after every this many
+                compressed values (0 disables).
+            **kwargs: Passed to JsonPlusSerializer.
+        """
+        super().__init__(**kwargs)
+        self.enabled = enabled
+        self.level = level
+        self.min_size = min_size
+        self.log_every = log_every
+        self._lock = threading.Lock()
+        self._stats = {"values": 0, "raw_bytes": 0, "stored_bytes": 0}
+
+    def dumps_typed(self, obj: Any) -> tuple[str, str]:
+        """Serialize a value, compressing it when large enough.
+
+        Args:
+            obj: Value to serialize.
+
+        Returns:
+            (type, data) pair with string data.
+        """
+        if not self.enabled or obj is None or isinstance(obj, (bytes, bytearray)):
+            return super().dumps_typed(obj)
+
+        type_, packed = JsonPlusSerializer.dumps_typed(self, obj)
+        if type_ != "msgpack" or len(packed) < self.min_size:
+            return super().dumps_typed(obj)
+
+        data = base64.b64encode(zstandard.compress(packed, self.level)).decode("ascii")
+        self._record(len(packed), len(data))
+        return COMPACT_TYPE, data
+
+    def loads_typed(self, data: tuple[str, Union[str, bytes]]) -> Any:
+        """Deserialize a (type, data) pair.
+
+        Args:
+            data: Pair produced by dumps_typed or the stock serializer.
+
+        Returns:
+            Deserialized value.
+        """
+        type_, data_ = data
+        if type_ == COMPACT_TYPE:
+            packed = zstandard.decompress(base64.b64decode(data_))
+            return JsonPlusSerializer.loads_typed(self, ("msgpack", packed))
+        return super().loads_typed(data)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Size counters for values compressed since startup.
+
+        Returns:
+            Dict with ``values``, ``raw_bytes`` (packed msgpack size),
+            ``stored_bytes`` (compressed, base64 size) and ``ratio``.
+        """
+        with self._lock:
+            stats: Dict[str, Union[int, float]] = dict(self._stats)
+        stats["ratio"] = (
+            round(stats["stored_bytes"] / stats["raw_bytes"], 3)
+            if stats["raw_bytes"] else 1.0
+        )
+        return stats
+
+    def _record(self, raw_bytes: int, stored_bytes: int) -> None:
+        """Add one compressed value to the size counters.
+
+        Args:
+            raw_bytes: Packed size before compression.
+            stored_bytes: Stored size after compression and base64.
+        """
+        with self._lock:
+            self._stats["values"] += 1
+            self._stats["raw_bytes"] += raw_bytes
+            self._stats["stored_bytes"] += stored_bytes
+            values = self._stats["values"]
+        logger.debug(f"Compacted checkpoint value: {raw_bytes} -> {stored_bytes} bytes")
+        if self.log_every and values % self.log_every == 0:
+            stats = self.stats()
+            logger.info(
+                f"Checkpoint compaction: {stats['values']} values, "
+                f"{stats['raw_bytes']} -> {stats['stored_bytes']} bytes "
+                f"(ratio {stats['ratio']})"
+            )
@@ -8,6 +8,7 @@ class KeyValueClientSelector(BaseToolSelector):
 
     Available providers:
         - redis: Redis key-value store
+        - redis_async: Redis key-value store on redis.asyncio (awaitable methods)
 
     Example:
         >>> from libs.database.keyvalue_db.selector import KeyValueClientSelector
@@ -20,4 +21,5 @@ class KeyValueClientSelector(BaseToolSelector):
 
     _PROVIDERS = {
         "redis": "libs.database.keyvalue_db.redis.main.RedisClient",
+        "redis_async": "libs.database.keyvalue_db.redis.async_main.AsyncRedisClient",
     }
@@ -4,6 +4,31 @@ from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 
+def expand_values(query: str, rows: list[tuple]) -> tuple[str, list]:
+    """Expand a ``VALUES %s`` placeholder into one placeholder group per row.
+
+    Example:
+        >>> expand_values("INSERT INTO t (a, b) VALUES %s", [(1, 2), (3, 4)])
+        ('INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)', [1, 2, 3, 4])
+
+    Args:
+        query: SQL query with a single ``VALUES %s`` placeholder
+        rows: Non-empty list of equally sized row tuples
+
+    Returns:
+        Tuple of (expanded query, flattened parameters)
+
+    Raises:
+        ValueError: If the query has no ``VALUES %s`` placeholder
+    """
+    head, marker, tail = query.partition("VALUES %s")
+    if not marker:
+        raise ValueError("query must contain a single 'VALUES %s' placeholder")
+    row = "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+    params = [value for values in rows for value in values]
+    return f"{head}VALUES {', '.join([row] * len(rows))}{tail}", params
+
+
 class BaseSQLClient(ABC):
     """Abstract base class for SQL database clients.
 
@@ -93,3 +118,137 @@ class BaseSQLClient(ABC):
             Exception: If execution fails
         """
         pass
+
+    @abstractmethod
+    def execute_values(
+        self,
+        query: str,
+        params_list: list[tuple],
+        page_size: int = 1000,
+    ) -> int:
+        """Insert many rows with multi-row VALUES statements.
+
+        Args:
+            query: SQL query with a single ``VALUES %s`` placeholder
+            params_list: List of row tuples
+            page_size: Rows per statement
+
+        Returns:
+            Number of rows affected
+
+        Raises:
+            Exception: If execution fails
+        """
+        pass
+
+
+class BaseAsyncSQLClient(ABC):
+    """Abstract base class for asyncio SQL database clients.
+
+    Same operations as ``BaseSQLClient``, each awaitable, so code typed
+    against either base knows whether it gets results or coroutines.
+    """
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Establish database connection.
+
+        Raises:
+            Exception: If connection fails
+        """
+        pass
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        """Close database connection.
+
+        Raises:
+            Exception: If disconnection fails
+        """
+        pass
+
+    @abstractmethod
+    async def execute(self, query: str, params: tuple = None) -> Any:
+        """Execute a SQL query.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params: Query parameters
+
+        Returns:
+            Execution result
+
+        Raises:
+            Exception: If execution fails
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_one(self, query: str, params: tuple = None) -> Optional[dict]:
+        """Fetch a single row as dictionary.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params: Query parameters
+
+        Returns:
+            Row as dictionary or None if no results
+
+        Raises:
+            Exception: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_all(self, query: str, params: tuple = None) -> list[dict]:
+        """Fetch all rows as list of dictionaries.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params: Query parameters
+
+        Returns:
+            List of rows as dictionaries
+
+        Raises:
+            Exception: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def execute_many(self, query: str, params_list: list[tuple]) -> int:
+        """Execute a query with multiple parameter sets.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params_list: List of parameter tuples
+
+        Returns:
+            Number of rows affected
+
+        Raises:
+            Exception: If execution fails
+        """
+        pass
+
+    @abstractmethod
+    async def execute_values(
+        self,
+        query: str,
+        params_list: list[tuple],
+        page_size: int = 1000,
+    ) -> int:
+        """Insert many rows with multi-row VALUES statements.
+
+        Args:
+            query: SQL query with a single ``VALUES %s`` placeholder
+            params_list: List of row tuples
+            page_size: Rows per statement
+
+        Returns:
+            Number of rows affected
+
+        Raises:
+            Exception: If execution fails
+        """
+        pass
@@ -0,0 +1,144 @@
+"""Versioned SQL schema migrations.
+
+Applies ``NNNN_description.sql`` files in order and records each applied
+version in a ``schema_migrations`` table.
+"""
+
+import re
+from pathlib import Path
+from typing import Union
+
+from libs.database.tabular.sql.base import BaseSQLClient
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version VARCHAR(255) PRIMARY KEY,
+        applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+"""
+
+# First-line marker for migrations that cannot run in a transaction
+# (e.g. CREATE INDEX CONCURRENTLY)
+NO_TRANSACTION_MARKER = "-- migrate:no-transaction"
+
+MIGRATION_FILE_PATTERN = re.compile(r"^\d+_[\w-]+\.sql$")
+
+
+class MigrationRunner:
+    """Apply pending SQL migrations from a directory.
+
+    Each migration runs in its own transaction together with its
+    ``schema_migrations`` row, so a failed migration leaves nothing behind
+    and is retried on the next run. Files starting with
+    ``-- migrate:no-transaction`` run statement by statement in autocommit
+    mode instead and must be idempotent (``IF NOT EXISTS``).
+
+    Run migrations from one process at a time (e.g. a deploy step).
+
+    Attributes:
+        db_client: SQL client with ``transaction()`` (autocommit mode).
+        directory: Directory holding the migration files.
+    """
+
+    def __init__(self, db_client: BaseSQLClient, directory: Union[str, Path]):
+        """Initialize migration runner.
+
+        Args:
+            db_client: SQL client with ``transaction()`` (autocommit mode).
+            directory: Directory holding ``NNNN_description.sql`` files.
+        """
+        self.db_client = db_client
+        self.directory = Path(directory)
+
+    def applied(self) -> set[str]:
+        """Versions already applied.
+
+        Returns:
+            Set of applied versions (file names without ``.sql``).
+        """
+        self.db_client.execute(MIGRATIONS_TABLE_SQL)
+        rows = self.db_client.fetch_all("SELECT version FROM schema_migrations")
+        return {row["version"] for row in rows}
+
+    def pending(self) -> list[Path]:
+        """Migration files not yet applied, in version order.
+
+        Returns:
+            List of migration file paths.
+        """
+        applied = self.applied()
+        return [path for path in self._files() if path.stem not in applied]
+
+    def migrate(self) -> list[str]:
+        """Apply all pending migrations.
+
+        Returns:
+            Versions applied by this run.
+
+        Raises:
+            Exception: If a migration fails; later ones are not attempted
+        """
+        done = []
+        for path in self.pending():
+            sql = path.read_text()
+            logger.info(f"Applying migration {path.stem}")
+            if sql.lstrip().startswith(NO_TRANSACTION_MARKER):
+                for statement in self._statements(sql):
+                    self.db_client.execute(statement)
+                self._record(self.db_client, path.stem)
+            else:
+                with self.db_client.transaction() as tx:
+                    tx.execute(sql)
+                    self._record(tx, path.stem)
+            done.append(path.stem)
+
+        logger.info(f"Applied {len(done)} migrations" if done else "Schema is up to date")
+        return done
+
+    def _files(self) -> list[Path]:
+        """Migration files sorted by version.
+
+        Returns:
+            List of migration file paths.
+        """
+        files = [
+            path for path in self.directory.iterdir()
+            if MIGRATION_FILE_PATTERN.match(path.name)
+        ]
+        return sorted(files, key=lambda path: int(path.name.split("_", 1)[0]))
+
+    def _statements(self, sql: str) -> list[str]:
+        """Split a no-transaction migration into statements.
+
+        Statements end with ``;`` at the end of a line; comment-only chunks
+        are dropped.
+
+        Args:
+            sql: Migration file contents.
+
+        Returns:
+            List of SQL statements.
+        """
+        statements = []
+        for chunk in re.split(r";\s*$", sql, flags=re.MULTILINE):
+            code = "\n".join(
+                line for line in chunk.splitlines() if not line.strip().startswith("--")
+            ).strip()
+            if code:
+                statements.append(code)
+        return statements
+
+    def _record(self, db_client: BaseSQLClient, version: str) -> None:
+        """Mark a migration as applied.
+
+        Args:
+            db_client: Client (or transaction) to write with.
+            version: Migration version.
+        """
+        db_client.execute(
+            "INSERT INTO schema_migrations (version) VALUES (%s) ON CONFLICT DO NOTHING",
+            (version,),
+        )
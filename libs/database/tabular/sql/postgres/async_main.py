@@ -0,0 +1,378 @@
+"""Asyncio PostgreSQL database client.
+
+Implements SQL operations using psycopg 3 with a psycopg_pool connection pool.
+
+Reference: https://www.psycopg.org/psycopg3/docs/advanced/async.html
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from psycopg import AsyncConnection
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from libs.database.tabular.sql.base import BaseAsyncSQLClient, expand_values
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncPostgresSQLClient(BaseAsyncSQLClient):
+    """Asyncio PostgreSQL database client using psycopg 3.
+
+    Same surface as ``PostgresSQLClient`` with every operation awaitable and
+    the same ``%s`` placeholders, so queries are shared between both clients.
+
+    Features:
+    - Native async connection pool, checked out per operation
+    - Health check on checkout (broken connections are replaced)
+    - Server-side prepared statements for repeated queries
+    - Transactions spanning several operations via ``transaction()``
+    - Dictionary results via ``dict_row``
+
+    Reference: https://www.psycopg.org/psycopg3/docs/
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 5432,
+        database: str = "support_triage",
+        user: str = "postgres",
+        password: str = "postgres",
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_timeout: float = 30.0,
+        max_idle: float = 600.0,
+        prepare_threshold: Optional[int] = 5,
+        prepared_max: int = 100,
+    ):
+        """Initialize async PostgreSQL client.
+
+        The pool is opened on ``connect()`` or first use, inside the running
+        event loop.
+
+        Args:
+            host: Database server host (default: "localhost")
+            port: Database server port (default: 5432)
+            database: Database name (default: "support_triage")
+            user: Database user (default: "postgres")
+            password: Database password (default: "postgres")
+            pool_min_size: Connections kept open (default: 1)
+            pool_max_size: Maximum open connections (default: 10)
+            pool_timeout: Seconds to wait for a free connection (default: 30.0)
+            max_idle: Seconds before idle connections above min size are
+                closed (default: 600.0)
+            prepare_threshold: Executions of a query on a connection before it
+                is prepared server-side (default: 5, None disables)
+            prepared_max: Prepared statements cached per connection
+                (default: 100)
+        """
+        self.host = host
+        self.port = port
+        self.database = database
+        self.user = user
+        self.password = password
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_timeout = pool_timeout
+        self.max_idle = max_idle
+        self.prepare_threshold = prepare_threshold
+        self.prepared_max = prepared_max
+        self._pool: Optional[AsyncConnectionPool] = None
+        self._pool_lock: Optional[asyncio.Lock] = None
+
+        logger.info(
+            f"Async PostgreSQL client initialized (host={host}:{port}, "
+            f"database={database})"
+        )
+
+    async def connect(self) -> None:
+        """Open the connection pool.
+
+        Raises:
+            Exception: If the pool cannot be opened
+        """
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if self._pool is not None:
+                return
+            try:
+                pool = AsyncConnectionPool(
+                    conninfo="",
+                    kwargs={
+                        "host": self.host,
+                        "port": self.port,
+                        "dbname": self.database,
+                        "user": self.user,
+                        "password": self.password,
+                        "autocommit": True,
+                        "row_factory": dict_row,
+                        "prepare_threshold": self.prepare_threshold,
+                    },
+                    min_size=self.pool_min_size,
+                    max_size=self.pool_max_size,
+                    timeout=self.pool_timeout,
+                    max_idle=self.max_idle,
+                    configure=self._configure,
+                    check=AsyncConnectionPool.check_connection,
+                    open=False,
+                )
+                await pool.open()
+                self._pool = pool
+                logger.info(
+                    f"Opened async PostgreSQL pool for '{self.database}' "
+                    f"(min={self.pool_min_size}, max={self.pool_max_size})"
+                )
+            except Exception as e:
+                logger.error(f"Failed to open async PostgreSQL pool: {e}", exc_info=True)
+                raise
+
+    async def disconnect(self) -> None:
+        """Close the connection pool.
+
+        Raises:
+            Exception: If closing fails
+        """
+        try:
+            if self._pool is not None:
+                await self._pool.close()
+                self._pool = None
+                logger.info("Closed async PostgreSQL pool")
+
+        except Exception as e:
+            logger.error(f"Failed to close async PostgreSQL pool: {e}", exc_info=True)
+            raise
+
+    async def execute(self, query: str, params: tuple = None) -> int:
+        """Execute a SQL query.
+
+        Unlike the sync client, the connection is back in the pool when this
+        returns, so the row count is returned instead of a cursor; use
+        ``fetch_one`` / ``fetch_all`` for results.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params: Query parameters
+
+        Returns:
+            Number of rows affected
+
+        Raises:
+            Exception: If execution fails
+        """
+        try:
+            async with self._connection() as conn:
+                cursor = await conn.execute(query, params)
+                return cursor.rowcount
+
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}", exc_info=True)
+            raise
+
+    async def fetch_one(self, query: str, params: tuple = None) -> Optional[dict]:
+        """Fetch a single row as dictionary.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params: Query parameters
+
+        Returns:
+            Row as dictionary or None if no results
+
+        Raises:
+            Exception: If query fails
+        """
+        try:
+            async with self._connection() as conn:
+                cursor = await conn.execute(query, params)
+                return await cursor.fetchone()
+
+        except Exception as e:
+            logger.error(f"Fetch one failed: {e}", exc_info=True)
+            raise
+
+    async def fetch_all(self, query: str, params: tuple = None) -> list[dict]:
+        """Fetch all rows as list of dictionaries.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params: Query parameters
+
+        Returns:
+            List of rows as dictionaries
+
+        Raises:
+            Exception: If query fails
+        """
+        try:
+            async with self._connection() as conn:
+                cursor = await conn.execute(query, params)
+                return await cursor.fetchall()
+
+        except Exception as e:
+            logger.error(f"Fetch all failed: {e}", exc_info=True)
+            raise
+
+    async def execute_many(self, query: str, params_list: list[tuple]) -> int:
+        """Execute a query with multiple parameter sets.
+
+        psycopg 3 pipelines the statements in a single round trip.
+
+        Args:
+            query: SQL query string with %s placeholders
+            params_list: List of parameter tuples
+
+        Returns:
+            Number of rows affected
+
+        Raises:
+            Exception: If execution fails
+        """
+        try:
+            async with self._connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(query, params_list)
+                    rowcount = cursor.rowcount
+
+            logger.info(f"Executed batch query, {rowcount} rows affected")
+            return rowcount
+
+        except Exception as e:
+            logger.error(f"Batch execution failed: {e}", exc_info=True)
+            raise
+
+    async def execute_values(
+        self,
+        query: str,
+        params_list: list[tuple],
+        page_size: int = 1000,
+    ) -> int:
+        """Insert many rows with multi-row VALUES statements.
+
+        Same contract as ``psycopg2.extras.execute_values``: ``VALUES %s`` is
+        expanded to one row placeholder per tuple, ``page_size`` rows per
+        statement.
+
+        Args:
+            query: SQL query with a single ``VALUES %s`` placeholder
+            params_list: List of row tuples
+            page_size: Rows per statement
+
+        Returns:
+            Number of rows affected
+
+        Raises:
+            Exception: If execution fails
+        """
+        if not params_list:
+            return 0
+
+        try:
+            rowcount = 0
+            async with self._connection() as conn:
+                for start in range(0, len(params_list), page_size):
+                    page_query, params = expand_values(
+                        query, params_list[start:start + page_size]
+                    )
+                    cursor = await conn.execute(page_query, params, prepare=False)
+                    rowcount += cursor.rowcount
+
+            logger.info(f"Executed multi-row insert, {len(params_list)} rows")
+            return rowcount
+
+        except Exception as e:
+            logger.error(f"Multi-row insert failed: {e}", exc_info=True)
+            raise
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["AsyncPostgresTransaction"]:
+        """Run several operations in one transaction.
+
+        Example:
+            >>> async with client.transaction() as tx:
+            ...     await tx.execute("INSERT INTO tickets ...", (...))
+            ...     await tx.execute_many("INSERT INTO chat_messages ...", rows)
+
+        Commits when the block exits, rolls back if it raises. Nested
+        ``transaction()`` calls on the yielded client use savepoints.
+
+        Yields:
+            AsyncPostgresTransaction bound to one pooled connection
+        """
+        async with self._connection() as conn:
+            async with conn.transaction():
+                yield AsyncPostgresTransaction(conn)
+
+    def pool_stats(self) -> dict:
+        """Connection pool metrics.
+
+        Returns:
+            psycopg_pool statistics (``pool_size``, ``pool_available``,
+            ``requests_waiting``, ``requests_wait_ms``, ``connections_errors``
+            ...), empty before the pool is opened.
+        """
+        return self._pool.get_stats() if self._pool is not None else {}
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[AsyncConnection]:
+        """Check out a pooled connection, opening the pool on first use.
+
+        Yields:
+            psycopg async connection
+        """
+        if self._pool is None:
+            await self.connect()
+        async with self._pool.connection() as conn:
+            yield conn
+
+    async def _configure(self, conn: AsyncConnection) -> None:
+        """Set up a new pooled connection.
+
+        Args:
+            conn: Newly opened connection.
+        """
+        conn.prepared_max = self.prepared_max
+
+
+class AsyncPostgresTransaction(AsyncPostgresSQLClient):
+    """AsyncPostgresSQLClient operations bound to one transaction.
+
+    Created by ``AsyncPostgresSQLClient.transaction()``. Every operation runs
+    on the transaction's connection; the transaction ends with the context.
+
+    Attributes:
+        conn: Connection holding the transaction.
+    """
+
+    def __init__(self, conn: AsyncConnection):
+        """Wrap a connection inside an open transaction.
+
+        Args:
+            conn: Connection holding the transaction.
+        """
+        self.conn = conn
+
+    async def connect(self) -> None:
+        """The connection belongs to the enclosing client's pool."""
+
+    async def disconnect(self) -> None:
+        """The connection is returned when the transaction ends."""
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["AsyncPostgresTransaction"]:
+        """Nested transactions use a savepoint on the same connection."""
+        async with self.conn.transaction():
+            yield self
+
+    def pool_stats(self) -> dict:
+        """Pool metrics are reported by the enclosing client."""
+        return {}
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[AsyncConnection]:
+        """Yield the transaction's connection."""
+        yield self.conn
@@ -5,10 +5,15 @@ Implements SQL operations using psycopg2.
 Reference: https://www.psycopg.org/docs/
 """
 
-from typing import Any, Optional
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Iterator, Optional
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import TRANSACTION_STATUS_UNKNOWN
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 
 from libs.database.tabular.sql.base import BaseSQLClient
 from libs.logger.logger import get_logger
@@ -23,9 +28,13 @@ class PostgresSQLClient(BaseSQLClient):
     dictionary-based results using RealDictCursor.
 
     Features:
-    - Connection pooling (optional)
+    - Connection pooling (optional): with ``pool=True`` every operation
+      checks a connection out of a ``ThreadedConnectionPool`` and returns it
+      afterwards, so concurrent request threads never share a connection.
+      Without it a single lazily created connection is shared, one
+      operation or transaction at a time.
     - Dictionary results via RealDictCursor
-    - Transaction support
+    - Transactions spanning several operations via ``transaction()``
     - Parameterized queries for SQL injection prevention
 
     Reference: https://www.psycopg.org/docs/
@@ -39,6 +48,11 @@ class PostgresSQLClient(BaseSQLClient):
         user: str = "postgres",
         password: str = "postgres",
         autocommit: bool = True,
+        pool: bool = False,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_timeout: float = 30.0,
+        health_check_interval: int = 30,
     ):
         """Initialize PostgreSQL client.
 
@@ -49,6 +63,13 @@ class PostgresSQLClient(BaseSQLClient):
             user: Database user (default: "postgres")
             password: Database password (default: "postgres")
             autocommit: Enable autocommit mode (default: True)
+            pool: Check out a pooled connection per operation (default: False)
+            pool_min_size: Connections opened up front (default: 1)
+            pool_max_size: Maximum open connections (default: 10)
+            pool_timeout: Seconds to wait for a free connection (default: 30.0)
+            health_check_interval: Seconds a pooled connection may sit idle
+                before it is checked with ``SELECT 1`` on checkout
+                (default: 30, 0 checks every checkout)
 
         Note:
             For Docker Compose, use host="postgres" to connect to the service
@@ -61,9 +82,29 @@ class PostgresSQLClient(BaseSQLClient):
         self.autocommit = autocommit
         self._conn = None
 
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_timeout = pool_timeout
+        self.health_check_interval = health_check_interval
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_enabled = pool
+        self._pool_lock = threading.Lock()
+        # Without a pool, operations and transactions take turns on self._conn
+        self._shared_lock = threading.RLock()
+        # ThreadedConnectionPool raises when exhausted; callers wait here instead
+        self._pool_slots = threading.BoundedSemaphore(pool_max_size)
+        self._last_used: dict[int, float] = {}
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0,
+            "health_check_failures": 0,
+        }
+
         logger.info(
             f"PostgreSQL client initialized (host={host}:{port}, "
-            f"database={database})"
+            f"database={database}, pool={pool})"
         )
 
     @property
@@ -74,11 +115,14 @@ class PostgresSQLClient(BaseSQLClient):
         return self._conn
 
     def connect(self) -> None:
-        """Establish database connection.
+        """Establish database connection, or open the pool in pool mode.
 
         Raises:
             Exception: If connection fails
         """
+        if self._pool_enabled:
+            self._open_pool()
+            return
         try:
             self._conn = psycopg2.connect(
                 host=self.host,
@@ -101,6 +145,12 @@ class PostgresSQLClient(BaseSQLClient):
             Exception: If disconnection fails
         """
         try:
+            with self._pool_lock:
+                if self._pool and not self._pool.closed:
+                    self._pool.closeall()
+                    logger.info("Closed PostgreSQL connection pool")
+                self._pool = None
+                self._last_used.clear()
             if self._conn and not self._conn.closed:
                 self._conn.close()
                 logger.info("Disconnected from PostgreSQL")
@@ -109,9 +159,220 @@ class PostgresSQLClient(BaseSQLClient):
             logger.error(f"Failed to disconnect from PostgreSQL: {e}", exc_info=True)
             raise
 
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for one operation.
+
+        In pool mode the connection is checked out of the pool, checked if it
+        sat idle past ``health_check_interval``, and returned afterwards
+        (committed, or rolled back on error, when autocommit is off). Without
+        a pool this yields the shared connection once no other thread is
+        using it.
+
+        Yields:
+            psycopg2 connection
+
+        Raises:
+            PoolError: If no connection frees up within ``pool_timeout``
+        """
+        if not self._pool_enabled:
+            with self._shared_lock:
+                yield self.conn
+            return
+
+        conn = self._checkout()
+        broken = False
+        try:
+            yield conn
+            if not self.autocommit:
+                conn.commit()
+        except Exception:
+            broken = conn.closed != 0
+            if not broken and not self.autocommit:
+                conn.rollback()
+            raise
+        finally:
+            self._checkin(conn, broken)
+
+    @contextmanager
+    def transaction(self) -> Iterator["PostgresTransaction"]:
+        """Run several operations in one transaction.
+
+        Example:
+            >>> with client.transaction() as tx:
+            ...     tx.execute("INSERT INTO tickets ...", (...))
+            ...     tx.execute_values("INSERT INTO chat_messages ... VALUES %s", rows)
+
+        Commits when the block exits, rolls back if it raises. Nested
+        ``transaction()`` calls on the yielded client use savepoints.
+
+        Yields:
+            PostgresTransaction bound to one connection (pooled, or the
+            shared one, held for the whole block)
+
+        Raises:
+            PoolError: If no connection frees up within ``pool_timeout``
+        """
+        pooled = self._pool_enabled
+        with nullcontext() if pooled else self._shared_lock:
+            conn = self._checkout() if pooled else self.conn
+            autocommit = conn.autocommit
+            broken = False
+            try:
+                conn.autocommit = False
+                try:
+                    yield PostgresTransaction(conn)
+                    conn.commit()
+                except Exception:
+                    broken = conn.closed != 0
+                    if not broken:
+                        conn.rollback()
+                    raise
+            finally:
+                if not broken:
+                    conn.autocommit = autocommit
+                if pooled:
+                    self._checkin(conn, broken)
+
+    def pool_stats(self) -> dict:
+        """Connection pool metrics.
+
+        Returns:
+            Dict with pool size limits, ``in_use`` and ``idle`` connections,
+            and counters for checkouts, waits for a free connection (count
+            and total seconds), checkout timeouts and failed health checks.
+            Empty when pooling is disabled.
+        """
+        if not self._pool_enabled:
+            return {}
+        with self._pool_lock:
+            in_use = len(self._pool._used) if self._pool else 0
+            idle = len(self._pool._pool) if self._pool else 0
+            stats = dict(self._stats)
+        return {
+            "min_size": self.pool_min_size,
+            "max_size": self.pool_max_size,
+            "in_use": in_use,
+            "idle": idle,
+            **stats,
+        }
+
+    def _open_pool(self) -> ThreadedConnectionPool:
+        """Create the connection pool if needed.
+
+        Returns:
+            The connection pool.
+        """
+        with self._pool_lock:
+            if self._pool is None or self._pool.closed:
+                try:
+                    self._pool = ThreadedConnectionPool(
+                        self.pool_min_size,
+                        self.pool_max_size,
+                        host=self.host,
+                        port=self.port,
+                        database=self.database,
+                        user=self.user,
+                        password=self.password,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to open PostgreSQL pool: {e}", exc_info=True)
+                    raise
+                logger.info(
+                    f"Opened PostgreSQL pool for '{self.database}' "
+                    f"(min={self.pool_min_size}, max={self.pool_max_size})"
+                )
+            return self._pool
+
+    def _checkout(self) -> Any:
+        """Take a healthy connection from the pool, waiting for a free slot.
+
+        Returns:
+            psycopg2 connection
+
+        Raises:
+            PoolError: If no connection frees up within ``pool_timeout``
+        """
+        started = time.monotonic()
+        if not self._pool_slots.acquire(blocking=False):
+            if not self._pool_slots.acquire(timeout=self.pool_timeout):
+                with self._pool_lock:
+                    self._stats["timeouts"] += 1
+                raise PoolError(
+                    f"No PostgreSQL connection free after {self.pool_timeout}s"
+                )
+            with self._pool_lock:
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += time.monotonic() - started
+
+        try:
+            pool = self._open_pool()
+            conn = pool.getconn()
+            if not self._is_healthy(conn):
+                with self._pool_lock:
+                    self._stats["health_check_failures"] += 1
+                logger.warning("Discarding broken PostgreSQL connection")
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+            conn.autocommit = self.autocommit
+        except Exception:
+            self._pool_slots.release()
+            raise
+
+        with self._pool_lock:
+            self._stats["checkouts"] += 1
+        return conn
+
+    def _checkin(self, conn: Any, broken: bool = False) -> None:
+        """Return a connection to the pool.
+
+        Args:
+            conn: Connection from ``_checkout``.
+            broken: Close the connection instead of keeping it.
+        """
+        try:
+            close = broken or conn.closed != 0
+            if close:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+            if self._pool and not self._pool.closed:
+                self._pool.putconn(conn, close=close)
+        finally:
+            self._pool_slots.release()
+
+    def _is_healthy(self, conn: Any) -> bool:
+        """Check a pooled connection before handing it out.
+
+        Closed or broken connections fail immediately; others are pinged
+        with ``SELECT 1`` if idle longer than ``health_check_interval``.
+
+        Args:
+            conn: Connection taken from the pool.
+
+        Returns:
+            True if the connection is usable.
+        """
+        if conn.closed or conn.get_transaction_status() == TRANSACTION_STATUS_UNKNOWN:
+            return False
+        last_used = self._last_used.get(id(conn))
+        if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if not conn.autocommit:
+                conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
     def execute(self, query: str, params: tuple = None) -> Any:
         """Execute a SQL query.
 
+        In pool mode the connection is returned before this returns, so the
+        cursor holds only the buffered result rows.
+
         Args:
             query: SQL query string with %s placeholders
             params: Query parameters
@@ -123,9 +384,10 @@ class PostgresSQLClient(BaseSQLClient):
             Exception: If execution fails
         """
         try:
-            cursor = self.conn.cursor(cursor_factory=RealDictCursor)
-            cursor.execute(query, params)
-            return cursor
+            with self.connection() as conn:
+                cursor = conn.cursor(cursor_factory=RealDictCursor)
+                cursor.execute(query, params)
+                return cursor
 
         except Exception as e:
             logger.error(f"Query execution failed: {e}", exc_info=True)
@@ -195,10 +457,11 @@ class PostgresSQLClient(BaseSQLClient):
             Exception: If execution fails
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.executemany(query, params_list)
-            rowcount = cursor.rowcount
-            cursor.close()
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(query, params_list)
+                rowcount = cursor.rowcount
+                cursor.close()
 
             logger.info(f"Executed batch query, {rowcount} rows affected")
             return rowcount
@@ -207,13 +470,55 @@ class PostgresSQLClient(BaseSQLClient):
             logger.error(f"Batch execution failed: {e}", exc_info=True)
             raise
 
+    def execute_values(
+        self,
+        query: str,
+        params_list: list[tuple],
+        page_size: int = 1000,
+    ) -> int:
+        """Insert many rows with multi-row VALUES statements.
+
+        Uses ``psycopg2.extras.execute_values``: one statement (one round
+        trip) per ``page_size`` rows instead of one per row.
+
+        Args:
+            query: SQL query with a single ``VALUES %s`` placeholder
+            params_list: List of row tuples
+            page_size: Rows per statement
+
+        Returns:
+            Number of rows affected
+
+        Raises:
+            Exception: If execution fails
+        """
+        if not params_list:
+            return 0
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                execute_values(cursor, query, params_list, page_size=page_size)
+                rowcount = cursor.rowcount
+                cursor.close()
+
+            logger.info(f"Executed multi-row insert, {len(params_list)} rows")
+            return rowcount
+
+        except Exception as e:
+            logger.error(f"Multi-row insert failed: {e}", exc_info=True)
+            raise
+
     def commit(self) -> None:
-        """Commit current transaction."""
+        """Commit current transaction.
+
+        Pool mode commits each operation on check-in, so this applies to the
+        shared connection only.
+        """
         if self._conn and not self._conn.closed:
             self._conn.commit()
 
     def rollback(self) -> None:
-        """Rollback current transaction."""
+        """Rollback current transaction (shared connection only)."""
         if self._conn and not self._conn.closed:
             self._conn.rollback()
 
@@ -225,3 +530,64 @@ class PostgresSQLClient(BaseSQLClient):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.disconnect()
+
+
+class PostgresTransaction(PostgresSQLClient):
+    """PostgresSQLClient operations bound to one transaction.
+
+    Created by ``PostgresSQLClient.transaction()``. Every operation runs on
+    the transaction's connection; the transaction ends with the context.
+
+    Attributes:
+        _conn: Connection holding the transaction.
+    """
+
+    def __init__(self, conn: Any):
+        """Wrap a connection inside an open transaction.
+
+        Args:
+            conn: Connection holding the transaction (autocommit off).
+        """
+        self._conn = conn
+        self._pool_enabled = False
+        self._savepoints = 0
+
+    def connect(self) -> None:
+        """The connection belongs to the enclosing client."""
+
+    def disconnect(self) -> None:
+        """The connection is released when the transaction ends."""
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Yield the transaction's connection."""
+        yield self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator["PostgresTransaction"]:
+        """Nested transactions use a savepoint on the same connection."""
+        self._savepoints += 1
+        name = f"sp_{self._savepoints}"
+        with self._conn.cursor() as cursor:
+            cursor.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except Exception:
+            with self._conn.cursor() as cursor:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        else:
+            with self._conn.cursor() as cursor:
+                cursor.execute(f"RELEASE SAVEPOINT {name}")
+        finally:
+            self._savepoints -= 1
+
+    def pool_stats(self) -> dict:
+        """Pool metrics are reported by the enclosing client."""
+        return {}
+
+    def commit(self) -> None:
+        """The transaction commits when its context exits."""
+
+    def rollback(self) -> None:
+        """The transaction rolls back when its context raises."""
@@ -8,6 +8,7 @@ class SQLClientSelector(BaseToolSelector):
 
     Available providers:
         - postgres: PostgreSQL database
+        - postgres_async: PostgreSQL on psycopg 3 async (awaitable methods)
 
     Example:
         >>> from libs.database.tabular.sql.selector import SQLClientSelector
@@ -21,4 +22,5 @@ class SQLClientSelector(BaseToolSelector):
 
     _PROVIDERS = {
         "postgres": "libs.database.tabular.sql.postgres.main.PostgresSQLClient",
+        "postgres_async": "libs.database.tabular.sql.postgres.async_main.AsyncPostgresSQLClient",
     }
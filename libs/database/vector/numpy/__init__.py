@@ -0,0 +1 @@
+"""In-memory NumPy vector store."""
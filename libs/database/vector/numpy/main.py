@@ -0,0 +1,447 @@
+"""In-memory NumPy vector store.
+
+Implements brute-force vector search over a contiguous float32 matrix.
+Suited to small knowledge bases (a few thousand chunks) and tests, where a
+network hop to a vector database costs more than the search itself.
+
+Reference: https://numpy.org/doc/stable/reference/generated/numpy.argpartition.html
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from libs.database.vector.base import BaseVectorStore
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Collection:
+    """Vectors, ids and payloads of one physical collection.
+
+    Rows are kept contiguous; deletes compact the matrix. Filter masks are
+    cached per (key, value) and dropped on every mutation.
+    """
+
+    def __init__(self, vector_size: int):
+        self.vectors = np.empty((0, vector_size), dtype=np.float32)
+        self.ids: list[str] = []
+        self.payloads: list[dict[str, Any]] = []
+        self.id_to_row: dict[str, int] = {}
+        self.mask_cache: dict[tuple[str, str], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def reindex(self) -> None:
+        """Rebuild id lookup and invalidate cached filter masks."""
+        self.id_to_row = {point_id: row for row, point_id in enumerate(self.ids)}
+        self.mask_cache.clear()
+
+    def mask(self, filter: dict[str, Any] | None) -> np.ndarray | None:
+        """Build boolean row mask for an exact-match metadata filter.
+
+        List payload values match if they contain the filter value, like
+        Qdrant's MatchValue on array fields.
+        """
+        if not filter:
+            return None
+
+        combined = np.ones(len(self), dtype=bool)
+        for key, value in filter.items():
+            cache_key = (key, json.dumps(value, sort_keys=True, default=str))
+            key_mask = self.mask_cache.get(cache_key)
+            if key_mask is None:
+                key_mask = np.fromiter(
+                    (_matches(payload.get(key), value) for payload in self.payloads),
+                    dtype=bool,
+                    count=len(self),
+                )
+                self.mask_cache[cache_key] = key_mask
+            combined &= key_mask
+        return combined
+
+
+def _matches(payload_value: Any, value: Any) -> bool:
+    """Check a single payload field against a filter value."""
+    if isinstance(payload_value, list):
+        return value in payload_value
+    return payload_value == value
+
+
+class VectorStoreClient(BaseVectorStore):
+    """In-memory vector store backed by NumPy.
+
+    Drop-in alternative to the Qdrant client for single-node deployments
+    and tests: same ``add``/``search``/``delete``/``count`` surface and the
+    same blue/green ``create_versioned_collection``/``swap_alias`` flow, so
+    ``KBProcessor`` and ``KBRetrievalTool`` work unchanged.
+
+    Features:
+    - Contiguous float32 matrix with vectorized scoring (cosine, dot, euclid)
+    - Boolean-mask metadata filtering with cached masks
+    - ``np.argpartition`` top-k selection
+    - Optional ``.npy`` persistence, memory-mapped on load
+    """
+
+    def __init__(
+        self,
+        collection_name: str = "documents",
+        vector_size: int = 1536,
+        distance: str = "Cosine",
+        persist_dir: str | None = None,
+        mmap: bool = True,
+        **kwargs,
+    ):
+        """Initialize NumPy vector store.
+
+        Args:
+            collection_name: Collection (alias) name, also used for file names
+            vector_size: Dimension of embedding vectors
+            distance: Distance metric ("Cosine", "Euclid", "Dot")
+            persist_dir: Directory for ``{collection_name}.npy``/``.json`` files.
+                None keeps everything in memory only.
+            mmap: Memory-map the persisted matrix instead of reading it into RAM
+            **kwargs: Ignored connection options (host, port, sparse_model, ...)
+                so configs can switch providers without code changes
+        """
+        if distance not in ("Cosine", "Euclid", "Dot"):
+            raise ValueError(f"Unknown distance '{distance}'")
+
+        self.collection_name = collection_name
+        self.vector_size = vector_size
+        self.distance = distance
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.mmap = mmap
+
+        self._live = _Collection(vector_size)
+        self._staging: dict[str, _Collection] = {}
+
+        if self.persist_dir:
+            self._load()
+
+        if kwargs:
+            logger.debug(f"Ignoring options not used by NumPy store: {sorted(kwargs)}")
+
+        logger.info(
+            f"NumPy vector store initialized (collection={collection_name}, "
+            f"vector_size={vector_size}, points={len(self._live)}, "
+            f"persist_dir={persist_dir})"
+        )
+
+    def _files(self) -> tuple[Path, Path]:
+        """Paths of the persisted matrix and payload files."""
+        return (
+            self.persist_dir / f"{self.collection_name}.npy",
+            self.persist_dir / f"{self.collection_name}.json",
+        )
+
+    def _load(self) -> None:
+        """Load persisted collection if present.
+
+        A matrix of the wrong width can neither be searched nor extended, so
+        it is not loaded: the store starts empty and the files are replaced
+        by the next ingestion (``swap_alias``).
+        """
+        vectors_path, payloads_path = self._files()
+        if not vectors_path.exists() or not payloads_path.exists():
+            return
+
+        try:
+            vectors = np.load(vectors_path, mmap_mode="r" if self.mmap else None)
+            with open(payloads_path) as f:
+                data = json.load(f)
+
+            if vectors.shape[1] != self.vector_size:
+                logger.error(
+                    f"Persisted collection '{self.collection_name}' has wrong vector size "
+                    f"(existing={vectors.shape[1]}, expected={self.vector_size}). "
+                    f"Starting empty; re-run ingestion to rebuild it."
+                )
+                return
+
+            self._live.vectors = vectors
+            self._live.ids = data["ids"]
+            self._live.payloads = data["payloads"]
+            self._live.reindex()
+            logger.info(f"Loaded {len(self._live)} points from {vectors_path}")
+
+        except Exception as e:
+            logger.error(f"Failed to load persisted collection: {e}", exc_info=True)
+            raise
+
+    def save(self) -> None:
+        """Persist the live collection to ``persist_dir``.
+
+        Files are written to temporary names and renamed, so readers that
+        memory-map the previous files are never exposed to partial writes.
+        """
+        if not self.persist_dir:
+            return
+
+        self.persist_dir.mkdir(parents=True, exist_ok=True)
+        vectors_path, payloads_path = self._files()
+
+        vectors_tmp = vectors_path.with_suffix(".npy.tmp")
+        with open(vectors_tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(self._live.vectors, dtype=np.float32))
+
+        payloads_tmp = payloads_path.with_suffix(".json.tmp")
+        with open(payloads_tmp, "w") as f:
+            json.dump({"ids": self._live.ids, "payloads": self._live.payloads}, f)
+
+        os.replace(vectors_tmp, vectors_path)
+        os.replace(payloads_tmp, payloads_path)
+        logger.info(f"Saved {len(self._live)} points to {vectors_path}")
+
+    def _prepare(self, embeddings: list[list[float]]) -> np.ndarray:
+        """Convert embeddings to a float32 matrix (unit-normalized for cosine)."""
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.vector_size)
+        if self.distance == "Cosine":
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.maximum(norms, np.finfo(np.float32).eps)
+        return np.ascontiguousarray(matrix)
+
+    def _collection(self, collection_name: str | None) -> _Collection:
+        """Resolve the live collection or a staging collection by name."""
+        if collection_name is None or collection_name == self.collection_name:
+            return self._live
+        if collection_name not in self._staging:
+            raise ValueError(f"Unknown collection '{collection_name}'")
+        return self._staging[collection_name]
+
+    def create_versioned_collection(self) -> str:
+        """Create a new, empty staging collection.
+
+        Returns:
+            Name of the staging collection
+        """
+        version = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
+        name = f"{self.collection_name}_{version}"
+        self._staging[name] = _Collection(self.vector_size)
+        logger.info(f"Created staging collection '{name}'")
+        return name
+
+    def swap_alias(self, new_collection: str, delete_previous: bool = True) -> None:
+        """Make a staging collection live and persist it.
+
+        Args:
+            new_collection: Staging collection to serve from
+            delete_previous: Kept for interface parity; the previous in-memory
+                version is always released
+        """
+        self._live = self._staging.pop(new_collection)
+        self.save()
+        logger.info(f"Collection '{self.collection_name}' now serves '{new_collection}'")
+
+    def drop_collection(self, collection_name: str) -> None:
+        """Discard a staging collection that will not be swapped in.
+
+        Args:
+            collection_name: Staging collection from ``create_versioned_collection``
+        """
+        if self._staging.pop(collection_name, None) is not None:
+            logger.info(f"Dropped staging collection '{collection_name}'")
+
+    def add(
+        self,
+        embeddings: list[list[float]],
+        metadata: list[dict[str, Any]] | None = None,
+        ids: list[str] | None = None,
+        collection_name: str | None = None,
+        texts: list[str] | None = None,
+    ) -> None:
+        """Add or overwrite embeddings.
+
+        Args:
+            embeddings: List of embedding vectors
+            metadata: List of metadata dicts (must match embeddings length if provided)
+            ids: Optional list of IDs (auto-generated if not provided)
+            collection_name: Target collection (default: the live collection)
+            texts: Unused (no sparse vectors); accepted for interface parity
+
+        Raises:
+            ValueError: If embeddings, metadata and ids lengths don't match
+        """
+        if metadata is None:
+            metadata = [{} for _ in range(len(embeddings))]
+
+        if len(embeddings) != len(metadata):
+            raise ValueError(
+                f"Embeddings ({len(embeddings)}) and metadata ({len(metadata)}) "
+                "lengths must match"
+            )
+
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in range(len(embeddings))]
+
+        if len(ids) != len(embeddings):
+            raise ValueError(
+                f"IDs ({len(ids)}) and embeddings ({len(embeddings)}) "
+                "lengths must match"
+            )
+
+        if not embeddings:
+            return
+
+        collection = self._collection(collection_name)
+        matrix = self._prepare(embeddings)
+
+        # Copy out of a read-only memory map before mutating
+        vectors = np.array(collection.vectors, dtype=np.float32)
+
+        new_rows = []
+        for point_id, row, meta in zip(ids, matrix, metadata):
+            existing = collection.id_to_row.get(point_id)
+            if existing is not None:
+                vectors[existing] = row
+                collection.payloads[existing] = meta
+            else:
+                collection.id_to_row[point_id] = len(collection.ids)
+                collection.ids.append(point_id)
+                collection.payloads.append(meta)
+                new_rows.append(row)
+
+        if new_rows:
+            vectors = np.concatenate([vectors, np.stack(new_rows)])
+
+        collection.vectors = np.ascontiguousarray(vectors)
+        collection.reindex()
+
+        if collection is self._live:
+            self.save()
+
+        logger.info(
+            f"Added {len(ids)} points to collection "
+            f"'{collection_name or self.collection_name}'"
+        )
+
+    def search(
+        self,
+        query_embedding: list[float],
+        k: int = 5,
+        filter: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search for similar embeddings.
+
+        Args:
+            query_embedding: Query vector
+            k: Number of results to return
+            filter: Optional exact-match metadata filter
+
+        Returns:
+            List of results, each containing:
+            {
+                "id": str,
+                "score": float,
+                "metadata": dict,
+                "text": str (if available in metadata)
+            }
+        """
+        collection = self._live
+        if len(collection) == 0 or k <= 0:
+            return []
+
+        query = self._prepare([query_embedding])[0]
+
+        if self.distance == "Euclid":
+            # Rank by negative distance; report distance like Qdrant
+            diff = collection.vectors - query
+            ranking = -np.einsum("ij,ij->i", diff, diff)
+        else:
+            ranking = collection.vectors @ query
+
+        mask = collection.mask(filter)
+        if mask is not None:
+            ranking = np.where(mask, ranking, -np.inf)
+            candidates = int(mask.sum())
+        else:
+            candidates = len(collection)
+
+        k = min(k, candidates)
+        if k == 0:
+            return []
+
+        top = np.argpartition(-ranking, k - 1)[:k]
+        top = top[np.argsort(-ranking[top])]
+
+        results = []
+        for row in top:
+            score = float(ranking[row])
+            if self.distance == "Euclid":
+                score = float(np.sqrt(-score))
+            payload = collection.payloads[row]
+            result = {
+                "id": collection.ids[row],
+                "score": score,
+                "metadata": payload,
+            }
+            if "text" in payload:
+                result["text"] = payload["text"]
+            results.append(result)
+
+        logger.info(
+            f"Search returned {len(results)} results "
+            f"(k={k}, filter={filter is not None})"
+        )
+        return results
+
+    def delete(
+        self,
+        ids: list[str] | None = None,
+        filter: dict[str, Any] | None = None,
+    ) -> None:
+        """Delete embeddings by ID or filter.
+
+        Args:
+            ids: List of embedding IDs to delete
+            filter: Metadata filter for deletion
+
+        Raises:
+            ValueError: If both ids and filter are provided, or neither is provided
+        """
+        if ids is not None and filter is not None:
+            raise ValueError("Cannot provide both 'ids' and 'filter'. Choose one.")
+        if ids is None and filter is None:
+            raise ValueError("Must provide either 'ids' or 'filter'.")
+
+        collection = self._live
+
+        if ids is not None:
+            if not ids:
+                logger.warning("Empty IDs list provided for deletion")
+                return
+            remove = np.zeros(len(collection), dtype=bool)
+            rows = [collection.id_to_row[i] for i in ids if i in collection.id_to_row]
+            remove[rows] = True
+        else:
+            remove = collection.mask(filter)
+
+        keep = ~remove
+        collection.vectors = np.ascontiguousarray(collection.vectors[keep])
+        collection.ids = [i for i, kept in zip(collection.ids, keep) if kept]
+        collection.payloads = [p for p, kept in zip(collection.payloads, keep) if kept]
+        collection.reindex()
+        self.save()
+
+        logger.info(f"Deleted {int(remove.sum())} points")
+
+    def count(self, filter: dict[str, Any] | None = None) -> int:
+        """Count points in the live collection.
+
+        Args:
+            filter: Optional metadata filter
+
+        Returns:
+            Number of points
+        """
+        mask = self._live.mask(filter)
+        if mask is None:
+            return len(self._live)
+        return int(mask.sum())
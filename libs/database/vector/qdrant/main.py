@@ -6,15 +6,27 @@ Reference: https://qdrant.tech/documentation/quick-start/
 """
 
 import uuid
+from datetime import datetime, timezone
 from typing import Any
 
+from fastembed import SparseTextEmbedding
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
     Distance,
     FieldCondition,
     Filter,
+    Fusion,
+    FusionQuery,
     MatchValue,
+    Modifier,
     PointStruct,
+    Prefetch,
+    SparseVector,
+    SparseVectorParams,
     VectorParams,
 )
 
@@ -23,6 +35,9 @@ from libs.logger.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Named vector for sparse (BM25/SPLADE) embeddings; dense stays the default vector
+SPARSE_VECTOR_NAME = "sparse"
+
 
 class VectorStoreClient(BaseVectorStore):
     """Qdrant vector database client.
@@ -35,6 +50,13 @@ class VectorStoreClient(BaseVectorStore):
     - Metadata filtering (session_id, source, page)
     - Distance metrics (cosine, euclidean, dot product)
     - Collection management
+    - Blue/green collection versioning behind an alias
+    - Optional sparse vectors (fastembed BM25/SPLADE) for hybrid search
+
+    ``collection_name`` is the alias that readers query. Each ingestion run
+    builds a new physical collection (``{collection_name}_{timestamp}``),
+    fills it, then atomically repoints the alias, so searches never see an
+    empty or half-populated collection.
 
     Reference: https://qdrant.tech/documentation/
     """
@@ -47,6 +69,7 @@ class VectorStoreClient(BaseVectorStore):
         vector_size: int = 1536,  # Default for OpenAI embeddings
         distance: str = "Cosine",
         create_collection: bool = True,
+        sparse_model: str | None = None,
     ):
         """Initialize Qdrant client.
 
@@ -56,7 +79,9 @@ class VectorStoreClient(BaseVectorStore):
             collection_name: Name of the collection to use
             vector_size: Dimension of embedding vectors
             distance: Distance metric ("Cosine", "Euclid", "Dot")
-            create_collection: Create collection if it doesn't exist
+            create_collection: Create collection (and alias) if it doesn't exist
+            sparse_model: fastembed sparse model (e.g., "Qdrant/bm25") to store
+                sparse vectors alongside dense ones. None disables hybrid search.
 
         Note:
             For Docker Compose, use host="qdrant" to connect to the service
@@ -66,6 +91,12 @@ class VectorStoreClient(BaseVectorStore):
         self.collection_name = collection_name
         self.vector_size = vector_size
         self.distance = distance
+        self.sparse_model = sparse_model
+
+        # Initialize sparse encoder (runs locally on CPU)
+        self._sparse_encoder = (
+            SparseTextEmbedding(model_name=sparse_model) if sparse_model else None
+        )
 
         # Initialize client
         self.client = QdrantClient(host=host, port=port)
@@ -76,65 +107,236 @@ class VectorStoreClient(BaseVectorStore):
 
         logger.info(
             f"Qdrant client initialized (host={host}:{port}, "
-            f"collection={collection_name}, vector_size={vector_size})"
+            f"collection={collection_name}, vector_size={vector_size}, "
+            f"sparse_model={sparse_model})"
+        )
+
+    def _distance_metric(self) -> Distance:
+        """Map distance string to Distance enum."""
+        distance_map = {
+            "Cosine": Distance.COSINE,
+            "Euclid": Distance.EUCLID,
+            "Dot": Distance.DOT,
+        }
+        return distance_map.get(self.distance, Distance.COSINE)
+
+    def _create_physical_collection(self, name: str) -> None:
+        """Create a physical collection with the configured vector params."""
+        sparse_vectors_config = None
+        if self._sparse_encoder:
+            # IDF modifier lets Qdrant compute BM25 weights server-side
+            sparse_vectors_config = {
+                SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF),
+            }
+
+        self.client.create_collection(
+            collection_name=name,
+            vectors_config=VectorParams(
+                size=self.vector_size,
+                distance=self._distance_metric(),
+            ),
+            sparse_vectors_config=sparse_vectors_config,
+        )
+
+    def _build_filter(self, filter: dict[str, Any] | None) -> Filter | None:
+        """Build Qdrant filter from a metadata dict."""
+        if not filter:
+            return None
+        conditions = [
+            FieldCondition(
+                key=key,
+                match=MatchValue(value=value),
+            )
+            for key, value in filter.items()
+        ]
+        return Filter(must=conditions)
+
+    def _format_hits(self, hits: list[Any]) -> list[dict[str, Any]]:
+        """Format Qdrant scored points into result dicts."""
+        results = []
+        for hit in hits:
+            result = {
+                "id": str(hit.id),
+                "score": hit.score,
+                "metadata": hit.payload,
+            }
+            # Include text if available
+            if "text" in hit.payload:
+                result["text"] = hit.payload["text"]
+
+            results.append(result)
+        return results
+
+    def encode_sparse(
+        self,
+        texts: list[str],
+        is_query: bool = False,
+    ) -> list[SparseVector]:
+        """Encode texts into sparse vectors with the configured fastembed model.
+
+        Args:
+            texts: Texts to encode
+            is_query: Use the model's query encoding (BM25 skips term frequency)
+
+        Returns:
+            List of Qdrant sparse vectors
+
+        Raises:
+            ValueError: If no sparse model is configured
+        """
+        if not self._sparse_encoder:
+            raise ValueError("sparse_model not set. Provide it in __init__")
+
+        encoded = (
+            self._sparse_encoder.query_embed(texts)
+            if is_query
+            else self._sparse_encoder.embed(texts)
         )
+        return [
+            SparseVector(indices=e.indices.tolist(), values=e.values.tolist())
+            for e in encoded
+        ]
 
     def _ensure_collection(self) -> None:
-        """Create collection if it doesn't exist, or recreate if dimensions mismatch."""
+        """Create versioned collection and alias if neither exists.
+
+        A vector size mismatch is never fixed in place: the live collection
+        keeps serving searches until re-ingestion builds a new version and
+        swaps the alias (see ``create_versioned_collection``/``swap_alias``).
+        """
         try:
-            # Check if collection exists
-            collections = self.client.get_collections().collections
-            collection_names = [c.name for c in collections]
-
-            # Map distance string to Distance enum
-            distance_map = {
-                "Cosine": Distance.COSINE,
-                "Euclid": Distance.EUCLID,
-                "Dot": Distance.DOT,
-            }
-            distance_metric = distance_map.get(self.distance, Distance.COSINE)
+            target = self.get_alias_target()
+            collection_names = [
+                c.name for c in self.client.get_collections().collections
+            ]
 
-            if self.collection_name in collection_names:
-                # Check if vector size matches
-                collection_info = self.client.get_collection(self.collection_name)
-                existing_size = collection_info.config.params.vectors.size
+            if target is None and self.collection_name not in collection_names:
+                # Fresh deployment: create first version behind the alias
+                new_collection = self.create_versioned_collection()
+                self.swap_alias(new_collection, delete_previous=False)
+                logger.info(
+                    f"Created collection '{new_collection}' "
+                    f"with alias '{self.collection_name}'"
+                )
+                return
+
+            # Check if vector size matches
+            collection_info = self.client.get_collection(self.collection_name)
+            existing_size = collection_info.config.params.vectors.size
 
-                if existing_size != self.vector_size:
+            if existing_size != self.vector_size:
+                logger.warning(
+                    f"Collection '{self.collection_name}' has wrong vector size "
+                    f"(existing={existing_size}, expected={self.vector_size}). "
+                    f"Keeping it live; re-run ingestion to migrate."
+                )
+            else:
+                logger.info(f"Collection '{self.collection_name}' already exists")
+
+        except Exception as e:
+            logger.error(f"Failed to ensure collection: {e}", exc_info=True)
+            raise
+
+    def get_alias_target(self) -> str | None:
+        """Get the physical collection the alias currently points to.
+
+        Returns:
+            Collection name, or None if the alias does not exist
+        """
+        aliases = self.client.get_aliases().aliases
+        for alias in aliases:
+            if alias.alias_name == self.collection_name:
+                return alias.collection_name
+        return None
+
+    def create_versioned_collection(self) -> str:
+        """Create a new, empty physical collection for the next version.
+
+        The collection is not visible to readers until ``swap_alias`` is called.
+
+        Returns:
+            Name of the new physical collection
+        """
+        version = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
+        name = f"{self.collection_name}_{version}"
+        self._create_physical_collection(name)
+        logger.info(f"Created staging collection '{name}'")
+        return name
+
+    def swap_alias(self, new_collection: str, delete_previous: bool = True) -> None:
+        """Atomically point the alias at a new physical collection.
+
+        Args:
+            new_collection: Physical collection to serve from
+            delete_previous: Drop the collection the alias pointed to before
+
+        Note:
+            A legacy physical collection named like the alias must be dropped
+            before the alias can be created; this one-time migration is the
+            only step that is not atomic.
+        """
+        try:
+            previous = self.get_alias_target()
+
+            operations = []
+            if previous is not None:
+                operations.append(
+                    DeleteAliasOperation(
+                        delete_alias=DeleteAlias(alias_name=self.collection_name)
+                    )
+                )
+            else:
+                collection_names = [
+                    c.name for c in self.client.get_collections().collections
+                ]
+                if self.collection_name in collection_names:
                     logger.warning(
-                        f"Collection '{self.collection_name}' has wrong vector size "
-                        f"(existing={existing_size}, expected={self.vector_size}). Recreating..."
+                        f"Dropping legacy collection '{self.collection_name}' "
+                        f"to replace it with an alias"
                     )
                     self.client.delete_collection(collection_name=self.collection_name)
-                    self.client.create_collection(
-                        collection_name=self.collection_name,
-                        vectors_config=VectorParams(
-                            size=self.vector_size,
-                            distance=distance_metric,
-                        ),
+
+            operations.append(
+                CreateAliasOperation(
+                    create_alias=CreateAlias(
+                        collection_name=new_collection,
+                        alias_name=self.collection_name,
                     )
-                    logger.info(f"Recreated collection '{self.collection_name}'")
-                else:
-                    logger.info(f"Collection '{self.collection_name}' already exists")
-            else:
-                # Create new collection
-                self.client.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config=VectorParams(
-                        size=self.vector_size,
-                        distance=distance_metric,
-                    ),
                 )
-                logger.info(f"Created collection '{self.collection_name}'")
+            )
+            self.client.update_collection_aliases(change_aliases_operations=operations)
+            logger.info(f"Alias '{self.collection_name}' now points to '{new_collection}'")
+
+            if delete_previous and previous and previous != new_collection:
+                self.client.delete_collection(collection_name=previous)
+                logger.info(f"Deleted previous collection '{previous}'")
 
         except Exception as e:
-            logger.error(f"Failed to ensure collection: {e}", exc_info=True)
+            logger.error(f"Failed to swap alias: {e}", exc_info=True)
             raise
 
+    def drop_collection(self, collection_name: str) -> None:
+        """Drop a staging collection that will not be swapped in.
+
+        The collection the alias serves is never dropped, so cleaning up
+        after a ``swap_alias`` that failed late cannot take search offline.
+
+        Args:
+            collection_name: Physical collection from ``create_versioned_collection``
+        """
+        if collection_name == self.get_alias_target():
+            logger.warning(f"Not dropping '{collection_name}': the alias serves it")
+            return
+        self.client.delete_collection(collection_name=collection_name)
+        logger.info(f"Dropped staging collection '{collection_name}'")
+
     def add(
         self,
         embeddings: list[list[float]],
         metadata: list[dict[str, Any]] | None = None,
         ids: list[str] | None = None,
+        collection_name: str | None = None,
+        texts: list[str] | None = None,
     ) -> None:
         """Add embeddings to Qdrant.
 
@@ -142,6 +344,9 @@ class VectorStoreClient(BaseVectorStore):
             embeddings: List of embedding vectors
             metadata: List of metadata dicts (must match embeddings length if provided)
             ids: Optional list of IDs (auto-generated if not provided)
+            collection_name: Target collection (default: the alias). Pass a
+                staging collection from ``create_versioned_collection``.
+            texts: Texts to encode as sparse vectors (used when sparse_model is set)
 
         Raises:
             ValueError: If embeddings and metadata lengths don't match
@@ -175,24 +380,40 @@ class VectorStoreClient(BaseVectorStore):
                 "lengths must match"
             )
 
+        if texts is not None and len(texts) != len(embeddings):
+            raise ValueError(
+                f"Texts ({len(texts)}) and embeddings ({len(embeddings)}) "
+                "lengths must match"
+            )
+
         try:
+            # Store sparse vectors next to the default dense vector if enabled
+            vectors: list[Any] = list(embeddings)
+            if self._sparse_encoder and texts is not None:
+                sparse_vectors = self.encode_sparse(texts)
+                vectors = [
+                    {"": embedding, SPARSE_VECTOR_NAME: sparse}
+                    for embedding, sparse in zip(embeddings, sparse_vectors)
+                ]
+
             # Create points
             points = [
                 PointStruct(
                     id=point_id,
-                    vector=embedding,
+                    vector=vector,
                     payload=meta,
                 )
-                for point_id, embedding, meta in zip(ids, embeddings, metadata)
+                for point_id, vector, meta in zip(ids, vectors, metadata)
             ]
 
             # Upload to Qdrant
+            target = collection_name or self.collection_name
             self.client.upsert(
-                collection_name=self.collection_name,
+                collection_name=target,
                 points=points,
             )
 
-            logger.info(f"Added {len(points)} points to collection '{self.collection_name}'")
+            logger.info(f"Added {len(points)} points to collection '{target}'")
 
         except Exception as e:
             logger.error(f"Failed to add embeddings: {e}", exc_info=True)
@@ -228,16 +449,7 @@ class VectorStoreClient(BaseVectorStore):
         """
         try:
             # Build Qdrant filter if provided
-            qdrant_filter = None
-            if filter:
-                conditions = [
-                    FieldCondition(
-                        key=key,
-                        match=MatchValue(value=value),
-                    )
-                    for key, value in filter.items()
-                ]
-                qdrant_filter = Filter(must=conditions)
+            qdrant_filter = self._build_filter(filter)
 
             # Search
             search_result = self.client.search(
@@ -248,18 +460,7 @@ class VectorStoreClient(BaseVectorStore):
             )
 
             # Format results
-            results = []
-            for hit in search_result:
-                result = {
-                    "id": str(hit.id),
-                    "score": hit.score,
-                    "metadata": hit.payload,
-                }
-                # Include text if available
-                if "text" in hit.payload:
-                    result["text"] = hit.payload["text"]
-
-                results.append(result)
+            results = self._format_hits(search_result)
 
             logger.info(
                 f"Search returned {len(results)} results "
@@ -271,6 +472,71 @@ class VectorStoreClient(BaseVectorStore):
             logger.error(f"Search failed: {e}", exc_info=True)
             raise
 
+    def hybrid_search(
+        self,
+        query_embedding: list[float],
+        query_text: str,
+        k: int = 5,
+        filter: dict[str, Any] | None = None,
+        prefetch_k: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search dense and sparse vectors, fused with reciprocal-rank fusion.
+
+        Both candidate lists are fetched and fused by Qdrant in a single
+        request. Scores are RRF scores, not cosine similarities.
+
+        Args:
+            query_embedding: Dense query vector
+            query_text: Raw query text for sparse (BM25) encoding
+            k: Number of results to return
+            filter: Optional metadata filter applied to both candidate lists
+            prefetch_k: Candidates per vector before fusion (default: 4 * k)
+
+        Returns:
+            List of results in the same format as ``search``
+
+        Raises:
+            ValueError: If no sparse model is configured
+            Exception: If search fails
+        """
+        query_sparse = self.encode_sparse([query_text], is_query=True)[0]
+        prefetch_k = prefetch_k or 4 * k
+
+        try:
+            qdrant_filter = self._build_filter(filter)
+
+            response = self.client.query_points(
+                collection_name=self.collection_name,
+                prefetch=[
+                    Prefetch(
+                        query=query_embedding,
+                        limit=prefetch_k,
+                        filter=qdrant_filter,
+                    ),
+                    Prefetch(
+                        query=query_sparse,
+                        using=SPARSE_VECTOR_NAME,
+                        limit=prefetch_k,
+                        filter=qdrant_filter,
+                    ),
+                ],
+                query=FusionQuery(fusion=Fusion.RRF),
+                limit=k,
+                with_payload=True,
+            )
+
+            results = self._format_hits(response.points)
+
+            logger.info(
+                f"Hybrid search returned {len(results)} results "
+                f"(k={k}, prefetch_k={prefetch_k}, filter={filter is not None})"
+            )
+            return results
+
+        except Exception as e:
+            logger.error(f"Hybrid search failed: {e}", exc_info=True)
+            raise
+
     def delete(
         self,
         ids: list[str] | None = None,
@@ -8,6 +8,7 @@ class VectorStoreSelector(BaseToolSelector):
 
     Available providers:
         - qdrant: Qdrant vector database
+        - numpy: In-memory NumPy index (optional .npy persistence)
 
     Example:
         >>> from libs.database.vector.selector import VectorStoreSelector
@@ -21,4 +22,5 @@ class VectorStoreSelector(BaseToolSelector):
 
     _PROVIDERS = {
         "qdrant": "libs.database.vector.qdrant.main.VectorStoreClient",
+        "numpy": "libs.database.vector.numpy.main.VectorStoreClient",
     }
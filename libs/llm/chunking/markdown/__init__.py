@@ -0,0 +1 @@
+"""Markdown-aware token chunker."""
@@ -0,0 +1,133 @@
+from typing import Any
+
+import tiktoken
+from langchain_text_splitters import (
+    MarkdownHeaderTextSplitter,
+    RecursiveCharacterTextSplitter,
+)
+
+from libs.llm.chunking.base import BaseChunker
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_HEADERS = [("#", "h1"), ("##", "h2"), ("###", "h3")]
+
+
+class TextChunker(BaseChunker):
+    """Markdown-aware text chunker that sizes chunks in tokenizer tokens.
+
+    First splits a document on markdown headings so chunks never straddle
+    sections, then splits oversized sections with a token-counting
+    RecursiveCharacterTextSplitter. Each chunk carries the heading path it
+    came from (e.g. "How to Request a Refund > Eligibility").
+
+    Sizing in tokens (not characters) keeps chunks aligned with embedding
+    model limits and with the token budget of prompts they end up in.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        chunk_overlap: int = 50,
+        encoding_name: str = "cl100k_base",
+        headers_to_split_on: list[tuple[str, str]] | None = None,
+        **kwargs
+    ):
+        """Initialize markdown token chunker.
+
+        Args:
+            chunk_size: Maximum size of each chunk (in tokens)
+            chunk_overlap: Number of tokens to overlap between chunks of one section
+            encoding_name: tiktoken encoding (cl100k_base for text-embedding-3-*)
+            headers_to_split_on: (markdown prefix, metadata key) pairs
+                (default: h1-h3)
+            **kwargs: Additional configuration for RecursiveCharacterTextSplitter
+        """
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.encoding_name = encoding_name
+        self.headers_to_split_on = headers_to_split_on or DEFAULT_HEADERS
+
+        if self.chunk_overlap >= self.chunk_size:
+            raise ValueError("chunk_overlap must be less than chunk_size")
+
+        self.encoding = tiktoken.get_encoding(encoding_name)
+
+        # Keep heading lines in chunk text so each chunk reads standalone
+        self.header_splitter = MarkdownHeaderTextSplitter(
+            headers_to_split_on=self.headers_to_split_on,
+            strip_headers=False,
+        )
+        self.token_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            encoding_name=encoding_name,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            **kwargs
+        )
+
+        logger.info(
+            f"Initialized markdown TextChunker "
+            f"(size={chunk_size} tokens, overlap={chunk_overlap}, encoding={encoding_name})"
+        )
+
+    def split(
+        self,
+        text: str,
+        metadata: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Split markdown text into heading-scoped, token-sized chunks.
+
+        Args:
+            text: Markdown text to split
+            metadata: Optional metadata to attach to each chunk
+
+        Returns:
+            List of dicts, each containing:
+            {
+                "text": str,
+                "metadata": dict (includes chunk_index, chunk_size,
+                                  token_count and heading_path)
+            }
+
+        Raises:
+            ValueError: If text is empty
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        metadata = metadata or {}
+        header_keys = [key for _, key in self.headers_to_split_on]
+
+        try:
+            sections = self.header_splitter.split_text(text)
+
+            result = []
+            for section in sections:
+                heading_path = " > ".join(
+                    section.metadata[key] for key in header_keys if key in section.metadata
+                )
+
+                for chunk_text in self.token_splitter.split_text(section.page_content):
+                    chunk_text = chunk_text.strip()
+                    if not chunk_text:
+                        continue
+
+                    chunk_metadata = metadata.copy()
+                    chunk_metadata["chunk_index"] = len(result)
+                    chunk_metadata["chunk_size"] = len(chunk_text)
+                    chunk_metadata["token_count"] = len(self.encoding.encode(chunk_text))
+                    chunk_metadata["heading_path"] = heading_path
+
+                    result.append({
+                        "text": chunk_text,
+                        "metadata": chunk_metadata,
+                    })
+
+            logger.debug(f"Split text into {len(result)} chunks from {len(sections)} sections")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error splitting text: {str(e)}")
+            raise
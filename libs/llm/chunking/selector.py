@@ -8,6 +8,7 @@ class TextChunkerSelector(BaseToolSelector):
 
     Available providers:
         - recursive: Recursive character text splitter
+        - markdown: Markdown-heading-aware splitter sized in tokens
 
     Example:
         >>> from libs.llm.chunking.selector import TextChunkerSelector
@@ -20,4 +21,5 @@ class TextChunkerSelector(BaseToolSelector):
 
     _PROVIDERS = {
         "recursive": "libs.llm.chunking.recursive.main.TextChunker",
+        "markdown": "libs.llm.chunking.markdown.main.TextChunker",
     }
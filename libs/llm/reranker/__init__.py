@@ -0,0 +1 @@
+"""Reranking strategies."""
@@ -0,0 +1,28 @@
+"""Base abstraction for rerankers."""
+
+from abc import ABC, abstractmethod
+
+
+class BaseReranker(ABC):
+    """Abstract base class for rerankers.
+
+    All reranker implementations must inherit from this class and implement
+    all abstract methods. This enables different reranking models
+    (local cross-encoders, hosted rerank APIs, etc.) to be used interchangeably.
+    """
+
+    @abstractmethod
+    def rerank(self, query: str, documents: list[str]) -> list[float]:
+        """Score documents against a query.
+
+        Args:
+            query: Query text
+            documents: Candidate document texts
+
+        Returns:
+            Relevance scores in [0, 1], one per document (same order as input)
+
+        Raises:
+            Exception: If scoring fails
+        """
+        pass
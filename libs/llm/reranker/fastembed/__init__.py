@@ -0,0 +1 @@
+"""fastembed cross-encoder reranker."""
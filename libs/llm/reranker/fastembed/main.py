@@ -0,0 +1,64 @@
+"""fastembed cross-encoder reranker.
+
+Runs a small ONNX cross-encoder locally on CPU.
+
+Reference: https://qdrant.github.io/fastembed/examples/Reranking/
+"""
+
+import math
+
+from fastembed.rerank.cross_encoder import TextCrossEncoder
+
+from libs.llm.reranker.base import BaseReranker
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Reranker(BaseReranker):
+    """Cross-encoder reranker using fastembed's TextCrossEncoder.
+
+    Scores each (query, document) pair jointly, which is more precise than
+    comparing independent embeddings. Raw logits are squashed with a sigmoid
+    so scores are comparable to vector similarities in [0, 1].
+    """
+
+    def __init__(
+        self,
+        model_name: str = "Xenova/ms-marco-MiniLM-L-6-v2",
+        batch_size: int = 32,
+        threads: int | None = None,
+    ):
+        """Initialize cross-encoder reranker.
+
+        Args:
+            model_name: fastembed cross-encoder model name
+            batch_size: Pairs scored per ONNX run
+            threads: ONNX runtime threads (default: runtime decides)
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.model = TextCrossEncoder(model_name=model_name, threads=threads)
+
+        logger.info(f"Initialized Reranker (model={model_name}, batch_size={batch_size})")
+
+    def rerank(self, query: str, documents: list[str]) -> list[float]:
+        """Score documents against a query.
+
+        Args:
+            query: Query text
+            documents: Candidate document texts
+
+        Returns:
+            Sigmoid-normalized relevance scores, one per document
+        """
+        if not documents:
+            return []
+
+        try:
+            logits = self.model.rerank(query, documents, batch_size=self.batch_size)
+            return [1.0 / (1.0 + math.exp(-float(logit))) for logit in logits]
+
+        except Exception as e:
+            logger.error(f"Rerank failed: {e}", exc_info=True)
+            raise
@@ -0,0 +1,22 @@
+"""Reranker selector for choosing provider implementation."""
+
+from libs.base.selector import BaseToolSelector
+
+
+class RerankerSelector(BaseToolSelector):
+    """Selector for reranker providers.
+
+    Available providers:
+        - fastembed: Local ONNX cross-encoder via fastembed (CPU)
+
+    Example:
+        >>> from libs.llm.reranker.selector import RerankerSelector
+        >>> reranker = RerankerSelector.create(
+        ...     provider="fastembed",
+        ...     model_name="Xenova/ms-marco-MiniLM-L-6-v2"
+        ... )
+    """
+
+    _PROVIDERS = {
+        "fastembed": "libs.llm.reranker.fastembed.main.Reranker",
+    }
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""One-off backfill of the activated-ticket index from existing checkpoints.
+
+Tickets checkpointed before the per-customer index existed are invisible to
+ticket matching, which reads only ``activated_tickets:{customer_id}``. This
+script finds their customers from the ``checkpoint:*`` keys, lists each
+customer's tickets with ``CheckpointRepository.scan_activated_ticket_ids``
+and indexes every ticket that is not indexed yet, scored with its latest
+checkpoint's timestamp. Summaries are not built here; tickets without one
+are summarized from their checkpoint at matching time.
+
+Safe to re-run: already indexed tickets are left untouched.
+
+Usage:
+    python scripts/backfill_activated_tickets.py            # backfill
+    python scripts/backfill_activated_tickets.py --dry-run  # report only
+
+Environment Variables:
+    REDIS_HOST: Redis host (default: localhost)
+    REDIS_PORT: Redis port (default: 6379)
+    LOG_LEVEL: Logging level (default: INFO)
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from libs.configs.selector import ConfigSelector
+from libs.database.keyvalue_db.redis.checkpointer import TrackedRedisSaver
+from libs.database.keyvalue_db.selector import KeyValueClientSelector
+from libs.logger.logger import get_logger, setup_logging
+from src.repositories.checkpoint.main import CheckpointRepository
+
+# LangGraph checkpoint keys: checkpoint:{customer_id}:{ticket_id}:{ns}:{checkpoint_id}
+CHECKPOINT_KEY_PATTERN = "checkpoint:*"
+
+
+def checkpoint_customers(kv_client) -> set[str]:
+    """Collect customer IDs that have checkpoints.
+
+    Args:
+        kv_client: Key-value client for Redis.
+
+    Returns:
+        Customer IDs.
+    """
+    customers = set()
+    for key in kv_client.scan(pattern=CHECKPOINT_KEY_PATTERN):
+        parts = key.split(":")
+        if len(parts) > 2:
+            customers.add(parts[1])
+    return customers
+
+
+def checkpoint_time(checkpoint_repo: CheckpointRepository, customer_id: str, ticket_id: str):
+    """Get the latest checkpoint's timestamp for a ticket.
+
+    Args:
+        checkpoint_repo: Checkpoint repository.
+        customer_id: Customer identifier.
+        ticket_id: Ticket identifier.
+
+    Returns:
+        Epoch seconds, or None if the ticket has no readable checkpoint.
+    """
+    checkpoint_tuple = checkpoint_repo.get_checkpoint(customer_id, ticket_id)
+    if checkpoint_tuple is None:
+        return None
+    ts = checkpoint_tuple.checkpoint.get("ts")
+    return datetime.fromisoformat(ts).timestamp() if ts else None
+
+
+def main() -> int:
+    """Main entry point for the activated-ticket index backfill.
+
+    Returns:
+        Exit code (0 for success, 1 for failure).
+    """
+    parser = argparse.ArgumentParser(
+        description="Backfill the activated-ticket index from existing checkpoints"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report tickets to index without writing"
+    )
+    args = parser.parse_args()
+
+    setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
+    logger = get_logger(__name__)
+
+    settings = ConfigSelector.create(provider="dynaconf")
+    checkpoint_config = settings.triage.get("checkpoint", {})
+    ttl_minutes = checkpoint_config.get("ttl_minutes")
+
+    kv_client = KeyValueClientSelector.create(
+        provider="redis",
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        decode_responses=True,
+    )
+    checkpointer = TrackedRedisSaver(redis_client=kv_client.get_raw_client())
+    checkpointer.setup()
+    checkpoint_repo = CheckpointRepository(
+        checkpointer,
+        kv_client,
+        ttl_seconds=int(float(ttl_minutes) * 60) if ttl_minutes else None,
+        track_activity=checkpoint_config.get("retention", {}).get("enabled", False),
+    )
+
+    try:
+        indexed = 0
+        skipped = 0
+        customers = checkpoint_customers(kv_client)
+        logger.info(f"Found checkpoints for {len(customers)} customers")
+
+        for customer_id in sorted(customers):
+            known = set(checkpoint_repo.get_activated_ticket_ids(customer_id))
+            for ticket_id in checkpoint_repo.scan_activated_ticket_ids(customer_id):
+                if ticket_id in known:
+                    continue
+                last_activity = checkpoint_time(checkpoint_repo, customer_id, ticket_id)
+                if last_activity is None:
+                    skipped += 1
+                    continue
+                if not args.dry_run:
+                    checkpoint_repo.mark_ticket_activated(
+                        customer_id, ticket_id, last_activity=last_activity
+                    )
+                logger.info(f"Indexed {customer_id}:{ticket_id}")
+                indexed += 1
+
+        action = "Would index" if args.dry_run else "Indexed"
+        logger.info(f"{action} {indexed} tickets ({skipped} without a readable checkpoint)")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Backfill failed: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
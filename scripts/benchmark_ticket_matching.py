@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Benchmark follow-up ticket matching end to end.
+
+Runs conversation pairs through TriageService in-process (the /api/triage
+response does not include the resolved ticket_id): an opening message,
+then a second message from the same customer without a ticket_id. Follow-ups
+about the same issue should be matched to the opener's activated ticket and
+continue its checkpoint thread; unrelated messages should get a new ticket.
+
+Reports per pair the opener (cold triage) and second-message latencies, the
+resolved ticket, and how many messages the second turn's thread holds.
+Pairs whose opener was completed (auto_respond / escalate_human) have no
+activated ticket to match and are reported as skipped.
+
+Needs the configured Redis, PostgreSQL, Qdrant and LLM proxy. Customers are
+named bench-<run>-<pair>; leftover activated tickets expire with the
+checkpoint TTL or are removed by the retention sweeper.
+
+Usage:
+    # Run all pairs
+    python scripts/benchmark_ticket_matching.py
+
+    # Fail below 90% correct decisions, write JSON results
+    python scripts/benchmark_ticket_matching.py --min-accuracy 0.9 --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from libs.logger.logger import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+# (pair id, opener, second message, whether the second message continues the opener)
+PAIRS = [
+    (
+        "billing-refund",
+        "I was charged twice for my Pro subscription this month and need the duplicate "
+        "charge investigated by your billing team.",
+        "Any update on the duplicate charge? My bank statement still shows both payments.",
+        True,
+    ),
+    (
+        "technical-sync",
+        "Since yesterday's update our workspace files stop syncing after about ten minutes. "
+        "Restarting the desktop app only helps briefly.",
+        "Sync failed again this morning, I attached the desktop app logs from the last hour.",
+        True,
+    ),
+    (
+        "technical-sso",
+        "Our team cannot log in through SSO, Okta returns an invalid audience error for "
+        "every user in the organization.",
+        "We checked the Okta app settings again and the audience value matches your docs.",
+        True,
+    ),
+    (
+        "billing-then-password",
+        "The invoice for our 40 seats lists the wrong VAT number and our finance team "
+        "needs a corrected copy.",
+        "Separately, how do I change the email address on my personal account?",
+        False,
+    ),
+    (
+        "technical-then-feature",
+        "Exports to CSV time out for projects with more than 50k rows and the download "
+        "never starts.",
+        "Is there a dark mode planned for the mobile app?",
+        False,
+    ),
+]
+
+
+def build_ticket(customer_id: str, content: str):
+    """Build a single-message ticket without a ticket_id.
+
+    Args:
+        customer_id: Customer identifier.
+        content: Message content.
+
+    Returns:
+        Ticket.
+    """
+    from src.entities.ticket import CustomerInfo, Ticket, TicketMessage
+
+    return Ticket(
+        customer_id=customer_id,
+        customer_info=CustomerInfo(plan="pro", tenure_months=12, seats=40),
+        messages=[TicketMessage(role="customer", content=content)],
+    )
+
+
+async def triage(service, ticket, async_mode: bool) -> tuple[dict, float]:
+    """Triage a ticket and time it.
+
+    Args:
+        service: TriageService.
+        ticket: Ticket to triage (ticket_id is set to the resolved ID).
+        async_mode: Use ``atriage_ticket``.
+
+    Returns:
+        Tuple of (workflow result, seconds).
+    """
+    start = time.perf_counter()
+    if async_mode:
+        result = await service.atriage_ticket(ticket)
+    else:
+        result = await asyncio.to_thread(service.triage_ticket, ticket)
+    return result, time.perf_counter() - start
+
+
+async def thread_message_count(checkpointer, thread_id: str, async_mode: bool) -> int | None:
+    """Count messages in a thread's latest checkpoint.
+
+    Args:
+        checkpointer: LangGraph checkpointer.
+        thread_id: Checkpoint thread ID.
+        async_mode: Use ``aget_tuple``.
+
+    Returns:
+        Message count, or None if the checkpoint is gone (ticket completed).
+    """
+    config = {"configurable": {"thread_id": thread_id}}
+    try:
+        if async_mode:
+            checkpoint_tuple = await checkpointer.aget_tuple(config)
+        else:
+            checkpoint_tuple = await asyncio.to_thread(checkpointer.get_tuple, config)
+    except Exception as e:
+        logger.warning(f"Failed to read checkpoint {thread_id}: {e}")
+        return None
+    if checkpoint_tuple is None:
+        return None
+    return len(checkpoint_tuple.checkpoint.get("channel_values", {}).get("messages", []))
+
+
+async def run_pairs(pair_ids: set[str] | None) -> list[dict]:
+    """Run the conversation pairs.
+
+    Args:
+        pair_ids: Pairs to run (None = all).
+
+    Returns:
+        One result dict per pair.
+    """
+    from langgraph.checkpoint.redis import AsyncRedisSaver
+
+    from libs.configs.selector import ConfigSelector
+    from src.api.dependencies.triage import initialize_services
+    from src.entities.triage_result import RecommendedAction
+
+    settings = ConfigSelector.create(provider="dynaconf")
+    service, checkpointer, _, async_sql_client, _, _ = initialize_services(settings)
+    async_mode = isinstance(checkpointer, AsyncRedisSaver)
+    if async_mode:
+        await checkpointer.asetup()
+
+    run_id = uuid.uuid4().hex[:8]
+    results = []
+    try:
+        for pair_id, opener, second, related in PAIRS:
+            if pair_ids and pair_id not in pair_ids:
+                continue
+            customer_id = f"bench-{run_id}-{pair_id}"
+            entry = {"pair": pair_id, "related": related}
+
+            first_ticket = build_ticket(customer_id, opener)
+            first_result, entry["opener_seconds"] = await triage(service, first_ticket, async_mode)
+            entry["opener_ticket_id"] = first_ticket.ticket_id
+            triage_result = first_result.get("triage_result")
+            if (
+                triage_result is None
+                or triage_result.recommended_action != RecommendedAction.ROUTE_SPECIALIST
+            ):
+                action = triage_result.recommended_action.value if triage_result else "none"
+                entry["status"] = f"skipped (opener {action})"
+                results.append(entry)
+                continue
+
+            second_ticket = build_ticket(customer_id, second)
+            _, entry["second_seconds"] = await triage(service, second_ticket, async_mode)
+            entry["second_ticket_id"] = second_ticket.ticket_id
+            entry["reused"] = second_ticket.ticket_id == first_ticket.ticket_id
+            entry["thread_messages"] = await thread_message_count(
+                checkpointer, f"{customer_id}:{second_ticket.ticket_id}", async_mode
+            )
+            entry["status"] = "pass" if entry["reused"] == related else "FAIL"
+            results.append(entry)
+    finally:
+        service.shutdown()
+        if async_sql_client:
+            await async_sql_client.disconnect()
+
+    return results
+
+
+def main() -> int:
+    """Run the ticket matching benchmark.
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark follow-up ticket matching")
+    parser.add_argument(
+        "--pair",
+        action="append",
+        choices=[pair[0] for pair in PAIRS],
+        help="Run only this pair (repeatable)",
+    )
+    parser.add_argument(
+        "--min-accuracy",
+        type=float,
+        default=1.0,
+        help="Minimum share of correct match decisions among evaluated pairs (default: 1.0)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Path to write JSON results file",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="WARNING",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level (default: WARNING)",
+    )
+    args = parser.parse_args()
+
+    setup_logging(level=args.log_level)
+
+    try:
+        results = asyncio.run(run_pairs(set(args.pair) if args.pair else None))
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}", exc_info=True)
+        print(f"\nBenchmark failed: {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("Ticket Matching Benchmark")
+    print("=" * 60)
+    for entry in results:
+        expected = "same ticket" if entry["related"] else "new ticket"
+        print(f"\n{entry['pair']} (expected: {expected}): {entry['status']}")
+        print(f"  Opener:  {entry['opener_seconds']:.2f}s -> {entry['opener_ticket_id']}")
+        if "second_seconds" in entry:
+            print(
+                f"  Second:  {entry['second_seconds']:.2f}s -> {entry['second_ticket_id']} "
+                f"(thread messages: {entry['thread_messages']})"
+            )
+
+    evaluated = [entry for entry in results if "reused" in entry]
+    correct = [entry for entry in evaluated if entry["status"] == "pass"]
+    accuracy = len(correct) / len(evaluated) if evaluated else 0.0
+    followups = [entry for entry in evaluated if entry["related"] and entry["reused"]]
+
+    print("\n" + "=" * 60)
+    print(f"Evaluated pairs: {len(evaluated)}/{len(results)}")
+    print(f"Correct decisions: {len(correct)}/{len(evaluated)} ({accuracy:.0%})")
+    if followups:
+        print(
+            f"Median latency, matched follow-up: "
+            f"{median(entry['second_seconds'] for entry in followups):.2f}s "
+            f"vs cold opener: {median(entry['opener_seconds'] for entry in followups):.2f}s"
+        )
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w") as f:
+            json.dump(
+                {
+                    "timestamp": datetime.now().isoformat(),
+                    "accuracy": accuracy,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\nResults written to: {output_path}")
+
+    if not evaluated or accuracy < args.min_accuracy:
+        print(f"\nFAILED: accuracy below {args.min_accuracy:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
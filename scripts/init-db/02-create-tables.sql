@@ -4,8 +4,12 @@
 \c support_triage;
 
 -- Tickets table: stores ticket records and triage results
+-- Range-partitioned by month on created_at; partitions are created ahead and
+-- dropped after the retention period by PartitionRetentionService. Unique
+-- keys must include the partition key, so the primary key is
+-- (ticket_id, created_at) and writers keep a ticket's original created_at.
 CREATE TABLE IF NOT EXISTS tickets (
-    ticket_id VARCHAR(255) PRIMARY KEY,
+    ticket_id VARCHAR(255) NOT NULL,
     customer_id VARCHAR(255) NOT NULL,
     status VARCHAR(50) NOT NULL DEFAULT 'open',
     urgency VARCHAR(50),
@@ -14,13 +18,37 @@ CREATE TABLE IF NOT EXISTS tickets (
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
     closed_at TIMESTAMP,
 
+    PRIMARY KEY (ticket_id, created_at),
+
     CONSTRAINT chk_status CHECK (status IN ('open', 'closed', 'pending')),
     CONSTRAINT chk_urgency CHECK (urgency IN ('critical', 'high', 'medium', 'low'))
-);
+) PARTITION BY RANGE (created_at);
 
-CREATE INDEX IF NOT EXISTS idx_tickets_customer_id ON tickets(customer_id);
+CREATE INDEX IF NOT EXISTS idx_tickets_customer_created
+    ON tickets(customer_id, created_at DESC, ticket_id DESC);
+CREATE INDEX IF NOT EXISTS idx_tickets_customer_status
+    ON tickets(customer_id, status, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets(status);
 
+-- Triage analytics: filters on urgency / product area / action over a time range
+CREATE INDEX IF NOT EXISTS idx_tickets_urgency_created
+    ON tickets(urgency, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_tickets_product_area
+    ON tickets((triage_result->'extracted_info'->>'product_area'), created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_tickets_recommended_action
+    ON tickets((triage_result->>'recommended_action'), created_at DESC);
+-- Ad-hoc containment queries (triage_result @> '{...}')
+CREATE INDEX IF NOT EXISTS idx_tickets_triage_result
+    ON tickets USING GIN (triage_result jsonb_path_ops);
+
+-- Ticket ID registry: keeps ticket_id unique across tickets' partitions and
+-- pins each ticket's created_at (the partition key) for upserts. Rows of
+-- dropped partitions are removed by PartitionRetentionService.
+CREATE TABLE IF NOT EXISTS ticket_ids (
+    ticket_id VARCHAR(255) PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL
+);
+
 -- Customers table: stores customer master data
 -- Replaces data/customers.json with SQL-based storage
 CREATE TABLE IF NOT EXISTS customers (
@@ -42,17 +70,46 @@ CREATE INDEX IF NOT EXISTS idx_customers_plan ON customers(plan);
 
 -- Chat messages table: stores conversation history
 -- No foreign key to tickets table (tickets table removed)
+-- seq: position within the ticket's conversation (0-based)
+-- Range-partitioned by month on created_at, like tickets
 CREATE TABLE IF NOT EXISTS chat_messages (
     ticket_id VARCHAR(255) NOT NULL,
     customer_id VARCHAR(255) NOT NULL,
+    seq INTEGER NOT NULL,
     role VARCHAR(50) NOT NULL,
     content TEXT NOT NULL,
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
 
-    PRIMARY KEY (ticket_id, created_at),
+    PRIMARY KEY (ticket_id, seq, created_at),
 
     CONSTRAINT chk_role CHECK (role IN ('human', 'ai', 'system'))
-);
+) PARTITION BY RANGE (created_at);
 
 CREATE INDEX IF NOT EXISTS idx_chat_messages_customer_id ON chat_messages(customer_id);
 CREATE INDEX IF NOT EXISTS idx_chat_messages_ticket_id ON chat_messages(ticket_id);
+
+-- DEFAULT partitions catch rows outside every monthly partition (e.g. when
+-- maintenance has not run), so inserts never fail for a missing month.
+-- PartitionRetentionService moves such rows out when it creates their month.
+CREATE TABLE IF NOT EXISTS tickets_default PARTITION OF tickets DEFAULT;
+CREATE TABLE IF NOT EXISTS chat_messages_default PARTITION OF chat_messages DEFAULT;
+
+-- Monthly partitions for the current month and the next three
+DO $$
+DECLARE
+    parent TEXT;
+    month_start DATE;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['tickets', 'chat_messages'] LOOP
+        FOR i IN 0..3 LOOP
+            month_start := (date_trunc('month', LOCALTIMESTAMP) + make_interval(months => i))::date;
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                parent || '_p' || to_char(month_start, 'YYYYMM'),
+                parent,
+                month_start,
+                (month_start + INTERVAL '1 month')::date
+            );
+        END LOOP;
+    END LOOP;
+END $$;
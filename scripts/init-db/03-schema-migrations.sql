@@ -0,0 +1,17 @@
+-- Mark the migrations already included in 02-create-tables.sql as applied,
+-- so scripts/migrate.py only runs newer ones on a fresh database
+
+\c support_triage;
+
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(255) PRIMARY KEY,
+    applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO schema_migrations (version) VALUES
+    ('0001_chat_messages_seq'),
+    ('0002_ticket_history_indexes'),
+    ('0003_triage_result_indexes'),
+    ('0004_partition_tickets_and_messages'),
+    ('0005_ticket_ids')
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""Script to apply pending PostgreSQL schema migrations.
+
+Usage:
+    python scripts/migrate.py          # apply pending migrations
+    python scripts/migrate.py --list   # show pending migrations only
+
+Environment Variables:
+    POSTGRES_HOST: Database host (default: localhost)
+    POSTGRES_PORT: Database port (default: 5432)
+    POSTGRES_DB: Database name (default: support_triage)
+    POSTGRES_USER: Database user (default: postgres)
+    POSTGRES_PASSWORD: Database password (default: postgres)
+    LOG_LEVEL: Logging level (default: INFO)
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from libs.logger.logger import get_logger, setup_logging
+from libs.database.tabular.sql.selector import SQLClientSelector
+from libs.database.tabular.sql.migrations import MigrationRunner
+
+MIGRATIONS_DIR = project_root / "scripts" / "migrations"
+
+
+def main() -> int:
+    """Main entry point for schema migrations.
+
+    Returns:
+        Exit code (0 for success, 1 for failure).
+    """
+    parser = argparse.ArgumentParser(description="Apply PostgreSQL schema migrations")
+    parser.add_argument("--list", action="store_true", help="List pending migrations and exit")
+    args = parser.parse_args()
+
+    setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
+    logger = get_logger(__name__)
+
+    sql_client = SQLClientSelector.create(
+        provider="postgres",
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        database=os.getenv("POSTGRES_DB", "support_triage"),
+        user=os.getenv("POSTGRES_USER", "postgres"),
+        password=os.getenv("POSTGRES_PASSWORD", "postgres"),
+    )
+
+    try:
+        runner = MigrationRunner(sql_client, MIGRATIONS_DIR)
+        if args.list:
+            for path in runner.pending():
+                logger.info(f"Pending: {path.stem}")
+            return 0
+
+        runner.migrate()
+        return 0
+
+    except Exception as e:
+        logger.error(f"Migration failed: {e}", exc_info=True)
+        return 1
+
+    finally:
+        sql_client.disconnect()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
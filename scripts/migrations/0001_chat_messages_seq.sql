@@ -0,0 +1,21 @@
+-- Upgrade chat_messages to per-message ordering
+-- Databases created from 02-create-tables.sql already have this layout; the
+-- statements are no-ops there.
+
+ALTER TABLE chat_messages ADD COLUMN IF NOT EXISTS seq INTEGER;
+
+-- Number existing rows per ticket by timestamp (rows that shared a
+-- timestamp keep their physical order)
+UPDATE chat_messages AS m
+SET seq = numbered.seq
+FROM (
+    SELECT ctid, ROW_NUMBER() OVER (PARTITION BY ticket_id ORDER BY created_at, ctid) - 1 AS seq
+    FROM chat_messages
+) AS numbered
+WHERE m.ctid = numbered.ctid
+  AND m.seq IS NULL;
+
+ALTER TABLE chat_messages ALTER COLUMN seq SET NOT NULL;
+
+ALTER TABLE chat_messages DROP CONSTRAINT IF EXISTS chat_messages_pkey;
+ALTER TABLE chat_messages ADD PRIMARY KEY (ticket_id, seq);
@@ -0,0 +1,15 @@
+-- migrate:no-transaction
+-- Composite indexes for customer history and open-ticket lookups
+-- Built CONCURRENTLY so writes to tickets are not blocked on large tables.
+
+-- get_customer_history / get_customer_history_page:
+-- WHERE customer_id = ? ORDER BY created_at DESC, ticket_id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_customer_created
+    ON tickets (customer_id, created_at DESC, ticket_id DESC);
+
+-- get_open_tickets: WHERE customer_id = ? AND status = 'open' ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_customer_status
+    ON tickets (customer_id, status, created_at DESC);
+
+-- Both composites lead with customer_id, so the single-column index is redundant
+DROP INDEX CONCURRENTLY IF EXISTS idx_tickets_customer_id;
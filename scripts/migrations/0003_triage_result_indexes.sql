@@ -0,0 +1,24 @@
+-- migrate:no-transaction
+-- Analytics indexes on triage fields, plus the unique keys that
+-- 0004_partition_tickets_and_messages needs. Built CONCURRENTLY on the
+-- existing tables so 0004 can attach them instead of building them while
+-- holding its exclusive lock.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_urgency_created
+    ON tickets (urgency, created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_product_area
+    ON tickets ((triage_result->'extracted_info'->>'product_area'), created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_recommended_action
+    ON tickets ((triage_result->>'recommended_action'), created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_triage_result
+    ON tickets USING GIN (triage_result jsonb_path_ops);
+
+-- Partitioned primary keys must include the partition key (created_at)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS tickets_ticket_created_key
+    ON tickets (ticket_id, created_at);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS chat_messages_ticket_seq_created_key
+    ON chat_messages (ticket_id, seq, created_at);
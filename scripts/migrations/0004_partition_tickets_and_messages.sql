@@ -0,0 +1,110 @@
+-- Convert tickets and chat_messages to monthly range partitions on created_at
+--
+-- The existing tables are renamed to *_legacy and attached as one partition
+-- each, covering everything up to the end of the current month; no rows are
+-- copied. The retention job never drops the legacy partition (its range is
+-- unbounded); drop it by hand once its data is no longer needed. Indexes built
+-- by 0003 are attached, not rebuilt; ATTACH still scans each legacy table once
+-- to check its range. A DEFAULT partition per table takes rows no monthly
+-- partition covers, so inserts never fail for a missing month.
+
+-- === tickets ===
+
+ALTER TABLE tickets RENAME TO tickets_legacy;
+ALTER TABLE tickets_legacy RENAME CONSTRAINT tickets_pkey TO tickets_legacy_pkey;
+ALTER INDEX idx_tickets_customer_created RENAME TO tickets_legacy_customer_created;
+ALTER INDEX idx_tickets_customer_status RENAME TO tickets_legacy_customer_status;
+ALTER INDEX idx_tickets_status RENAME TO tickets_legacy_status;
+ALTER INDEX idx_tickets_urgency_created RENAME TO tickets_legacy_urgency_created;
+ALTER INDEX idx_tickets_product_area RENAME TO tickets_legacy_product_area;
+ALTER INDEX idx_tickets_recommended_action RENAME TO tickets_legacy_recommended_action;
+ALTER INDEX idx_tickets_triage_result RENAME TO tickets_legacy_triage_result;
+ALTER TABLE tickets_legacy
+    ADD CONSTRAINT tickets_legacy_ticket_created_key UNIQUE USING INDEX tickets_ticket_created_key;
+
+CREATE TABLE tickets (
+    ticket_id VARCHAR(255) NOT NULL,
+    customer_id VARCHAR(255) NOT NULL,
+    status VARCHAR(50) NOT NULL DEFAULT 'open',
+    urgency VARCHAR(50),
+    ticket_type VARCHAR(50),
+    triage_result JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    closed_at TIMESTAMP,
+
+    PRIMARY KEY (ticket_id, created_at),
+
+    CONSTRAINT chk_status CHECK (status IN ('open', 'closed', 'pending')),
+    CONSTRAINT chk_urgency CHECK (urgency IN ('critical', 'high', 'medium', 'low'))
+) PARTITION BY RANGE (created_at);
+
+CREATE INDEX idx_tickets_customer_created
+    ON tickets (customer_id, created_at DESC, ticket_id DESC);
+CREATE INDEX idx_tickets_customer_status
+    ON tickets (customer_id, status, created_at DESC);
+CREATE INDEX idx_tickets_status ON tickets (status);
+CREATE INDEX idx_tickets_urgency_created ON tickets (urgency, created_at DESC);
+CREATE INDEX idx_tickets_product_area
+    ON tickets ((triage_result->'extracted_info'->>'product_area'), created_at DESC);
+CREATE INDEX idx_tickets_recommended_action
+    ON tickets ((triage_result->>'recommended_action'), created_at DESC);
+CREATE INDEX idx_tickets_triage_result ON tickets USING GIN (triage_result jsonb_path_ops);
+
+ALTER TABLE tickets ATTACH PARTITION tickets_legacy
+    FOR VALUES FROM (MINVALUE) TO (date_trunc('month', LOCALTIMESTAMP) + INTERVAL '1 month');
+
+-- === chat_messages ===
+
+ALTER TABLE chat_messages RENAME TO chat_messages_legacy;
+ALTER TABLE chat_messages_legacy
+    RENAME CONSTRAINT chat_messages_pkey TO chat_messages_legacy_pkey;
+ALTER INDEX idx_chat_messages_customer_id RENAME TO chat_messages_legacy_customer_id;
+ALTER INDEX idx_chat_messages_ticket_id RENAME TO chat_messages_legacy_ticket_id;
+ALTER TABLE chat_messages_legacy
+    ADD CONSTRAINT chat_messages_legacy_ticket_seq_created_key
+    UNIQUE USING INDEX chat_messages_ticket_seq_created_key;
+
+CREATE TABLE chat_messages (
+    ticket_id VARCHAR(255) NOT NULL,
+    customer_id VARCHAR(255) NOT NULL,
+    seq INTEGER NOT NULL,
+    role VARCHAR(50) NOT NULL,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (ticket_id, seq, created_at),
+
+    CONSTRAINT chk_role CHECK (role IN ('human', 'ai', 'system'))
+) PARTITION BY RANGE (created_at);
+
+CREATE INDEX idx_chat_messages_customer_id ON chat_messages (customer_id);
+CREATE INDEX idx_chat_messages_ticket_id ON chat_messages (ticket_id);
+
+ALTER TABLE chat_messages ATTACH PARTITION chat_messages_legacy
+    FOR VALUES FROM (MINVALUE) TO (date_trunc('month', LOCALTIMESTAMP) + INTERVAL '1 month');
+
+-- === DEFAULT partitions ===
+
+CREATE TABLE tickets_default PARTITION OF tickets DEFAULT;
+CREATE TABLE chat_messages_default PARTITION OF chat_messages DEFAULT;
+
+-- === Partitions for the next three months ===
+
+DO $$
+DECLARE
+    parent TEXT;
+    month_start DATE;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['tickets', 'chat_messages'] LOOP
+        FOR i IN 1..3 LOOP
+            month_start := (date_trunc('month', LOCALTIMESTAMP) + make_interval(months => i))::date;
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                parent || '_p' || to_char(month_start, 'YYYYMM'),
+                parent,
+                month_start,
+                (month_start + INTERVAL '1 month')::date
+            );
+        END LOOP;
+    END LOOP;
+END $$;
@@ -0,0 +1,20 @@
+-- Keep ticket_id unique across the partitions of tickets
+--
+-- A partitioned table's unique keys must include the partition key, so the
+-- tickets primary key is (ticket_id, created_at). ticket_ids is not
+-- partitioned: its primary key makes ticket_id unique, and the ticket upsert
+-- claims (or locks) a ticket's row here before writing tickets, so two first
+-- saves of one ticket agree on its created_at instead of racing.
+--
+-- Deploy the new ticket upsert right after this migration. Tickets first saved
+-- by the old code in between are not registered; re-run the INSERT below
+-- (it skips registered tickets) once the new code is live.
+
+CREATE TABLE ticket_ids (
+    ticket_id VARCHAR(255) PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL
+);
+
+INSERT INTO ticket_ids (ticket_id, created_at)
+SELECT ticket_id, MIN(created_at) FROM tickets GROUP BY ticket_id
+ON CONFLICT (ticket_id) DO NOTHING;
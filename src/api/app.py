@@ -1,8 +1,10 @@
 """FastAPI application factory."""
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from langgraph.checkpoint.redis import AsyncRedisSaver
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.routes import health, triage
@@ -23,16 +25,79 @@ def create_app(settings: BaseConfigManager) -> FastAPI:
         Configured FastAPI application instance.
     """
 
+    async def sweep_checkpoints(retention_service, interval: float) -> None:
+        """Periodically sweep abandoned tickets off the event loop."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(retention_service.sweep)
+            except Exception as e:
+                logger.error(f"Checkpoint sweep failed: {e}")
+
+    async def drain_persistence(persistence_service) -> None:
+        """Write queued completed tickets to PostgreSQL off the event loop."""
+        while True:
+            try:
+                # Blocks up to block_ms in the worker thread when idle
+                await asyncio.to_thread(persistence_service.drain)
+            except Exception as e:
+                logger.error(f"Persistence drain failed: {e}")
+                await asyncio.sleep(1)
+
+    async def maintain_partitions(partition_service, interval: float) -> None:
+        """Create upcoming and drop expired table partitions, starting now."""
+        while True:
+            try:
+                await asyncio.to_thread(partition_service.run)
+            except Exception as e:
+                logger.error(f"Partition maintenance failed: {e}")
+            await asyncio.sleep(interval)
+
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         """Application lifespan manager."""
         logger.info("Starting up application...")
-        triage_service, checkpointer = initialize_services(settings)
+        (
+            triage_service,
+            checkpointer,
+            retention_service,
+            async_sql_client,
+            persistence_service,
+            partition_service,
+        ) = initialize_services(settings)
         app.state.triage_service = triage_service
         app.state.checkpointer = checkpointer
+        # Async checkpointer: set up on this loop and triage via atriage_ticket
+        app.state.async_triage = isinstance(checkpointer, AsyncRedisSaver)
+        if app.state.async_triage:
+            await checkpointer.asetup()
+
+        sweeper = None
+        if retention_service:
+            interval = float(
+                settings.triage.checkpoint.retention.get("sweep_interval_seconds", 600)
+            )
+            sweeper = asyncio.create_task(sweep_checkpoints(retention_service, interval))
+        persister = None
+        if persistence_service:
+            persister = asyncio.create_task(drain_persistence(persistence_service))
+        partitioner = None
+        if partition_service:
+            interval = float(settings.triage.partitions.get("check_interval_seconds", 3600))
+            partitioner = asyncio.create_task(maintain_partitions(partition_service, interval))
         logger.info("Services initialized")
         yield
         logger.info("Shutting down application...")
+        if sweeper:
+            sweeper.cancel()
+        if persister:
+            # Queued jobs are durable; the next start (or another worker) drains them
+            persister.cancel()
+        if partitioner:
+            partitioner.cancel()
+        triage_service.shutdown()
+        if async_sql_client:
+            await async_sql_client.disconnect()
 
     app = FastAPI(
         title="Support Ticket Triage API",
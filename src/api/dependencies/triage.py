@@ -1,6 +1,7 @@
 """Triage service dependency initialization."""
 
 import os
+from typing import Optional
 
 from langgraph.checkpoint.redis import RedisSaver
 
@@ -10,19 +11,34 @@ from src.modules.agents.specialists.billing.main import BillingAgent
 from src.modules.agents.specialists.technical.main import TechnicalAgent
 from src.modules.agents.specialists.general.main import GeneralAgent
 from src.modules.agents.ticket_matcher.main import TicketMatcherAgent
+from src.modules.agents.ticket_matcher.prematch import EmbeddingTicketPrematcher
 from src.modules.agents.specialists.tools.kb_retrieval import KBRetrievalTool
 from src.modules.agents.supervisor.tools.customer_lookup import CustomerLookupTool
+from src.modules.agents.supervisor.tools.customer_cache import CustomerCache
 from src.modules.agents.ticket_matcher.tools.ticket_summarize import TicketSummarizeTool
 from src.modules.graph.workflow import MultiAgentWorkflow
 from src.repositories.checkpoint.main import CheckpointRepository
 from src.repositories.ticket.main import TicketRepository
 from src.repositories.chat.main import ChatRepository
+from src.repositories.unit_of_work.main import TicketUnitOfWork
+from src.repositories.persistence_queue.main import PersistenceQueueRepository
+from src.repositories.partition.main import PartitionRepository
 from src.usecases.triage.main import TriageService
+from src.usecases.retention.main import CheckpointRetentionService
+from src.usecases.persistence.main import TicketPersistenceService
+from src.usecases.partition_retention.main import PartitionRetentionService
+from libs.database.tabular.sql.base import BaseAsyncSQLClient
 from libs.database.tabular.sql.selector import SQLClientSelector
 from libs.database.keyvalue_db.selector import KeyValueClientSelector
+from libs.database.keyvalue_db.redis.checkpointer import (
+    TrackedAsyncRedisSaver,
+    TrackedRedisSaver,
+)
+from libs.database.keyvalue_db.redis.serializer import CompactRedisSerializer
 from libs.llm.client.selector import LLMClientSelector
 from libs.llm.observability.selector import ObservabilitySelector
 from libs.llm.prompt_manager.selector import PromptManagerSelector
+from libs.llm.reranker.selector import RerankerSelector
 from libs.database.vector.selector import VectorStoreSelector
 from libs.configs.base import BaseConfigManager
 from libs.logger.logger import get_logger
@@ -32,19 +48,37 @@ logger = get_logger(__name__)
 
 def initialize_services(
     settings: BaseConfigManager,
-) -> tuple[TriageService, RedisSaver]:
+) -> tuple[
+    TriageService,
+    RedisSaver,
+    Optional[CheckpointRetentionService],
+    Optional[BaseAsyncSQLClient],
+    Optional[TicketPersistenceService],
+    Optional[PartitionRetentionService],
+]:
     """Initialize and return the triage service.
 
     Creates:
-    - Repositories: CheckpointRepository, TicketRepository, ChatRepository
+    - Repositories: CheckpointRepository, TicketRepository, ChatRepository,
+      TicketUnitOfWork, PersistenceQueueRepository (write-behind mode)
     - Workflow: MultiAgentWorkflow (translator → supervisor → specialists)
-    - Services: TriageService
+    - Services: TriageService, CheckpointRetentionService (if enabled),
+      TicketPersistenceService (write-behind mode),
+      PartitionRetentionService (if enabled)
 
     Args:
         settings: Application configuration manager.
 
+    With ``triage.checkpoint.mode: async`` the checkpointer is a
+    ``TrackedAsyncRedisSaver``: call from a running event loop, then
+    ``await checkpointer.asetup()`` and use ``TriageService.atriage_ticket``.
+    Repositories and the customer lookup tool also get an async PostgreSQL
+    client, which the caller closes on shutdown.
+
     Returns:
-        Tuple of (TriageService, RedisSaver checkpointer).
+        Tuple of (TriageService, RedisSaver checkpointer, retention service
+        or None, async SQL client or None, persistence worker or None,
+        partition retention service or None).
     """
 
     logger.info("Initializing LLM clients...")
@@ -69,14 +103,34 @@ def initialize_services(
     )
 
     logger.info("Initializing vector store...")
+    # persist_dir only applies to the numpy provider
+    vectordb_options = {}
+    if settings.agent_shared.vectordb.get("persist_dir"):
+        vectordb_options["persist_dir"] = settings.agent_shared.vectordb.persist_dir
+    search_mode = settings.triage.vectordb.get("search_mode", "dense")
+    # The sparse model is downloaded and loaded at startup; only hybrid search uses it
+    if search_mode == "hybrid":
+        vectordb_options["sparse_model"] = settings.agent_shared.vectordb.get("sparse_model")
+
     vector_store = VectorStoreSelector.create(
         provider=settings.agent_shared.vectordb.provider,
         host=settings.agent_shared.vectordb.host,
         port=int(settings.agent_shared.vectordb.port),
         collection_name=settings.triage.vectordb.collection_name,
         vector_size=int(settings.agent_shared.vectordb.vector_size),
+        **vectordb_options,
     )
 
+    reranker = None
+    rerank_config = settings.triage.get("reranker", {})
+    rerank_candidates = int(rerank_config.get("candidates", 20))
+    if rerank_config.get("enabled", False):
+        logger.info("Initializing reranker...")
+        reranker = RerankerSelector.create(
+            provider=rerank_config.get("provider", "fastembed"),
+            model_name=rerank_config.get("model", "Xenova/ms-marco-MiniLM-L-6-v2"),
+        )
+
     logger.info("Initializing observability (Langfuse)...")
     observability = ObservabilitySelector.create(provider="langfuse")
 
@@ -86,15 +140,62 @@ def initialize_services(
     logger.info("Initializing Redis client...")
     redis_host = os.getenv("REDIS_HOST", "redis")
     redis_port = int(os.getenv("REDIS_PORT", "6379"))
-    kv_client = KeyValueClientSelector.create(
-        provider="redis",
-        host=redis_host,
-        port=redis_port,
-        decode_responses=True,
+    redis_config = settings.agent_shared.get("redis", {})
+    redis_options = {
+        "host": redis_host,
+        "port": redis_port,
+        "decode_responses": True,
+        "max_connections": int(redis_config.get("max_connections", 50)),
+        "socket_timeout": redis_config.get("socket_timeout", 5.0),
+        "socket_connect_timeout": redis_config.get("socket_connect_timeout", 5.0),
+        "socket_keepalive": redis_config.get("socket_keepalive", True),
+        "health_check_interval": int(redis_config.get("health_check_interval", 30)),
+    }
+    kv_client = KeyValueClientSelector.create(provider="redis", **redis_options)
+
+    # LangGraph savers need the raw redis client; the tracked variants
+    # record each thread's keys so cleanup can UNLINK them without SCAN
+    checkpoint_config = settings.triage.get("checkpoint", {})
+    checkpoint_ttl = None
+    if checkpoint_config.get("ttl_minutes"):
+        # TTL refreshed on every read/write of the thread (i.e. on activity)
+        checkpoint_ttl = {
+            "default_ttl": float(checkpoint_config.ttl_minutes),
+            "refresh_on_read": True,
+        }
+    compact_config = checkpoint_config.get("compact", {})
+    checkpoint_serde = CompactRedisSerializer(
+        enabled=compact_config.get("enabled", False),
+        level=int(compact_config.get("level", 3)),
+        min_size=int(compact_config.get("min_size", 256)),
+        log_every=int(compact_config.get("log_every", 0)),
     )
-    # LangGraph RedisSaver needs raw redis.Redis client
-    checkpointer = RedisSaver(redis_client=kv_client.get_raw_client())
-    checkpointer.setup()
+    saver_options = {
+        "ttl": checkpoint_ttl,
+        "serde": checkpoint_serde,
+        "shared_channels": list(checkpoint_config.get("shared_channels", [])),
+        "keep_last": (
+            int(checkpoint_config.keep_last)
+            if checkpoint_config.get("keep_last") else None
+        ),
+    }
+    async_kv_client = None
+    if checkpoint_config.get("mode", "sync") == "async":
+        # Async saver for TriageService.atriage_ticket; created inside the
+        # running loop, set up by the caller with `await checkpointer.asetup()`
+        async_kv_client = KeyValueClientSelector.create(
+            provider="redis_async", **redis_options
+        )
+        checkpointer = TrackedAsyncRedisSaver(
+            redis_client=async_kv_client.get_raw_client(),
+            **saver_options,
+        )
+    else:
+        checkpointer = TrackedRedisSaver(
+            redis_client=kv_client.get_raw_client(),
+            **saver_options,
+        )
+        checkpointer.setup()
 
     logger.info("Initializing PostgreSQL client...")
     postgres_host = os.getenv("POSTGRES_HOST", "postgres")
@@ -103,6 +204,8 @@ def initialize_services(
     postgres_user = os.getenv("POSTGRES_USER", "postgres")
     postgres_password = os.getenv("POSTGRES_PASSWORD", "postgres")
 
+    postgres_config = settings.agent_shared.get("postgres", {})
+
     sql_client = SQLClientSelector.create(
         provider="postgres",
         host=postgres_host,
@@ -110,16 +213,61 @@ def initialize_services(
         database=postgres_db,
         user=postgres_user,
         password=postgres_password,
+        pool=postgres_config.get("pool", False),
+        pool_min_size=int(postgres_config.get("pool_min_size", 1)),
+        pool_max_size=int(postgres_config.get("pool_max_size", 10)),
+        pool_timeout=float(postgres_config.get("pool_timeout", 30.0)),
+        health_check_interval=int(postgres_config.get("health_check_interval", 30)),
     )
 
+    async_sql_client = None
+    if checkpoint_config.get("mode", "sync") == "async":
+        # Async pool for persistence and customer lookup on the event loop;
+        # opened on first use, closed by the caller with `await disconnect()`
+        async_sql_client = SQLClientSelector.create(
+            provider="postgres_async",
+            host=postgres_host,
+            port=int(postgres_port),
+            database=postgres_db,
+            user=postgres_user,
+            password=postgres_password,
+            pool_min_size=int(postgres_config.get("pool_min_size", 1)),
+            pool_max_size=int(postgres_config.get("pool_max_size", 10)),
+            pool_timeout=float(postgres_config.get("pool_timeout", 30.0)),
+            prepare_threshold=postgres_config.get("prepare_threshold", 5),
+        )
+
     # === Create Repositories ===
     logger.info("Creating repositories...")
     checkpoint_repo = CheckpointRepository(
         checkpointer=checkpointer,
         kv_client=kv_client,
+        unlink_batch_size=int(checkpoint_config.get("unlink_batch_size", 500)),
+        ttl_seconds=(
+            int(float(checkpoint_config.ttl_minutes) * 60)
+            if checkpoint_config.get("ttl_minutes")
+            else None
+        ),
+        # Only the retention sweeper reads (and drains) the activity index
+        track_activity=checkpoint_config.get("retention", {}).get("enabled", False),
+    )
+    ticket_repo = TicketRepository(db_client=sql_client, async_db_client=async_sql_client)
+    chat_repo = ChatRepository(db_client=sql_client, async_db_client=async_sql_client)
+    unit_of_work = TicketUnitOfWork(
+        db_client=sql_client,
+        async_db_client=async_sql_client,
+        max_statement_rows=int(postgres_config.get("max_statement_rows", 1000)),
     )
-    ticket_repo = TicketRepository(db_client=sql_client)
-    chat_repo = ChatRepository(db_client=sql_client)
+    persistence_config = settings.triage.get("persistence", {})
+    persistence_queue = None
+    if persistence_config.get("mode", "inline") == "write_behind":
+        persistence_queue = PersistenceQueueRepository(
+            kv_client=kv_client,
+            stream_key=persistence_config.get("stream_key", "triage:persistence"),
+            dead_letter_key=persistence_config.get(
+                "dead_letter_key", "triage:persistence:dead"
+            ),
+        )
 
     # === Create Agents ===
     agent_configs = settings.triage.agents
@@ -135,7 +283,32 @@ def initialize_services(
 
     # SupervisorAgent with customer_lookup tool
     logger.info("Creating SupervisorAgent...")
-    customer_tool = CustomerLookupTool(db_client=sql_client)
+    customer_cache = None
+    cache_config = settings.triage.get("customer_cache", {})
+    if cache_config.get("enabled", False):
+        use_redis = cache_config.get("redis", True)
+        customer_cache = CustomerCache(
+            db_client=sql_client,
+            async_db_client=async_sql_client,
+            kv_client=kv_client if use_redis else None,
+            async_kv_client=async_kv_client if use_redis else None,
+            ttl_seconds=float(cache_config.get("ttl_seconds", 60)),
+            max_entries=int(cache_config.get("max_entries", 10000)),
+            redis_ttl_seconds=int(cache_config.get("redis_ttl_seconds", 3600)),
+        )
+        warm_config = cache_config.get("warm", {})
+        if warm_config.get("enabled", False):
+            try:
+                customer_cache.warm(
+                    limit=int(warm_config.get("limit", 1000)),
+                    plans=list(warm_config.get("plans") or []) or None,
+                )
+            except Exception as e:
+                # Cold cache only costs round trips; do not block startup
+                logger.warning(f"Customer cache warmup failed: {e}")
+    customer_tool = CustomerLookupTool(
+        db_client=sql_client, async_db_client=async_sql_client, cache=customer_cache
+    )
     supervisor_agent = SupervisorAgent(
         llm=llm,
         tools=[customer_tool],
@@ -150,6 +323,9 @@ def initialize_services(
         vector_store=vector_store,
         llm=embedding_client,
         category_filter=agent_configs.billing.get("category_filter", "billing"),
+        search_mode=search_mode,
+        reranker=reranker,
+        rerank_candidates=rerank_candidates,
     )
     billing_agent = BillingAgent(
         llm=llm,
@@ -165,6 +341,9 @@ def initialize_services(
         vector_store=vector_store,
         llm=embedding_client,
         category_filter=agent_configs.technical.get("category_filter", "technical"),
+        search_mode=search_mode,
+        reranker=reranker,
+        rerank_candidates=rerank_candidates,
     )
     technical_agent = TechnicalAgent(
         llm=llm,
@@ -180,6 +359,9 @@ def initialize_services(
         vector_store=vector_store,
         llm=embedding_client,
         category_filter=agent_configs.general.get("category_filter", "general"),
+        search_mode=search_mode,
+        reranker=reranker,
+        rerank_candidates=rerank_candidates,
     )
     general_agent = GeneralAgent(
         llm=llm,
@@ -198,9 +380,23 @@ def initialize_services(
         agent_config=agent_configs.get("ticket_matcher", {}),
     )
 
+    # Embedding pre-matcher: the LLM matcher only decides ambiguous messages
+    ticket_prematcher = None
+    prematch_config = settings.triage.get("ticket_matching", {}).get("embedding", {})
+    if prematch_config.get("enabled", False):
+        dimensions = prematch_config.get("dimensions")
+        ticket_prematcher = EmbeddingTicketPrematcher(
+            embedding_client=embedding_client,
+            match_threshold=float(prematch_config.get("match_threshold", 0.75)),
+            reject_threshold=float(prematch_config.get("reject_threshold", 0.25)),
+            margin=float(prematch_config.get("margin", 0.05)),
+            min_words=int(prematch_config.get("min_words", 5)),
+            dimensions=int(dimensions) if dimensions else None,
+        )
+
     # TicketSummarizeTool (used by TriageService for summarizing activated tickets)
     logger.info("Creating TicketSummarizeTool...")
-    ticket_summarize_tool = TicketSummarizeTool(kv_client=kv_client)
+    ticket_summarize_tool = TicketSummarizeTool(checkpointer=checkpointer)
 
     # === Create Workflow ===
     logger.info("Creating MultiAgentWorkflow...")
@@ -216,6 +412,7 @@ def initialize_services(
 
     # === Create Services ===
     logger.info("Creating TriageService...")
+    summarize_config = settings.triage.get("ticket_matching", {}).get("summarize", {})
     triage_service = TriageService(
         workflow=workflow,
         checkpoint_repo=checkpoint_repo,
@@ -223,7 +420,60 @@ def initialize_services(
         chat_repo=chat_repo,
         ticket_matcher_agent=ticket_matcher_agent,
         ticket_summarize_tool=ticket_summarize_tool,
+        ticket_prematcher=ticket_prematcher,
+        trust_supplied_ticket_id=settings.triage.get("ticket_matching", {}).get(
+            "trust_supplied_ticket_id", False
+        ),
+        summary_workers=summarize_config.get("max_workers", 4),
+        summary_deadline_seconds=summarize_config.get("deadline_seconds"),
+        background_cleanup=checkpoint_config.get("background_cleanup", False),
+        unit_of_work=unit_of_work,
+        persistence_queue=persistence_queue,
     )
 
+    persistence_service = None
+    if persistence_queue is not None:
+        logger.info("Creating TicketPersistenceService...")
+        persistence_service = TicketPersistenceService(
+            queue_repo=persistence_queue,
+            unit_of_work=unit_of_work,
+            checkpoint_repo=checkpoint_repo,
+            batch_size=int(persistence_config.get("batch_size", 50)),
+            block_ms=int(persistence_config.get("block_ms", 1000)),
+            claim_idle_seconds=float(persistence_config.get("claim_idle_seconds", 60)),
+            max_deliveries=int(persistence_config.get("max_deliveries", 5)),
+        )
+
+    retention_service = None
+    retention_config = checkpoint_config.get("retention", {})
+    if retention_config.get("enabled", False):
+        logger.info("Creating CheckpointRetentionService...")
+        retention_service = CheckpointRetentionService(
+            checkpoint_repo=checkpoint_repo,
+            ticket_repo=ticket_repo,
+            chat_repo=chat_repo,
+            abandon_after_seconds=float(retention_config.abandon_after_minutes) * 60,
+            batch_size=int(retention_config.get("batch_size", 100)),
+            unit_of_work=unit_of_work,
+        )
+
+    partition_service = None
+    partitions_config = settings.triage.get("partitions", {})
+    if partitions_config.get("enabled", False):
+        logger.info("Creating PartitionRetentionService...")
+        retention_months = partitions_config.get("retention_months")
+        partition_service = PartitionRetentionService(
+            partition_repo=PartitionRepository(db_client=sql_client),
+            premake_months=int(partitions_config.get("premake_months", 3)),
+            retention_months=int(retention_months) if retention_months else None,
+        )
+
     logger.info("Service initialization complete")
-    return triage_service, checkpointer
+    return (
+        triage_service,
+        checkpointer,
+        retention_service,
+        async_sql_client,
+        persistence_service,
+        partition_service,
+    )
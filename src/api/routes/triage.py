@@ -34,7 +34,10 @@ async def triage_ticket(ticket: Ticket, request: Request) -> TriageResult:
         logger.info(f"Received triage request for ticket: {ticket.ticket_id}")
 
         triage_service = request.app.state.triage_service
-        result = triage_service.triage_ticket(ticket)
+        if request.app.state.async_triage:
+            result = await triage_service.atriage_ticket(ticket)
+        else:
+            result = triage_service.triage_ticket(ticket)
 
         if result.get("triage_result") is None:
             raise HTTPException(
@@ -15,6 +15,7 @@ class ChatMessage(BaseModel):
     Attributes:
         id: Database primary key (auto-generated).
         ticket_id: Associated ticket identifier.
+        seq: Position within the ticket's conversation (0-based).
         role: Message sender role (human/ai).
         content: Message content text.
         metadata: Optional metadata as JSON.
@@ -23,6 +24,7 @@ class ChatMessage(BaseModel):
 
     id: Optional[int] = Field(default=None, description="Database primary key")
     ticket_id: str = Field(..., description="Associated ticket identifier")
+    seq: int = Field(default=0, description="Position within the conversation")
     role: str = Field(..., description="Message sender: 'human' or 'ai'")
     content: str = Field(..., description="Message content")
     metadata: Optional[dict] = Field(default=None, description="Optional metadata")
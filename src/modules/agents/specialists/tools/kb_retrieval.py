@@ -6,6 +6,7 @@ from typing import Type, Any, Optional
 
 from libs.database.vector.base import BaseVectorStore
 from libs.llm.client.base import BaseLLM
+from libs.llm.reranker.base import BaseReranker
 from libs.logger.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,12 +28,25 @@ class KBRetrievalTool(BaseTool):
     Supports optional category filtering to search domain-specific content
     (billing, technical, general).
 
+    Search modes:
+    - dense: Embedding similarity only
+    - hybrid: Dense + sparse (BM25) fused with reciprocal-rank fusion, so exact
+      error codes, SKUs and product names are not missed. Falls back to dense
+      if the vector store cannot run a hybrid query.
+
+    With a reranker, the tool over-fetches ``rerank_candidates`` results and
+    reorders them with a cross-encoder before returning top_k, so the agent
+    gets precise top results and needs fewer repeated searches.
+
     Attributes:
         name: Tool name for LangChain.
         description: Tool description for the LLM.
         vector_store: Vector store client for search (injected).
         llm: LLM client for query embedding (injected).
         category_filter: Optional category to filter results by.
+        search_mode: "dense" or "hybrid".
+        reranker: Optional cross-encoder reranker (injected).
+        rerank_candidates: Number of candidates fetched for reranking.
     """
 
     name: str = "kb_search"
@@ -45,12 +59,18 @@ class KBRetrievalTool(BaseTool):
     vector_store: Any = None
     llm: Any = None
     category_filter: Optional[str] = None
+    search_mode: str = "dense"
+    reranker: Any = None
+    rerank_candidates: int = 20
 
     def __init__(
         self,
         vector_store: BaseVectorStore,
         llm: BaseLLM,
         category_filter: Optional[str] = None,
+        search_mode: str = "dense",
+        reranker: Optional[BaseReranker] = None,
+        rerank_candidates: int = 20,
         **kwargs,
     ):
         """Initialize KB retrieval tool.
@@ -59,12 +79,24 @@ class KBRetrievalTool(BaseTool):
             vector_store: Vector store client for KB search.
             llm: LLM client with embedding capability.
             category_filter: Optional category to filter by (billing, technical, general).
+            search_mode: "dense" or "hybrid" (dense + BM25 with RRF).
+            reranker: Optional reranker applied to over-fetched candidates.
+            rerank_candidates: Candidates fetched when reranking (e.g. 20).
             **kwargs: Additional arguments passed to BaseTool.
+
+        Raises:
+            ValueError: If search_mode is unknown.
         """
         super().__init__(**kwargs)
+        if search_mode not in ("dense", "hybrid"):
+            raise ValueError(f"Unknown search_mode '{search_mode}'")
+
         self.vector_store = vector_store
         self.llm = llm
         self.category_filter = category_filter
+        self.search_mode = search_mode
+        self.reranker = reranker
+        self.rerank_candidates = rerank_candidates
 
         if category_filter:
             logger.info(f"KBRetrievalTool initialized with category filter: {category_filter}")
@@ -93,12 +125,12 @@ class KBRetrievalTool(BaseTool):
         if self.category_filter:
             search_filter = {"category": self.category_filter}
 
-        # Search vector store
-        results = self.vector_store.search(
-            query_embedding=query_embedding,
-            k=top_k,
-            filter=search_filter,
-        )
+        # Search vector store (over-fetch when a reranker will reorder results)
+        fetch_k = max(top_k, self.rerank_candidates) if self.reranker else top_k
+        results = self._search(query, query_embedding, fetch_k, search_filter)
+
+        if self.reranker and results:
+            results = self._rerank(query, results, top_k)
 
         if not results:
             return "No relevant articles found."
@@ -117,3 +149,65 @@ class KBRetrievalTool(BaseTool):
             )
 
         return "\n\n---\n\n".join(formatted)
+
+    def _rerank(self, query: str, results: list[dict], top_k: int) -> list[dict]:
+        """Reorder results with the reranker and keep top_k.
+
+        Args:
+            query: Raw query text.
+            results: Candidate search results.
+            top_k: Number of results to keep.
+
+        Returns:
+            Top-k results with reranker scores. Falls back to the original
+            order if reranking fails.
+        """
+        texts = [r.get("text", r.get("metadata", {}).get("text", "")) for r in results]
+        try:
+            scores = self.reranker.rerank(query, texts)
+        except Exception as e:
+            logger.warning(f"Rerank failed, using retrieval order: {e}")
+            return results[:top_k]
+
+        reranked = sorted(
+            ({**r, "score": score} for r, score in zip(results, scores)),
+            key=lambda r: r["score"],
+            reverse=True,
+        )
+        logger.info(f"Reranked {len(results)} candidates to top {top_k}")
+        return reranked[:top_k]
+
+    def _search(
+        self,
+        query: str,
+        query_embedding: list[float],
+        top_k: int,
+        search_filter: Optional[dict],
+    ) -> list[dict]:
+        """Run dense or hybrid search depending on search_mode.
+
+        Args:
+            query: Raw query text (used for sparse encoding).
+            query_embedding: Dense query embedding.
+            top_k: Number of results to return.
+            search_filter: Optional metadata filter.
+
+        Returns:
+            List of search results.
+        """
+        if self.search_mode == "hybrid" and hasattr(self.vector_store, "hybrid_search"):
+            try:
+                return self.vector_store.hybrid_search(
+                    query_embedding=query_embedding,
+                    query_text=query,
+                    k=top_k,
+                    filter=search_filter,
+                )
+            except Exception as e:
+                logger.warning(f"Hybrid search failed, falling back to dense: {e}")
+
+        return self.vector_store.search(
+            query_embedding=query_embedding,
+            k=top_k,
+            filter=search_filter,
+        )
@@ -0,0 +1,343 @@
+"""Read-through cache for customer records used by customer_lookup."""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from libs.database.keyvalue_db.base import BaseAsyncKeyValueClient, BaseKeyValueClient
+from libs.database.tabular.sql.base import BaseAsyncSQLClient, BaseSQLClient
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+CUSTOMER_COLUMNS = "id, name, email, plan, tenure_months, region, seats, notes"
+
+CUSTOMER_LOOKUP_SQL = f"""
+    SELECT {CUSTOMER_COLUMNS}
+    FROM customers
+    WHERE id = %s
+"""
+
+CUSTOMER_CACHE_PREFIX = "customer"
+
+
+class TTLCache:
+    """Thread-safe in-process LRU cache with per-entry expiry.
+
+    Attributes:
+        ttl_seconds: Lifetime of an entry.
+        max_entries: Entries kept before the least recently used is evicted.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry.
+            max_entries: Entries kept before the least recently used is evicted.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry and mark it recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store an entry, evicting the least recently used past capacity.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Drop an entry if present.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries (expired ones included until touched)."""
+        return len(self._entries)
+
+
+class CustomerCache:
+    """Read-through cache of customer rows keyed by customer_id.
+
+    Lookups try the in-process TTL LRU, then Redis (shared by all
+    instances), then PostgreSQL, filling the tiers above on the way back.
+    Customer data changes rarely, so entries live for minutes (local) to an
+    hour (Redis); call ``invalidate`` after changing a customer row.
+
+    Attributes:
+        db_client: SQL client for misses.
+        async_db_client: Async SQL client for ``aget`` misses (optional).
+        kv_client: Redis client for the shared tier (optional).
+        async_kv_client: Async Redis client for ``aget`` (optional).
+        redis_ttl_seconds: Lifetime of Redis entries.
+    """
+
+    def __init__(
+        self,
+        db_client: BaseSQLClient,
+        async_db_client: Optional[BaseAsyncSQLClient] = None,
+        kv_client: Optional[BaseKeyValueClient] = None,
+        async_kv_client: Optional[BaseAsyncKeyValueClient] = None,
+        ttl_seconds: float = 60,
+        max_entries: int = 10000,
+        redis_ttl_seconds: int = 3600,
+    ):
+        """Initialize customer cache.
+
+        Args:
+            db_client: SQL client for misses.
+            async_db_client: Async SQL client for ``aget`` misses; without
+                it the sync lookup runs in a worker thread.
+            kv_client: Redis client for the shared tier; None disables it.
+            async_kv_client: Async Redis client used by ``aget``; without it
+                the Redis tier is read in a worker thread.
+            ttl_seconds: Lifetime of in-process entries.
+            max_entries: In-process entries kept (LRU eviction).
+            redis_ttl_seconds: Lifetime of Redis entries.
+        """
+        self.db_client = db_client
+        self.async_db_client = async_db_client
+        self.kv_client = kv_client
+        self.async_kv_client = async_kv_client
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._local = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+
+        logger.info(
+            f"CustomerCache initialized (ttl={ttl_seconds}s, max_entries={max_entries}, "
+            f"redis={'on' if kv_client else 'off'})"
+        )
+
+    def get(self, customer_id: str) -> Optional[dict]:
+        """Get a customer row.
+
+        Args:
+            customer_id: Customer ID.
+
+        Returns:
+            Customer row, or None if the customer does not exist.
+        """
+        customer = self._local.get(customer_id)
+        if customer is not None:
+            self._stats["local_hits"] += 1
+            return customer
+
+        customer = self._redis_get(customer_id)
+        if customer is not None:
+            self._stats["redis_hits"] += 1
+            self._local.set(customer_id, customer)
+            return customer
+
+        self._stats["misses"] += 1
+        customer = self.db_client.fetch_one(CUSTOMER_LOOKUP_SQL, (customer_id,))
+        if customer is not None:
+            self._store(customer_id, dict(customer))
+        return customer
+
+    async def aget(self, customer_id: str) -> Optional[dict]:
+        """Get a customer row without blocking the event loop.
+
+        Args:
+            customer_id: Customer ID.
+
+        Returns:
+            Customer row, or None if the customer does not exist.
+        """
+        customer = self._local.get(customer_id)
+        if customer is not None:
+            self._stats["local_hits"] += 1
+            return customer
+
+        if self.async_db_client is None:
+            return await asyncio.to_thread(self.get, customer_id)
+
+        customer = await self._aredis_get(customer_id)
+        if customer is not None:
+            self._stats["redis_hits"] += 1
+            self._local.set(customer_id, customer)
+            return customer
+
+        self._stats["misses"] += 1
+        customer = await self.async_db_client.fetch_one(CUSTOMER_LOOKUP_SQL, (customer_id,))
+        if customer is not None:
+            await asyncio.to_thread(self._store, customer_id, dict(customer))
+        return customer
+
+    def invalidate(self, customer_id: str) -> None:
+        """Drop a customer from both tiers after its row changed.
+
+        Other instances' in-process entries expire after ``ttl_seconds``.
+
+        Args:
+            customer_id: Customer ID.
+        """
+        self._local.delete(customer_id)
+        if self.kv_client is not None:
+            self.kv_client.delete(key=self._redis_key(customer_id))
+
+    def clear(self) -> None:
+        """Drop every cached customer (e.g. after a bulk import)."""
+        self._local.clear()
+        if self.kv_client is not None:
+            self.kv_client.delete(pattern=f"{CUSTOMER_CACHE_PREFIX}:*")
+
+    def warm(self, limit: int = 1000, plans: Optional[list[str]] = None) -> int:
+        """Load customers in bulk with one query.
+
+        Largest accounts (by seats) first, as they file the most tickets.
+
+        Args:
+            limit: Maximum customers to load.
+            plans: Only load these plans (e.g. ``["enterprise"]``); None
+                loads all.
+
+        Returns:
+            Number of customers cached.
+        """
+        query = f"SELECT {CUSTOMER_COLUMNS} FROM customers"
+        params: list[Any] = []
+        if plans:
+            query += " WHERE plan = ANY(%s)"
+            params.append(list(plans))
+        query += " ORDER BY seats DESC NULLS LAST, id LIMIT %s"
+        params.append(limit)
+
+        rows = self.db_client.fetch_all(query, tuple(params))
+        for row in rows:
+            self._local.set(row["id"], dict(row))
+        if self.kv_client is not None and rows:
+            self.kv_client.mset(
+                mapping={
+                    self._redis_key(row["id"]): json.dumps(dict(row), default=str)
+                    for row in rows
+                },
+                ttl=self.redis_ttl_seconds,
+            )
+        logger.info(f"Warmed customer cache with {len(rows)} customers")
+        return len(rows)
+
+    def stats(self) -> dict:
+        """Cache counters.
+
+        Returns:
+            Dict with ``local_hits``, ``redis_hits``, ``misses`` and the
+            number of in-process ``entries``.
+        """
+        return {**self._stats, "entries": len(self._local)}
+
+    def _store(self, customer_id: str, customer: dict) -> None:
+        """Fill both tiers with a row read from PostgreSQL.
+
+        Args:
+            customer_id: Customer ID.
+            customer: Customer row.
+        """
+        self._local.set(customer_id, customer)
+        if self.kv_client is None:
+            return
+        try:
+            self.kv_client.set(
+                key=self._redis_key(customer_id),
+                value=json.dumps(customer, default=str),
+                ttl=self.redis_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache customer {customer_id} in Redis: {e}")
+
+    def _redis_get(self, customer_id: str) -> Optional[dict]:
+        """Read a customer from the Redis tier.
+
+        Args:
+            customer_id: Customer ID.
+
+        Returns:
+            Customer row, or None if not cached or Redis is unavailable.
+        """
+        if self.kv_client is None:
+            return None
+        try:
+            return self._decode(self.kv_client.get(key=self._redis_key(customer_id)))
+        except Exception as e:
+            logger.warning(f"Redis customer cache read failed: {e}")
+            return None
+
+    async def _aredis_get(self, customer_id: str) -> Optional[dict]:
+        """Read a customer from the Redis tier without blocking.
+
+        Args:
+            customer_id: Customer ID.
+
+        Returns:
+            Customer row, or None if not cached or Redis is unavailable.
+        """
+        if self.async_kv_client is None:
+            return await asyncio.to_thread(self._redis_get, customer_id)
+        try:
+            return self._decode(
+                await self.async_kv_client.get(key=self._redis_key(customer_id))
+            )
+        except Exception as e:
+            logger.warning(f"Redis customer cache read failed: {e}")
+            return None
+
+    def _decode(self, raw: Optional[str]) -> Optional[dict]:
+        """Decode a Redis tier value.
+
+        Args:
+            raw: Stored JSON, or None.
+
+        Returns:
+            Customer row, or None.
+        """
+        return json.loads(raw) if raw else None
+
+    def _redis_key(self, customer_id: str) -> str:
+        """Redis key of a cached customer.
+
+        Args:
+            customer_id: Customer ID.
+
+        Returns:
+            Key ``customer:{customer_id}``.
+        """
+        return f"{CUSTOMER_CACHE_PREFIX}:{customer_id}"
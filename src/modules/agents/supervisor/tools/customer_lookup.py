@@ -4,8 +4,12 @@ from typing import Type, Optional
 from langchain.tools import BaseTool
 from pydantic import Field, BaseModel
 
-from libs.database.tabular.sql.base import BaseSQLClient
+from libs.database.tabular.sql.base import BaseAsyncSQLClient, BaseSQLClient
 from libs.logger.logger import get_logger
+from src.modules.agents.supervisor.tools.customer_cache import (
+    CUSTOMER_LOOKUP_SQL,
+    CustomerCache,
+)
 
 logger = get_logger(__name__)
 
@@ -26,6 +30,8 @@ class CustomerLookupTool(BaseTool):
         name: Tool name for LangChain.
         description: Tool description for the LLM.
         db_client: SQL database client for queries.
+        async_db_client: Async SQL client used by async tool calls (optional).
+        cache: Read-through customer cache (optional).
     """
 
     name: str = "customer_lookup"
@@ -35,19 +41,33 @@ class CustomerLookupTool(BaseTool):
     )
     args_schema: Type[BaseModel] = CustomerLookupInput
     db_client: Optional[BaseSQLClient] = None
+    async_db_client: Optional[BaseAsyncSQLClient] = None
+    cache: Optional[CustomerCache] = None
 
     class Config:
         arbitrary_types_allowed = True
 
-    def __init__(self, db_client: BaseSQLClient, **kwargs):
+    def __init__(
+        self,
+        db_client: BaseSQLClient,
+        async_db_client: Optional[BaseAsyncSQLClient] = None,
+        cache: Optional[CustomerCache] = None,
+        **kwargs
+    ):
         """Initialize customer lookup tool.
 
         Args:
             db_client: SQL database client for queries.
+            async_db_client: Async SQL client for async tool calls. Without
+                it, async calls run the sync lookup in a worker thread.
+            cache: Read-through customer cache; lookups skip PostgreSQL
+                while the customer is cached.
             **kwargs: Additional arguments passed to BaseTool.
         """
         super().__init__(**kwargs)
         self.db_client = db_client
+        self.async_db_client = async_db_client
+        self.cache = cache
         logger.info("CustomerLookupTool initialized with PostgreSQL client")
 
     def _run(self, customer_id: str) -> str:
@@ -62,28 +82,62 @@ class CustomerLookupTool(BaseTool):
         logger.info(f"Looking up customer: {customer_id}")
 
         try:
-            result = self.db_client.fetch_one(
-                """
-                SELECT id, name, email, plan, tenure_months, region, seats, notes
-                FROM customers
-                WHERE id = %s
-                """,
-                (customer_id,)
-            )
-
-            if not result:
-                return f"Customer {customer_id} not found."
-
-            return (
-                f"**Customer:** {result['name']}\n"
-                f"**Email:** {result['email']}\n"
-                f"**Plan:** {result['plan']}\n"
-                f"**Tenure:** {result['tenure_months']} months\n"
-                f"**Region:** {result['region'] or 'N/A'}\n"
-                f"**Seats:** {result.get('seats', 1)}\n"
-                f"**Notes:** {result.get('notes') or 'None'}"
-            )
+            if self.cache is not None:
+                result = self.cache.get(customer_id)
+            else:
+                result = self.db_client.fetch_one(CUSTOMER_LOOKUP_SQL, (customer_id,))
+            return self._format_customer(customer_id, result)
 
         except Exception as e:
             logger.error(f"Failed to query customer: {e}")
             return f"Error looking up customer: {str(e)}"
+
+    async def _arun(self, customer_id: str) -> str:
+        """Look up customer by ID without blocking the event loop.
+
+        Args:
+            customer_id: Customer ID to look up.
+
+        Returns:
+            Formatted string with customer information.
+        """
+        if self.async_db_client is None and self.cache is None:
+            return await super()._arun(customer_id)
+
+        logger.info(f"Looking up customer (async): {customer_id}")
+
+        try:
+            if self.cache is not None:
+                result = await self.cache.aget(customer_id)
+            else:
+                result = await self.async_db_client.fetch_one(
+                    CUSTOMER_LOOKUP_SQL, (customer_id,)
+                )
+            return self._format_customer(customer_id, result)
+
+        except Exception as e:
+            logger.error(f"Failed to query customer: {e}")
+            return f"Error looking up customer: {str(e)}"
+
+    def _format_customer(self, customer_id: str, result: Optional[dict]) -> str:
+        """Format a customer row for the LLM.
+
+        Args:
+            customer_id: Customer ID that was looked up.
+            result: Customer row, or None if not found.
+
+        Returns:
+            Formatted string with customer information.
+        """
+        if not result:
+            return f"Customer {customer_id} not found."
+
+        return (
+            f"**Customer:** {result['name']}\n"
+            f"**Email:** {result['email']}\n"
+            f"**Plan:** {result['plan']}\n"
+            f"**Tenure:** {result['tenure_months']} months\n"
+            f"**Region:** {result['region'] or 'N/A'}\n"
+            f"**Seats:** {result.get('seats', 1)}\n"
+            f"**Notes:** {result.get('notes') or 'None'}"
+        )
@@ -1,11 +1,13 @@
 """Ticket matcher agent for matching messages to existing tickets."""
 
 import json
-from typing import Any, Optional, List
+from typing import Any, Optional
 
 from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import ValidationError
 
 from src.modules.agents.base import BaseAgent
+from src.modules.graph.state import TicketMatchInput, TicketMatchResult
 from libs.logger.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,11 +20,14 @@ class TicketMatcherAgent(BaseAgent):
     existing active ticket in Redis. This enables multi-turn
     conversations and proper ticket routing.
 
-    System prompt is loaded from Langfuse prompt manager.
+    System prompt is loaded from Langfuse prompt manager. The LLM is asked
+    for a ``TicketMatchResult`` via structured output where supported, with
+    JSON parsing of the plain response as the fallback.
 
     Attributes:
         name: Agent name.
         llm: LangChain-compatible LLM.
+        structured_llm: LLM bound to the ``TicketMatchResult`` schema, or None.
         observability: Observability wrapper for tracing.
         prompt_manager: Prompt manager for loading prompts.
     """
@@ -73,107 +78,157 @@ class TicketMatcherAgent(BaseAgent):
             except Exception as e:
                 self.logger.warning(f"Failed to load prompt from Langfuse: {e}")
 
+        # Schema-constrained output; unsupported models parse the text instead
+        self.structured_llm = None
+        if self.agent_config.get("structured_output", True):
+            try:
+                self.structured_llm = self.llm.with_structured_output(TicketMatchResult)
+            except Exception as e:
+                self.logger.warning(f"Structured output unavailable, parsing JSON: {e}")
+
         self.logger.info("TicketMatcherAgent initialized")
 
     def execute(self, state: dict[str, Any]) -> dict[str, Any]:
         """Match new message to existing tickets.
 
         Args:
-            state: State containing new_message and active_tickets.
+            state: State with the ``TicketMatchInput`` fields (new_message,
+                activated_tickets).
 
         Returns:
-            Updated state with match_result.
+            Updated state with match_result (``TicketMatchResult`` as dict).
         """
-        new_message = state.get("new_message", "")
-        active_tickets = state.get("active_tickets", [])
-
-        self.logger.info(f"Matching message against {len(active_tickets)} active tickets")
-
         state["current_agent"] = self.name
 
-        # If no active tickets, no matching needed
-        if not active_tickets:
-            self.logger.info("No active tickets to match against")
-            state["match_result"] = {
-                "matched_ticket_id": None,
-                "confidence": "high",
-                "reasoning": "No active tickets found for this customer",
-            }
+        try:
+            match_input = TicketMatchInput.model_validate(state)
+        except ValidationError as e:
+            self.logger.error(f"Invalid ticket matcher input: {e}")
+            state["match_result"] = TicketMatchResult(
+                reasoning="Invalid matcher input",
+            ).model_dump()
             return state
 
+        state["match_result"] = self.match(match_input).model_dump()
+        return state
+
+    def match(self, match_input: TicketMatchInput) -> TicketMatchResult:
+        """Match a new message to one of the activated tickets.
+
+        Args:
+            match_input: New message and candidate activated tickets.
+
+        Returns:
+            Match decision. A matched_ticket_id outside the candidates is
+            discarded.
+        """
+        new_message = match_input.new_message
+        activated_tickets = match_input.activated_tickets
+
+        self.logger.info(f"Matching message against {len(activated_tickets)} activated tickets")
+
+        # If no activated tickets, no matching needed
+        if not activated_tickets:
+            self.logger.info("No activated tickets to match against")
+            return TicketMatchResult(
+                confidence="high",
+                reasoning="No active tickets found for this customer",
+            )
+
         try:
             # Build user prompt with ticket summaries
-            user_prompt = self._build_user_prompt(new_message, active_tickets)
+            user_prompt = self._build_user_prompt(match_input)
 
             # Call LLM
             messages = []
             if self.system_prompt:
                 messages.append(SystemMessage(content=self.system_prompt))
             messages.append(HumanMessage(content=user_prompt))
-            response = self.llm.invoke(messages)
+            match_result = self._invoke(messages)
 
-            # Parse response
-            match_result = self._parse_response(response.content)
-            state["match_result"] = match_result
+            candidate_ids = {ticket.ticket_id for ticket in activated_tickets}
+            if match_result.matched_ticket_id not in candidate_ids | {None}:
+                self.logger.warning(
+                    f"Matcher returned unknown ticket {match_result.matched_ticket_id}, ignoring"
+                )
+                match_result = TicketMatchResult(
+                    reasoning=f"Unknown ticket ID: {match_result.matched_ticket_id}",
+                )
 
             # Log to observability
             if self.observability:
                 try:
                     self.observability.trace_generation(
                         name="ticket_matcher",
-                        input_data={"message": new_message[:100], "ticket_count": len(active_tickets)},
-                        output=match_result,
+                        input_data={"message": new_message[:100], "ticket_count": len(activated_tickets)},
+                        output=match_result.model_dump(),
                         model=str(getattr(self.llm, "model_name", "unknown")),
                     )
                 except Exception as e:
                     self.logger.warning(f"Failed to trace ticket matcher: {e}")
 
             self.logger.info(
-                f"Match result: ticket={match_result.get('matched_ticket_id')}, "
-                f"confidence={match_result.get('confidence')}"
+                f"Match result: ticket={match_result.matched_ticket_id}, "
+                f"confidence={match_result.confidence}"
             )
+            return match_result
 
         except Exception as e:
             self.logger.error(f"Ticket matching failed: {e}", exc_info=True)
-            state["match_result"] = {
-                "matched_ticket_id": None,
-                "confidence": "low",
-                "reasoning": f"Matching failed: {str(e)}",
-            }
+            return TicketMatchResult(reasoning=f"Matching failed: {str(e)}")
 
-        return state
+    def _invoke(self, messages: list) -> TicketMatchResult:
+        """Call the LLM for a match decision.
+
+        Args:
+            messages: Prompt messages.
+
+        Returns:
+            Match decision from structured output, or parsed from the text
+            response if structured output is unavailable or fails.
+        """
+        if self.structured_llm is not None:
+            try:
+                result = self.structured_llm.invoke(messages)
+                if isinstance(result, TicketMatchResult):
+                    return self._normalize(result)
+                return self._normalize(TicketMatchResult.model_validate(result))
+            except Exception as e:
+                self.logger.warning(f"Structured match output failed, parsing JSON: {e}")
 
-    def _build_user_prompt(self, new_message: str, active_tickets: List[dict]) -> str:
+        response = self.llm.invoke(messages)
+        return self._parse_response(response.content)
+
+    def _build_user_prompt(self, match_input: TicketMatchInput) -> str:
         """Build user prompt with message and ticket summaries.
 
         Args:
-            new_message: New customer message.
-            active_tickets: List of active ticket dictionaries.
+            match_input: New message and candidate activated tickets.
 
         Returns:
             Formatted user prompt.
         """
         tickets_text = "\n".join(
-            f"- **{t.get('ticket_id', 'unknown')}**: {t.get('summary', 'No summary')}"
-            for t in active_tickets
+            f"- **{ticket.ticket_id}**: {ticket.summary}"
+            for ticket in match_input.activated_tickets
         )
 
         return f"""## New Customer Message
-{new_message}
+{match_input.new_message}
 
 ## Active Tickets
 {tickets_text}
 
-Analyze if the new message relates to any active ticket."""
+Analyze if the new message relates to any active ticket. Return JSON only."""
 
-    def _parse_response(self, response: str) -> dict:
+    def _parse_response(self, response: str) -> TicketMatchResult:
         """Parse LLM response into match result.
 
         Args:
             response: Raw LLM response.
 
         Returns:
-            Parsed match result dictionary.
+            Parsed match result.
         """
         try:
             # Extract JSON from response
@@ -184,17 +239,24 @@ Analyze if the new message relates to any active ticket."""
                 json_str = response.split("```")[1].split("```")[0]
 
             data = json.loads(json_str.strip())
+            if isinstance(data.get("confidence"), str):
+                data["confidence"] = data["confidence"].lower()
+            return self._normalize(TicketMatchResult.model_validate(data))
 
-            return {
-                "matched_ticket_id": data.get("matched_ticket_id"),
-                "confidence": data.get("confidence", "low"),
-                "reasoning": data.get("reasoning", ""),
-            }
-
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, AttributeError, ValidationError) as e:
             self.logger.error(f"Failed to parse matcher response: {e}")
-            return {
-                "matched_ticket_id": None,
-                "confidence": "low",
-                "reasoning": f"Parse failed: {response[:100]}",
-            }
+            return TicketMatchResult(reasoning=f"Parse failed: {response[:100]}")
+
+    def _normalize(self, result: TicketMatchResult) -> TicketMatchResult:
+        """Treat empty or "null" ticket IDs as no match.
+
+        Args:
+            result: Match decision from the LLM.
+
+        Returns:
+            Match decision with matched_ticket_id None for a new ticket.
+        """
+        ticket_id = (result.matched_ticket_id or "").strip()
+        if ticket_id.lower() in ("", "null", "none"):
+            return result.model_copy(update={"matched_ticket_id": None})
+        return result.model_copy(update={"matched_ticket_id": ticket_id})
@@ -0,0 +1,251 @@
+"""Embedding-based pre-matching of new messages to activated tickets."""
+
+import base64
+from typing import Optional
+
+import numpy as np
+
+from libs.llm.client.base import BaseLLM
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def encode_embedding(vector: list[float]) -> str:
+    """Pack an embedding for a JSON summary record.
+
+    The vector is L2-normalized (so cosine similarity is a dot product) and
+    stored as base64 float32, about a third of the size of a JSON list.
+
+    Args:
+        vector: Embedding vector.
+
+    Returns:
+        Base64 string.
+    """
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    if norm > 0:
+        array = array / norm
+    return base64.b64encode(array.tobytes()).decode("ascii")
+
+
+def decode_embedding(encoded: str) -> np.ndarray:
+    """Unpack an embedding stored by ``encode_embedding``.
+
+    Args:
+        encoded: Base64 string.
+
+    Returns:
+        Normalized float32 vector.
+    """
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float32)
+
+
+class EmbeddingTicketPrematcher:
+    """Scores a new message against activated tickets by cosine similarity.
+
+    Each activated ticket's summary record carries an embedding of its
+    customer messages. A new message is embedded once and compared with all
+    of them:
+
+    - best score >= ``match_threshold`` and ahead of the runner-up by
+      ``margin``: matched without the LLM
+    - every score < ``reject_threshold``: no match, without the LLM
+    - otherwise: the tickets scoring ``reject_threshold`` or more go to the
+      LLM matcher
+
+    Tickets without a stored embedding always go to the LLM matcher, and
+    any embedding failure falls back to it for all tickets.
+
+    Attributes:
+        embedding_client: LLM client with ``embed``.
+        match_threshold: Score at or above which a ticket is auto-matched.
+        reject_threshold: Score below which a ticket is ruled out.
+        margin: Lead over the runner-up required to auto-match.
+        min_words: Shorter messages skip pre-matching (too little signal,
+            e.g. "any update?").
+        dimensions: Requested embedding size (None = model default).
+        max_chars: Ticket text kept and embedded per ticket (opening and
+            most recent messages).
+    """
+
+    def __init__(
+        self,
+        embedding_client: BaseLLM,
+        match_threshold: float = 0.75,
+        reject_threshold: float = 0.25,
+        margin: float = 0.05,
+        min_words: int = 5,
+        dimensions: Optional[int] = 256,
+        max_chars: int = 2000,
+    ):
+        """Initialize prematcher.
+
+        Args:
+            embedding_client: LLM client with ``embed``.
+            match_threshold: Score at or above which a ticket is auto-matched.
+            reject_threshold: Score below which a ticket is ruled out.
+            margin: Lead over the runner-up required to auto-match.
+            min_words: Messages with fewer words skip pre-matching.
+            dimensions: Requested embedding size; smaller vectors keep the
+                summary records compact (None = model default).
+            max_chars: Ticket text kept and embedded per ticket (opening
+                and most recent messages).
+
+        Raises:
+            ValueError: If ``reject_threshold`` is above ``match_threshold``
+        """
+        if reject_threshold > match_threshold:
+            raise ValueError("reject_threshold must not exceed match_threshold")
+        self.embedding_client = embedding_client
+        self.match_threshold = match_threshold
+        self.reject_threshold = reject_threshold
+        self.margin = margin
+        self.min_words = min_words
+        self.dimensions = dimensions
+        self.max_chars = max_chars
+        logger.info(
+            f"EmbeddingTicketPrematcher initialized (match>={match_threshold}, "
+            f"reject<{reject_threshold}, dimensions={dimensions})"
+        )
+
+    def ticket_text(self, messages: list[str], previous_text: Optional[str] = None) -> str:
+        """Extend a ticket's running customer text with new messages.
+
+        Requests may carry only the latest message, so the text embedded
+        for a ticket is kept across turns instead of rebuilt from one
+        request; a short reply ("any update?") then cannot replace the
+        issue description. Messages already in the text (clients resending
+        the conversation) are not added again. Over ``max_chars`` the
+        opening half (the issue as first described) and the most recent
+        half are kept.
+
+        Args:
+            messages: Customer message contents of this request, oldest first.
+            previous_text: Text stored for the ticket so far.
+
+        Returns:
+            Updated ticket text.
+        """
+        text = previous_text or ""
+        for message in messages:
+            message = message.strip()
+            if message and message not in text:
+                text = f"{text}\n{message}" if text else message
+        if len(text) > self.max_chars:
+            half = (self.max_chars - 1) // 2
+            text = f"{text[:half]}\n{text[-half:]}"
+        return text
+
+    def embed_ticket(self, text: str) -> Optional[str]:
+        """Embed a ticket's customer text for its summary record.
+
+        Args:
+            text: Running customer text from ``ticket_text``.
+
+        Returns:
+            Encoded embedding, or None if embedding failed.
+        """
+        if not text.strip():
+            return None
+        vector = self._embed(text[-self.max_chars:])
+        return encode_embedding(vector) if vector is not None else None
+
+    def prematch(self, new_message: str, records: dict[str, Optional[dict]]) -> dict:
+        """Decide a match by similarity where the scores are clear.
+
+        Args:
+            new_message: New customer message.
+            records: Mapping of activated ticket_id to its summary record
+                (None if the ticket has no record).
+
+        Returns:
+            Dict with ``matched_ticket_id`` (auto-match or None),
+            ``candidates`` (ticket IDs the LLM matcher still has to decide
+            between, empty on auto-match or auto-reject) and ``scores``.
+        """
+        ticket_ids = list(records)
+        if len(new_message.split()) < self.min_words:
+            return self._result(None, ticket_ids, {})
+
+        embedded = {
+            ticket_id: record["embedding"]
+            for ticket_id, record in records.items()
+            if record and record.get("embedding")
+        }
+        unscored = [ticket_id for ticket_id in ticket_ids if ticket_id not in embedded]
+        if not embedded:
+            return self._result(None, ticket_ids, {})
+
+        vector = self._embed(new_message)
+        if vector is None:
+            return self._result(None, ticket_ids, {})
+        query = np.asarray(vector, dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+
+        scores = {}
+        for ticket_id, encoded in embedded.items():
+            stored = decode_embedding(encoded)
+            if stored.shape != query.shape:
+                # Stored with another model or dimension setting
+                unscored.append(ticket_id)
+                continue
+            scores[ticket_id] = float(np.dot(query, stored))
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        if not unscored and ranked:
+            best_id, best = ranked[0]
+            runner_up = ranked[1][1] if len(ranked) > 1 else -1.0
+            if best >= self.match_threshold and best - runner_up >= self.margin:
+                return self._result(best_id, [], scores)
+
+        candidates = [
+            ticket_id for ticket_id, score in ranked if score >= self.reject_threshold
+        ] + unscored
+        return self._result(None, candidates, scores)
+
+    def _embed(self, text: str) -> Optional[list[float]]:
+        """Embed one text.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Embedding vector, or None on failure.
+        """
+        kwargs = {"dimensions": self.dimensions} if self.dimensions else {}
+        try:
+            return self.embedding_client.embed([text], **kwargs)[0]
+        except Exception as e:
+            logger.warning(f"Ticket embedding failed, using the LLM matcher: {e}")
+            return None
+
+    def _result(
+        self,
+        matched_ticket_id: Optional[str],
+        candidates: list[str],
+        scores: dict[str, float],
+    ) -> dict:
+        """Build a prematch result and log the decision.
+
+        Args:
+            matched_ticket_id: Auto-matched ticket, or None.
+            candidates: Tickets left for the LLM matcher.
+            scores: Cosine similarity per scored ticket.
+
+        Returns:
+            Prematch result dict.
+        """
+        rounded = {ticket_id: round(score, 3) for ticket_id, score in scores.items()}
+        if matched_ticket_id:
+            logger.info(f"Prematch: auto-matched {matched_ticket_id} {rounded}")
+        elif not candidates:
+            logger.info(f"Prematch: no ticket close enough {rounded}")
+        else:
+            logger.info(f"Prematch: {len(candidates)} candidates for the LLM matcher {rounded}")
+        return {
+            "matched_ticket_id": matched_ticket_id,
+            "candidates": candidates,
+            "scores": scores,
+        }
@@ -1,17 +1,35 @@
 """Tool for summarizing ticket from Redis checkpoint data."""
 
-import json
 from typing import Type, Optional
 
 from langchain.tools import BaseTool
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from pydantic import Field, BaseModel
 
-from libs.database.keyvalue_db.base import BaseKeyValueClient
 from libs.logger.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def format_ticket_summary(ticket_id: str, record: dict) -> str:
+    """Format a summary record for the ticket matcher prompt.
+
+    Args:
+        ticket_id: Ticket ID.
+        record: Summary record with ticket_type, urgency, stage, last_message.
+
+    Returns:
+        Summary string.
+    """
+    return (
+        f"**Ticket {ticket_id}**\n"
+        f"Type: {record.get('ticket_type', 'unknown')}\n"
+        f"Urgency: {record.get('urgency', 'unknown')}\n"
+        f"Current Stage: {record.get('stage', 'unknown')}\n"
+        f"Last Message: {record.get('last_message', 'No messages')}..."
+    )
+
+
 class TicketSummarizeInput(BaseModel):
     """Input schema for ticket summarize tool."""
 
@@ -20,15 +38,20 @@ class TicketSummarizeInput(BaseModel):
 
 
 class TicketSummarizeTool(BaseTool):
-    """Summarize ticket from Redis checkpoint data.
+    """Summarize ticket from its LangGraph checkpoint.
+
+    Loads the thread's latest checkpoint through the checkpoint saver, so
+    compact (compressed) values and tracked key sets are handled by the
+    saver, and extracts key information to create a summary for ticket
+    matching.
 
-    Reads LangGraph checkpoint from Redis and extracts key information
-    to create a summary for ticket matching.
+    TriageService prefers the summary records precomputed at checkpoint time
+    and only falls back to this tool for tickets without one.
 
     Attributes:
         name: Tool name for LangChain.
         description: Tool description for the LLM.
-        kv_client: Key-value client for Redis.
+        checkpointer: LangGraph checkpoint saver.
     """
 
     name: str = "ticket_summarize"
@@ -37,24 +60,24 @@ class TicketSummarizeTool(BaseTool):
         "Returns ticket type, recent messages, and current status."
     )
     args_schema: Type[BaseModel] = TicketSummarizeInput
-    kv_client: Optional[BaseKeyValueClient] = None
+    checkpointer: Optional[BaseCheckpointSaver] = None
 
     class Config:
         arbitrary_types_allowed = True
 
-    def __init__(self, kv_client: BaseKeyValueClient, **kwargs):
+    def __init__(self, checkpointer: BaseCheckpointSaver, **kwargs):
         """Initialize ticket summarize tool.
 
         Args:
-            kv_client: Key-value client for Redis.
+            checkpointer: LangGraph checkpoint saver.
             **kwargs: Additional arguments passed to BaseTool.
         """
         super().__init__(**kwargs)
-        self.kv_client = kv_client
+        self.checkpointer = checkpointer
         logger.info("TicketSummarizeTool initialized")
 
     def _run(self, ticket_id: str, customer_id: str) -> str:
-        """Summarize ticket from Redis checkpoint.
+        """Summarize ticket from its latest checkpoint.
 
         Args:
             ticket_id: Ticket ID to summarize.
@@ -66,33 +89,13 @@ class TicketSummarizeTool(BaseTool):
         logger.info(f"Summarizing ticket: {ticket_id}")
 
         try:
-            # Scan for checkpoint keys
-            thread_id = f"{customer_id}:{ticket_id}"
-            pattern = f"*{thread_id}*"
-            keys = self.kv_client.scan(pattern=pattern)
+            config = {"configurable": {"thread_id": f"{customer_id}:{ticket_id}"}}
+            checkpoint_tuple = self.checkpointer.get_tuple(config)
 
-            if not keys:
+            if checkpoint_tuple is None:
                 return f"No checkpoint found for ticket {ticket_id}"
 
-            # Find the checkpoint data key (usually contains 'checkpoint' or 'writes')
-            checkpoint_data = None
-            for key in keys:
-                value = self.kv_client.get(key=key)
-                if value:
-                    try:
-                        data = json.loads(value) if isinstance(value, str) else value
-                        if isinstance(data, dict):
-                            checkpoint_data = data
-                            break
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-
-            if not checkpoint_data:
-                return f"Could not parse checkpoint for ticket {ticket_id}"
-
-            # Extract summary from checkpoint
-            summary = self._extract_summary(ticket_id, checkpoint_data)
-            return summary
+            return self._extract_summary(ticket_id, checkpoint_tuple.checkpoint)
 
         except Exception as e:
             logger.error(f"Failed to summarize ticket {ticket_id}: {e}")
@@ -103,7 +106,7 @@ class TicketSummarizeTool(BaseTool):
 
         Args:
             ticket_id: Ticket ID.
-            checkpoint: Parsed checkpoint data.
+            checkpoint: Checkpoint loaded by the saver.
 
         Returns:
             Summary string.
@@ -130,23 +133,27 @@ class TicketSummarizeTool(BaseTool):
             elif isinstance(supervisor_decision, dict):
                 urgency = supervisor_decision.get("urgency", "unknown")
 
-        # Get last message from ticket
+        # Get last message from ticket (Ticket model or dict)
         if isinstance(ticket, dict):
             messages = ticket.get("messages", [])
-            if messages:
-                last_msg = messages[-1]
-                if isinstance(last_msg, dict):
-                    last_message = last_msg.get("content", "")[:100]
-                elif hasattr(last_msg, "content"):
-                    last_message = last_msg.content[:100]
+        else:
+            messages = getattr(ticket, "messages", [])
+        if messages:
+            last_msg = messages[-1]
+            if isinstance(last_msg, dict):
+                last_message = last_msg.get("content", "")[:100]
+            elif hasattr(last_msg, "content"):
+                last_message = last_msg.content[:100]
 
         # Get current agent
         current_agent = channel_values.get("current_agent", "unknown")
 
-        return (
-            f"**Ticket {ticket_id}**\n"
-            f"Type: {ticket_type}\n"
-            f"Urgency: {urgency}\n"
-            f"Current Stage: {current_agent}\n"
-            f"Last Message: {last_message}..."
+        return format_ticket_summary(
+            ticket_id,
+            {
+                "ticket_type": ticket_type,
+                "urgency": urgency,
+                "stage": current_agent,
+                "last_message": last_message,
+            },
         )
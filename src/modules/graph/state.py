@@ -5,7 +5,7 @@ from typing import Annotated, Optional, TypedDict, Literal
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 
 from src.entities.ticket import Ticket
 from src.entities.triage_result import TriageResult, UrgencyLevel
@@ -57,6 +57,55 @@ class SupervisorDecision(BaseModel):
     )
 
 
+class TicketSummary(BaseModel):
+    """Activated ticket as shown to the ticket matcher.
+
+    Attributes:
+        ticket_id: Activated ticket ID.
+        summary: Formatted ticket summary.
+    """
+
+    ticket_id: str = Field(..., description="Activated ticket ID")
+    summary: str = Field(..., description="Formatted ticket summary")
+
+
+class TicketMatchInput(BaseModel):
+    """Input to the ticket matcher (pre-workflow).
+
+    Attributes:
+        new_message: Latest customer message.
+        activated_tickets: Candidate activated tickets. ``active_tickets``
+            is accepted as an alias.
+    """
+
+    new_message: str = Field(..., description="Latest customer message")
+    activated_tickets: list[TicketSummary] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("activated_tickets", "active_tickets"),
+        description="Candidate activated tickets",
+    )
+
+
+class TicketMatchResult(BaseModel):
+    """Ticket matcher decision.
+
+    Also the structured-output schema requested from the LLM.
+
+    Attributes:
+        matched_ticket_id: Matched activated ticket, or None for a new ticket.
+        confidence: Match confidence.
+        reasoning: Brief explanation of the decision.
+    """
+
+    matched_ticket_id: Optional[str] = Field(
+        None, description="ID of the matching active ticket, or null for a new ticket"
+    )
+    confidence: Literal["high", "medium", "low"] = Field(
+        "low", description="Match confidence"
+    )
+    reasoning: str = Field("", description="Brief explanation of the decision")
+
+
 class AgentState(TypedDict):
     """State passed between nodes in the multi-agent triage workflow.
 
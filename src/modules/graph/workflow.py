@@ -188,6 +188,46 @@ class MultiAgentWorkflow:
         Returns:
             Final AgentState with triage result.
         """
+        initial_state, run_config = self._prepare_run(ticket, config)
+        result = self.graph.invoke(initial_state, config=run_config)
+        return self._finish_run(ticket, result)
+
+    async def ainvoke(
+        self,
+        ticket: Ticket,
+        config: Optional[dict] = None,
+    ) -> AgentState:
+        """Run the workflow on the event loop.
+
+        Required with an async checkpointer: checkpoint reads/writes are
+        awaited instead of blocking a thread. Sync agent nodes run in
+        LangGraph's executor.
+
+        Args:
+            ticket: Support ticket to triage.
+            config: LangGraph config (should include thread_id from TriageService).
+
+        Returns:
+            Final AgentState with triage result.
+        """
+        initial_state, run_config = self._prepare_run(ticket, config)
+        result = await self.graph.ainvoke(initial_state, config=run_config)
+        return self._finish_run(ticket, result)
+
+    def _prepare_run(
+        self,
+        ticket: Ticket,
+        config: Optional[dict],
+    ) -> tuple[AgentState, dict]:
+        """Build initial state and run config with observability callbacks.
+
+        Args:
+            ticket: Support ticket to triage.
+            config: LangGraph config.
+
+        Returns:
+            Tuple of (initial state, run config).
+        """
         customer_id = ticket.customer_id
 
         logger.info(f"Starting agent workflow for ticket: {ticket.ticket_id}")
@@ -214,10 +254,18 @@ class MultiAgentWorkflow:
                     "langfuse_user_id": customer_id,
                 }
 
-        # Create initial state and run workflow
-        initial_state = create_initial_state(ticket)
-        result = self.graph.invoke(initial_state, config=run_config)
+        return create_initial_state(ticket), run_config
 
+    def _finish_run(self, ticket: Ticket, result: AgentState) -> AgentState:
+        """Flush observability traces after a run.
+
+        Args:
+            ticket: Triaged ticket.
+            result: Final workflow state.
+
+        Returns:
+            The final state unchanged.
+        """
         # Flush observability traces
         if self.observability:
             self.observability.flush()
@@ -1,8 +1,63 @@
 """Repository for chat message persistence."""
 
 from datetime import datetime
-
-from libs.database.tabular.sql.base import BaseSQLClient
+from typing import Optional
+
+from libs.database.tabular.sql.base import BaseAsyncSQLClient, BaseSQLClient
+
+# Serializes writes per ticket for the rest of the transaction, so the
+# MAX(seq) read by INSERT_MESSAGE_SQL sees every earlier append and the
+# stored rows read by UPSERT_MESSAGES_SQL include every earlier save.
+LOCK_TICKET_MESSAGES_SQL = "SELECT pg_advisory_xact_lock(hashtext('chat_messages:' || %s))"
+
+INSERT_MESSAGE_SQL = """
+    INSERT INTO chat_messages (ticket_id, customer_id, seq, role, content, created_at)
+    VALUES (
+        %s, %s,
+        (SELECT COALESCE(MAX(seq) + 1, 0) FROM chat_messages WHERE ticket_id = %s),
+        %s, %s, %s
+    )
+"""
+
+# Multi-row upsert used by save_messages; ``VALUES %s`` is expanded by
+# execute_values. Re-saving a conversation (e.g. the retention sweep after a
+# partial persist) overwrites rows by position instead of failing.
+# chat_messages is partitioned by created_at, so stored rows keep their
+# created_at and the conflict target includes it. (ticket_id, seq) alone is
+# not unique, so the upsert must run after LOCK_TICKET_MESSAGES_SQL in the
+# same transaction: otherwise two concurrent saves both miss the stored rows
+# and insert the conversation twice.
+UPSERT_MESSAGES_SQL = """
+    INSERT INTO chat_messages (ticket_id, customer_id, seq, role, content, created_at)
+    SELECT incoming.ticket_id, incoming.customer_id, incoming.seq,
+           incoming.role, incoming.content,
+           COALESCE(stored.created_at, incoming.created_at)
+    FROM (VALUES %s) AS incoming (ticket_id, customer_id, seq, role, content, created_at)
+    LEFT JOIN chat_messages AS stored
+        ON stored.ticket_id = incoming.ticket_id AND stored.seq = incoming.seq
+    ON CONFLICT (ticket_id, seq, created_at) DO UPDATE SET
+        role = EXCLUDED.role,
+        content = EXCLUDED.content
+"""
+
+
+def message_rows(ticket_id: str, customer_id: str, messages: list[dict]) -> list[tuple]:
+    """Build ``UPSERT_MESSAGES_SQL`` rows, numbered by position.
+
+    Args:
+        ticket_id: Ticket identifier.
+        customer_id: Customer identifier.
+        messages: List of message dicts with 'role' and 'content' keys,
+            in conversation order.
+
+    Returns:
+        Row tuples matching the insert column order.
+    """
+    created_at = datetime.utcnow()
+    return [
+        (ticket_id, customer_id, seq, msg["role"], msg["content"], created_at)
+        for seq, msg in enumerate(messages)
+    ]
 
 
 class ChatRepository:
@@ -13,15 +68,27 @@ class ChatRepository:
 
     Attributes:
         _db_client: SQL database client.
+        _async_db_client: Async SQL client for ``a*`` methods (optional).
     """
 
-    def __init__(self, db_client: BaseSQLClient):
+    def __init__(
+        self,
+        db_client: BaseSQLClient,
+        async_db_client: Optional[BaseAsyncSQLClient] = None,
+    ):
         """Initialize chat repository.
 
         Args:
             db_client: SQL database client.
+            async_db_client: Async SQL client (e.g. ``postgres_async``).
         """
         self._db_client = db_client
+        self._async_db_client = async_db_client
+
+    @property
+    def supports_async(self) -> bool:
+        """Whether ``a*`` methods are available."""
+        return self._async_db_client is not None
 
     def save_message(
         self,
@@ -31,7 +98,10 @@ class ChatRepository:
         content: str,
         created_at: datetime = None,
     ) -> None:
-        """Save a single chat message.
+        """Append a single chat message after the ticket's last one.
+
+        Concurrent appends to the same ticket are serialized by a
+        transaction-level advisory lock, so each gets the next ``seq``.
 
         Args:
             ticket_id: Ticket identifier.
@@ -43,13 +113,12 @@ class ChatRepository:
         if created_at is None:
             created_at = datetime.utcnow()
 
-        self._db_client.execute(
-            """
-            INSERT INTO chat_messages (ticket_id, customer_id, role, content, created_at)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (ticket_id, customer_id, role, content, created_at),
-        )
+        with self._db_client.transaction() as tx:
+            tx.execute(LOCK_TICKET_MESSAGES_SQL, (ticket_id,))
+            tx.execute(
+                INSERT_MESSAGE_SQL,
+                (ticket_id, customer_id, ticket_id, role, content, created_at),
+            )
 
     def save_messages(
         self,
@@ -57,24 +126,58 @@ class ChatRepository:
         customer_id: str,
         messages: list[dict],
     ) -> int:
-        """Bulk save chat messages.
+        """Bulk save chat messages with multi-row statements.
+
+        Each message is stored with its position in ``messages`` as ``seq``,
+        so ordering does not depend on timestamps. Runs in a transaction
+        holding the ticket's advisory lock, so concurrent saves of the same
+        conversation overwrite each other instead of duplicating it.
+
+        Args:
+            ticket_id: Ticket identifier.
+            customer_id: Customer identifier.
+            messages: List of message dicts with 'role' and 'content' keys,
+                in conversation order.
+
+        Returns:
+            Number of messages saved.
+        """
+        if not messages:
+            return 0
+        with self._db_client.transaction() as tx:
+            tx.execute(LOCK_TICKET_MESSAGES_SQL, (ticket_id,))
+            tx.execute_values(
+                UPSERT_MESSAGES_SQL,
+                message_rows(ticket_id, customer_id, messages),
+            )
+        return len(messages)
+
+    async def asave_messages(
+        self,
+        ticket_id: str,
+        customer_id: str,
+        messages: list[dict],
+    ) -> int:
+        """Bulk save chat messages on the async client.
+
+        Same locking as ``save_messages``.
 
         Args:
             ticket_id: Ticket identifier.
             customer_id: Customer identifier.
-            messages: List of message dicts with 'role' and 'content' keys.
+            messages: List of message dicts with 'role' and 'content' keys,
+                in conversation order.
 
         Returns:
             Number of messages saved.
         """
-        created_at = datetime.utcnow()
-        for msg in messages:
-            self._db_client.execute(
-                """
-                INSERT INTO chat_messages (ticket_id, customer_id, role, content, created_at)
-                VALUES (%s, %s, %s, %s, %s)
-                """,
-                (ticket_id, customer_id, msg["role"], msg["content"], created_at),
+        if not messages:
+            return 0
+        async with self._async_db_client.transaction() as tx:
+            await tx.execute(LOCK_TICKET_MESSAGES_SQL, (ticket_id,))
+            await tx.execute_values(
+                UPSERT_MESSAGES_SQL,
+                message_rows(ticket_id, customer_id, messages),
             )
         return len(messages)
 
@@ -85,14 +188,14 @@ class ChatRepository:
             ticket_id: Ticket identifier.
 
         Returns:
-            List of message records ordered by creation time.
+            List of message records in conversation order.
         """
         return self._db_client.fetch_all(
             """
-            SELECT ticket_id, customer_id, role, content, created_at
+            SELECT ticket_id, customer_id, seq, role, content, created_at
             FROM chat_messages
             WHERE ticket_id = %s
-            ORDER BY created_at ASC
+            ORDER BY seq ASC
             """,
             (ticket_id,),
         )
@@ -1,10 +1,22 @@
 """Repository for LangGraph checkpoint operations."""
 
+import json
+import time
 from typing import Optional, Any
 
 from langgraph.checkpoint.base import BaseCheckpointSaver
 
 from libs.database.keyvalue_db.base import BaseKeyValueClient
+from libs.database.keyvalue_db.redis.checkpointer import tracked_keys_key
+
+# Sorted set per customer: member = ticket_id, score = last activity (epoch seconds)
+ACTIVATED_INDEX_PREFIX = "activated_tickets"
+
+# Sorted set across customers: member = "{customer_id}:{ticket_id}", score = last activity
+ACTIVITY_INDEX_KEY = "activated_ticket_activity"
+
+# Hash per customer: field = ticket_id, value = JSON summary record
+TICKET_SUMMARIES_PREFIX = "ticket_summaries"
 
 
 class CheckpointRepository:
@@ -16,21 +28,38 @@ class CheckpointRepository:
     Attributes:
         _checkpointer: LangGraph checkpoint saver.
         _kv_client: Key-value client for Redis operations.
+        _unlink_batch_size: Keys per pipelined UNLINK during cleanup.
+        _ttl_seconds: Lifetime of activated tickets without activity.
+        _track_activity: Whether the cross-customer activity index is kept.
     """
 
     def __init__(
         self,
         checkpointer: BaseCheckpointSaver,
         kv_client: BaseKeyValueClient,
+        unlink_batch_size: int = 500,
+        ttl_seconds: Optional[int] = None,
+        track_activity: bool = False,
     ):
         """Initialize checkpoint repository.
 
         Args:
             checkpointer: LangGraph checkpoint saver.
             kv_client: Key-value client for Redis.
+            unlink_batch_size: Keys per pipelined UNLINK during cleanup.
+            ttl_seconds: Checkpoint TTL. The per-customer index and summary
+                keys get the same TTL (refreshed on activation), and index
+                entries idle longer than it are treated as expired, since
+                their checkpoints are gone. None = no expiry.
+            track_activity: Keep ``activated_ticket_activity`` for the
+                retention sweeper. Only enable it with the sweeper running:
+                nothing else removes its members.
         """
         self._checkpointer = checkpointer
         self._kv_client = kv_client
+        self._unlink_batch_size = unlink_batch_size
+        self._ttl_seconds = ttl_seconds
+        self._track_activity = track_activity
 
     def get_checkpoint(self, customer_id: str, ticket_id: str) -> Optional[Any]:
         """Get checkpoint tuple for a ticket.
@@ -63,9 +92,209 @@ class CheckpointRepository:
         config = {"configurable": {"thread_id": f"{customer_id}:{ticket_id}"}}
         self._checkpointer.put(config, checkpoint, metadata, {})
 
+    def _activated_index_key(self, customer_id: str) -> str:
+        """Build the activated-ticket index key for a customer."""
+        return f"{ACTIVATED_INDEX_PREFIX}:{customer_id}"
+
+    def mark_ticket_activated(
+        self,
+        customer_id: str,
+        ticket_id: str,
+        summary: Optional[dict] = None,
+        last_activity: Optional[float] = None,
+    ) -> None:
+        """Add ticket to the activated indexes, refreshing last activity.
+
+        All writes go out in one pipelined round trip. With a TTL, members
+        idle past it are trimmed from the indexes in the same round trip.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+            summary: Optional summary record stored alongside (see
+                ``save_ticket_summary``).
+            last_activity: Activity time as epoch seconds (default: now).
+        """
+        now = last_activity if last_activity is not None else time.time()
+        with self._kv_client.pipeline() as batch:
+            batch.zadd(
+                key=self._activated_index_key(customer_id),
+                mapping={ticket_id: now},
+            )
+            if self._track_activity:
+                batch.zadd(
+                    key=ACTIVITY_INDEX_KEY,
+                    mapping={f"{customer_id}:{ticket_id}": now},
+                )
+            if summary is not None:
+                batch.hset(
+                    key=self._summaries_key(customer_id),
+                    mapping={ticket_id: json.dumps(summary)},
+                )
+            if self._ttl_seconds:
+                batch.expire(key=self._activated_index_key(customer_id), ttl=self._ttl_seconds)
+                batch.expire(key=self._summaries_key(customer_id), ttl=self._ttl_seconds)
+                # Entries idle past the TTL point at expired checkpoints
+                expired_before = time.time() - self._ttl_seconds
+                batch.zremrangebyscore(
+                    key=self._activated_index_key(customer_id),
+                    max_score=expired_before,
+                )
+                batch.zremrangebyscore(key=ACTIVITY_INDEX_KEY, max_score=expired_before)
+
+    def get_activated_ticket_ids(self, customer_id: str) -> list[str]:
+        """Get customer's activated ticket IDs from the per-customer index.
+
+        O(tickets for this customer), unlike a keyspace SCAN.
+
+        Args:
+            customer_id: Customer identifier.
+
+        Returns:
+            Activated ticket IDs, most recently active first.
+        """
+        if not self._ttl_seconds:
+            return self._kv_client.zrange(
+                key=self._activated_index_key(customer_id),
+                desc=True,
+            )
+        # Entries idle past the TTL point at expired checkpoints
+        live = self._kv_client.zrangebyscore(
+            key=self._activated_index_key(customer_id),
+            min_score=time.time() - self._ttl_seconds,
+        )
+        return live[::-1]
+
+    def is_ticket_activated(self, customer_id: str, ticket_id: str) -> bool:
+        """Check whether a ticket is in the customer's activated index.
+
+        One ``ZSCORE``, O(1) regardless of how many tickets are activated.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+
+        Returns:
+            True if the ticket is activated for this customer and its
+            checkpoint has not expired.
+        """
+        last_activity = self._kv_client.zscore(
+            key=self._activated_index_key(customer_id),
+            member=ticket_id,
+        )
+        if last_activity is None:
+            return False
+        return not self._ttl_seconds or last_activity >= time.time() - self._ttl_seconds
+
+    def get_stale_tickets(
+        self,
+        before: float,
+        limit: int = 100,
+    ) -> list[tuple[str, str, float]]:
+        """Get activated tickets with no activity since a cutoff.
+
+        Args:
+            before: Cutoff as epoch seconds.
+            limit: Maximum number of tickets to return.
+
+        Returns:
+            (customer_id, ticket_id, last_activity) tuples, least recently
+            active first.
+        """
+        members = self._kv_client.zrangebyscore(
+            key=ACTIVITY_INDEX_KEY,
+            max_score=before,
+            limit=limit,
+            withscores=True,
+        )
+        return [(*member.split(":", 1), score) for member, score in members]
+
+    def claim_stale_ticket(self, customer_id: str, ticket_id: str) -> bool:
+        """Claim a stale ticket for sweeping by removing it from the activity index.
+
+        Only one caller can remove the member, so concurrent sweepers never
+        process the same ticket twice.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+
+        Returns:
+            True if this caller claimed the ticket.
+        """
+        removed = self._kv_client.zrem(
+            key=ACTIVITY_INDEX_KEY,
+            members=[f"{customer_id}:{ticket_id}"],
+        )
+        return removed > 0
+
+    def release_stale_ticket(
+        self,
+        customer_id: str,
+        ticket_id: str,
+        last_activity: float,
+    ) -> None:
+        """Return a claimed ticket to the activity index for a later sweep.
+
+        Used by the retention sweeper (``track_activity``) when sweeping
+        fails. The ticket keeps its old score, so it is stale again on the
+        next run; if it was reactivated meanwhile, the newer score is kept.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+            last_activity: Score from ``get_stale_tickets``.
+        """
+        self._kv_client.zadd(
+            key=ACTIVITY_INDEX_KEY,
+            mapping={f"{customer_id}:{ticket_id}": last_activity},
+            nx=True,
+        )
+
+    def _summaries_key(self, customer_id: str) -> str:
+        """Build the ticket summaries hash key for a customer."""
+        return f"{TICKET_SUMMARIES_PREFIX}:{customer_id}"
+
+    def save_ticket_summary(
+        self,
+        customer_id: str,
+        ticket_id: str,
+        summary: dict,
+    ) -> None:
+        """Store a compact summary record for an activated ticket.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+            summary: Summary record (ticket_type, urgency, stage, last_message).
+        """
+        with self._kv_client.pipeline() as batch:
+            batch.hset(
+                key=self._summaries_key(customer_id),
+                mapping={ticket_id: json.dumps(summary)},
+            )
+            if self._ttl_seconds:
+                batch.expire(key=self._summaries_key(customer_id), ttl=self._ttl_seconds)
+
+    def get_ticket_summaries(self, customer_id: str) -> dict[str, dict]:
+        """Get all stored summary records for a customer in one round trip.
+
+        Args:
+            customer_id: Customer identifier.
+
+        Returns:
+            Mapping of ticket_id to summary record.
+        """
+        raw = self._kv_client.hgetall(key=self._summaries_key(customer_id))
+        return {ticket_id: json.loads(value) for ticket_id, value in raw.items()}
+
     def scan_activated_ticket_ids(self, customer_id: str) -> list[str]:
         """Scan Redis for customer's activated ticket IDs.
 
+        Walks the whole keyspace; use ``get_activated_ticket_ids`` on the
+        request path. Used by ``scripts/backfill_activated_tickets.py`` to
+        index checkpoints written before the index existed.
+
         Args:
             customer_id: Customer identifier.
 
@@ -106,7 +335,7 @@ class CheckpointRepository:
         return None
 
     def delete_ticket_checkpoints(self, customer_id: str, ticket_id: str) -> int:
-        """Delete all checkpoint data for a ticket.
+        """Deactivate a ticket and delete all its checkpoint data.
 
         Args:
             customer_id: Customer identifier.
@@ -115,8 +344,51 @@ class CheckpointRepository:
         Returns:
             Number of keys deleted.
         """
-        pattern = f"*{customer_id}*{ticket_id}*"
-        keys = self._kv_client.scan(pattern=pattern)
-        if keys:
-            self._kv_client.delete(pattern=pattern)
-        return len(keys)
+        self.deactivate_ticket(customer_id, ticket_id)
+        return self.purge_checkpoint_keys(customer_id, ticket_id)
+
+    def purge_checkpoint_keys(self, customer_id: str, ticket_id: str) -> int:
+        """Delete a ticket's checkpoint keys with pipelined UNLINK.
+
+        Reads the thread's tracked key set (written by ``TrackedRedisSaver``).
+        Threads checkpointed before tracking existed fall back to a SCAN.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+
+        Returns:
+            Number of keys deleted.
+        """
+        thread_id = f"{customer_id}:{ticket_id}"
+        tracked_key = tracked_keys_key(thread_id)
+
+        keys = self._kv_client.smembers(key=tracked_key)
+        if not keys:
+            keys = self._kv_client.scan(pattern=f"*{customer_id}*{ticket_id}*")
+
+        return self._kv_client.unlink(
+            keys=[*keys, tracked_key],
+            batch_size=self._unlink_batch_size,
+        )
+
+    def deactivate_ticket(self, customer_id: str, ticket_id: str) -> None:
+        """Remove ticket from the customer's activated index and summaries.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+        """
+        with self._kv_client.pipeline() as batch:
+            batch.zrem(
+                key=self._activated_index_key(customer_id),
+                members=[ticket_id],
+            )
+            batch.zrem(
+                key=ACTIVITY_INDEX_KEY,
+                members=[f"{customer_id}:{ticket_id}"],
+            )
+            batch.hdel(
+                key=self._summaries_key(customer_id),
+                fields=[ticket_id],
+            )
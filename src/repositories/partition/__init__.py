@@ -0,0 +1 @@
+"""Partition repository module."""
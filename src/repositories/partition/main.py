@@ -0,0 +1,204 @@
+"""Repository for PostgreSQL range partition maintenance."""
+
+import re
+from datetime import datetime
+from typing import Optional
+
+from libs.database.tabular.sql.base import BaseSQLClient
+
+LIST_PARTITIONS_SQL = """
+    SELECT child.relname AS name,
+           pg_get_expr(child.relpartbound, child.oid) AS bound
+    FROM pg_inherits
+    JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = %s
+    ORDER BY child.relname
+"""
+
+IS_PARTITIONED_SQL = """
+    SELECT 1
+    FROM pg_partitioned_table
+    JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid
+    WHERE pg_class.relname = %s
+"""
+
+DEFAULT_PARTITION_SQL = """
+    SELECT child.relname AS name
+    FROM pg_inherits
+    JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = %s AND pg_get_expr(child.relpartbound, child.oid) = 'DEFAULT'
+"""
+
+# e.g. FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')
+#      FOR VALUES FROM (MINVALUE) TO ('2026-11-01 00:00:00')
+_RANGE_BOUND = re.compile(r"FROM \((?P<lower>[^)]*)\) TO \((?P<upper>[^)]*)\)")
+
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def _parse_bound(value: str) -> Optional[datetime]:
+    """Parse one side of a range partition bound.
+
+    Args:
+        value: Bound literal, e.g. ``'2026-10-01 00:00:00'`` or ``MINVALUE``.
+
+    Returns:
+        Bound timestamp, or None for ``MINVALUE`` / ``MAXVALUE``.
+    """
+    value = value.strip()
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+def _identifier(name: str) -> str:
+    """Validate a table name before it is formatted into DDL.
+
+    Args:
+        name: Table or partition name.
+
+    Returns:
+        The name, unchanged.
+
+    Raises:
+        ValueError: If the name is not a plain lowercase identifier
+    """
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid table name: {name!r}")
+    return name
+
+
+class PartitionRepository:
+    """Pure data access for range-partitioned tables.
+
+    Lists, creates and drops the partitions of tables partitioned by
+    ``RANGE (created_at)`` (``tickets``, ``chat_messages``). A table's
+    ``DEFAULT`` partition is not listed; rows it holds for a month are
+    moved into that month's partition when it is created.
+    Contains NO business logic - only data access.
+
+    Attributes:
+        _db_client: SQL database client in autocommit mode.
+    """
+
+    def __init__(self, db_client: BaseSQLClient):
+        """Initialize partition repository.
+
+        Args:
+            db_client: SQL database client in autocommit mode (required by
+                ``DETACH PARTITION ... CONCURRENTLY``).
+        """
+        self._db_client = db_client
+
+    def is_partitioned(self, table: str) -> bool:
+        """Check whether a table is partitioned.
+
+        Args:
+            table: Table name.
+
+        Returns:
+            True if the table is partitioned, False for a plain table (e.g.
+            before migration 0004 ran) or a missing one.
+        """
+        return self._db_client.fetch_one(IS_PARTITIONED_SQL, (table,)) is not None
+
+    def list_partitions(self, table: str) -> list[dict]:
+        """List a table's partitions with their ranges.
+
+        Args:
+            table: Partitioned table name.
+
+        Returns:
+            List of dicts with ``name``, ``lower`` and ``upper`` (datetimes;
+            None for an unbounded side), without the DEFAULT partition. Empty
+            if the table is not partitioned.
+        """
+        partitions = []
+        for row in self._db_client.fetch_all(LIST_PARTITIONS_SQL, (table,)):
+            match = _RANGE_BOUND.search(row["bound"] or "")
+            if match is None:
+                continue
+            partitions.append({
+                "name": row["name"],
+                "lower": _parse_bound(match["lower"]),
+                "upper": _parse_bound(match["upper"]),
+            })
+        return partitions
+
+    def create_partition(
+        self,
+        table: str,
+        name: str,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """Create a partition for ``[start, end)`` if it does not exist.
+
+        If the DEFAULT partition already holds rows in the range, Postgres
+        refuses the new partition. In that case the DEFAULT partition is
+        detached, the partition created, the rows moved into it and DEFAULT
+        re-attached, all in one transaction.
+
+        Args:
+            table: Partitioned table name.
+            name: Partition name.
+            start: Inclusive lower bound.
+            end: Exclusive upper bound.
+        """
+        create_sql = (
+            f"CREATE TABLE IF NOT EXISTS {_identifier(name)} "
+            f"PARTITION OF {_identifier(table)} FOR VALUES FROM (%s) TO (%s)"
+        )
+        default = self._db_client.fetch_one(DEFAULT_PARTITION_SQL, (table,))
+        if default is None or not self._db_client.fetch_one(
+            f"SELECT 1 FROM {_identifier(default['name'])} "
+            "WHERE created_at >= %s AND created_at < %s LIMIT 1",
+            (start, end),
+        ):
+            self._db_client.execute(create_sql, (start, end))
+            return
+
+        default_name = _identifier(default["name"])
+        with self._db_client.transaction() as tx:
+            tx.execute(f"ALTER TABLE {_identifier(table)} DETACH PARTITION {default_name}")
+            tx.execute(create_sql, (start, end))
+            tx.execute(
+                f"WITH moved AS (DELETE FROM {default_name} "
+                "WHERE created_at >= %s AND created_at < %s RETURNING *) "
+                f"INSERT INTO {_identifier(table)} SELECT * FROM moved",
+                (start, end),
+            )
+            tx.execute(f"ALTER TABLE {_identifier(table)} ATTACH PARTITION {default_name} DEFAULT")
+
+    def drop_partition(self, table: str, name: str) -> None:
+        """Detach and drop a partition with all its rows.
+
+        ``DETACH ... CONCURRENTLY`` lets reads and writes on the parent
+        continue while the partition is removed.
+
+        Args:
+            table: Partitioned table name.
+            name: Partition name.
+        """
+        self._db_client.execute(
+            f"ALTER TABLE {_identifier(table)} DETACH PARTITION {_identifier(name)} CONCURRENTLY"
+        )
+        self._db_client.execute(f"DROP TABLE IF EXISTS {_identifier(name)}")
+
+    def delete_range(self, table: str, start: datetime, end: datetime) -> None:
+        """Delete rows of a plain table with ``created_at`` in ``[start, end)``.
+
+        Used for tables that index a partitioned one (``ticket_ids``), whose
+        rows must go when the matching partition is dropped.
+
+        Args:
+            table: Table name.
+            start: Inclusive lower bound.
+            end: Exclusive upper bound.
+        """
+        self._db_client.execute(
+            f"DELETE FROM {_identifier(table)} WHERE created_at >= %s AND created_at < %s",
+            (start, end),
+        )
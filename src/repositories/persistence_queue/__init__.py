@@ -0,0 +1 @@
+"""Persistence queue repository module."""
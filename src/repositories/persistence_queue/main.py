@@ -0,0 +1,169 @@
+"""Repository for the write-behind ticket persistence queue."""
+
+import json
+from typing import Optional
+
+from libs.database.keyvalue_db.base import BaseKeyValueClient
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+PERSISTENCE_STREAM_KEY = "triage:persistence"
+PERSISTENCE_GROUP = "ticket-persisters"
+PERSISTENCE_DEAD_LETTER_KEY = "triage:persistence:dead"
+
+
+class PersistenceQueueRepository:
+    """Pure data access for the ticket persistence stream.
+
+    Completed tickets waiting to be written to PostgreSQL are entries of a
+    Redis stream, read through a consumer group: an entry stays pending
+    until acknowledged, so a job whose worker dies is claimed by another.
+    Acknowledged entries are deleted, so the stream only holds jobs not
+    persisted yet and is never trimmed (a length cap could drop them).
+
+    Attributes:
+        _kv_client: Key-value client (Redis).
+        _stream_key: Stream holding persistence jobs.
+        _group: Consumer group shared by the workers.
+        _dead_letter_key: Stream receiving jobs that keep failing.
+    """
+
+    def __init__(
+        self,
+        kv_client: BaseKeyValueClient,
+        stream_key: str = PERSISTENCE_STREAM_KEY,
+        group: str = PERSISTENCE_GROUP,
+        dead_letter_key: str = PERSISTENCE_DEAD_LETTER_KEY,
+    ):
+        """Initialize persistence queue repository.
+
+        Args:
+            kv_client: Key-value client (Redis).
+            stream_key: Stream holding persistence jobs.
+            group: Consumer group shared by the workers.
+            dead_letter_key: Stream receiving jobs that keep failing.
+        """
+        self._kv_client = kv_client
+        self._stream_key = stream_key
+        self._group = group
+        self._dead_letter_key = dead_letter_key
+
+    def ensure_group(self) -> None:
+        """Create the stream and consumer group if missing."""
+        if self._kv_client.xgroup_create(key=self._stream_key, group=self._group):
+            logger.info(f"Created consumer group {self._group} on {self._stream_key}")
+
+    def enqueue(self, ticket: dict, messages: list[dict]) -> str:
+        """Add a persistence job.
+
+        Args:
+            ticket: Keyword arguments for ``TicketRepository.save_ticket``.
+            messages: List of message dicts with 'role' and 'content' keys.
+
+        Returns:
+            Stream entry ID of the job.
+        """
+        payload = json.dumps({"ticket": ticket, "messages": messages}, default=str)
+        return self._kv_client.xadd(key=self._stream_key, fields={"job": payload})
+
+    def read_batch(
+        self,
+        consumer: str,
+        count: int,
+        block_ms: Optional[int] = None,
+        claim_idle_ms: int = 60000,
+    ) -> list[tuple[str, Optional[dict]]]:
+        """Read up to ``count`` jobs, retrying stalled ones first.
+
+        Jobs another consumer read but did not acknowledge within
+        ``claim_idle_ms`` are claimed before new jobs are read.
+
+        Args:
+            consumer: Name of the reading worker.
+            count: Maximum jobs to return.
+            block_ms: Milliseconds to wait for new jobs when none are queued.
+            claim_idle_ms: Idle time after which a pending job is retried.
+
+        Returns:
+            List of (entry ID, job) tuples; job is None if the entry could
+            not be decoded.
+        """
+        entries = self._kv_client.xautoclaim(
+            key=self._stream_key,
+            group=self._group,
+            consumer=consumer,
+            min_idle_ms=claim_idle_ms,
+            count=count,
+        )
+        if len(entries) < count:
+            entries += self._kv_client.xreadgroup(
+                key=self._stream_key,
+                group=self._group,
+                consumer=consumer,
+                count=count - len(entries),
+                block_ms=None if entries else block_ms,
+            )
+        return [(entry_id, self._decode(fields)) for entry_id, fields in entries]
+
+    def ack(self, entry_ids: list[str]) -> int:
+        """Mark jobs as done and delete them from the stream.
+
+        Args:
+            entry_ids: Stream entry IDs of persisted jobs.
+
+        Returns:
+            Number of jobs acknowledged.
+        """
+        with self._kv_client.pipeline() as batch:
+            batch.xack(key=self._stream_key, group=self._group, ids=entry_ids)
+            batch.xdel(key=self._stream_key, ids=entry_ids)
+        return batch.results[0] if batch.results else 0
+
+    def delivery_count(self, entry_id: str) -> int:
+        """Get how many times a pending job has been delivered.
+
+        Each read and each claim of the job counts, so after a failed
+        attempt this is the number of attempts so far.
+
+        Args:
+            entry_id: Stream entry ID of the job.
+
+        Returns:
+            Delivery count, 0 if the job is not pending.
+        """
+        pending = self._kv_client.xpending(
+            key=self._stream_key, group=self._group, start=entry_id, end=entry_id, count=1
+        )
+        return pending[0][1] if pending else 0
+
+    def dead_letter(self, entry_id: str, job: dict, error: str) -> None:
+        """Move a job that keeps failing to the dead-letter stream.
+
+        The copy, the acknowledgement and the deletion go out in one
+        MULTI/EXEC, so the job is never lost or left in both streams.
+
+        Args:
+            entry_id: Stream entry ID of the job.
+            job: Decoded job.
+            error: Last persist error.
+        """
+        fields = {"job": json.dumps(job, default=str), "entry_id": entry_id, "error": error}
+        with self._kv_client.pipeline(transaction=True) as batch:
+            batch.xadd(key=self._dead_letter_key, fields=fields)
+            batch.xack(key=self._stream_key, group=self._group, ids=[entry_id])
+            batch.xdel(key=self._stream_key, ids=[entry_id])
+
+    def _decode(self, fields: dict) -> Optional[dict]:
+        """Decode a stream entry into a job.
+
+        Args:
+            fields: Stream entry fields.
+
+        Returns:
+            Job dict with 'ticket' and 'messages', or None if malformed.
+        """
+        try:
+            return json.loads(fields["job"])
+        except (KeyError, TypeError, ValueError):
+            return None
@@ -1,10 +1,117 @@
 """Repository for ticket persistence operations."""
 
+import base64
 import json
 from datetime import datetime
 from typing import Optional
 
-from libs.database.tabular.sql.base import BaseSQLClient
+from libs.database.tabular.sql.base import BaseAsyncSQLClient, BaseSQLClient
+
+# tickets is partitioned on created_at, so its primary key cannot be ticket_id
+# alone. ticket_ids (not partitioned) keeps ticket_id unique and pins each
+# ticket's created_at: the upsert claims or locks the ticket's row there first,
+# so concurrent first saves of a ticket agree on one created_at and one row.
+TICKET_KEY_CTE = """
+    ticket_key AS (
+        INSERT INTO ticket_ids (ticket_id, created_at)
+        VALUES (%s, LOCALTIMESTAMP)
+        ON CONFLICT (ticket_id) DO UPDATE SET ticket_id = EXCLUDED.ticket_id
+        RETURNING created_at
+    )
+"""
+
+INSERT_TICKET_SQL = """
+    INSERT INTO tickets (
+        ticket_id, customer_id, status, urgency, ticket_type, triage_result, closed_at,
+        created_at
+    )
+    SELECT %s, %s, %s, %s, %s, %s, %s, ticket_key.created_at
+    FROM ticket_key
+    ON CONFLICT (ticket_id, created_at) DO UPDATE SET
+        status = EXCLUDED.status,
+        urgency = EXCLUDED.urgency,
+        ticket_type = EXCLUDED.ticket_type,
+        triage_result = EXCLUDED.triage_result,
+        closed_at = EXCLUDED.closed_at
+"""
+
+UPSERT_TICKET_SQL = f"WITH {TICKET_KEY_CTE.strip()}\n{INSERT_TICKET_SQL.strip()}"
+
+
+TICKET_HISTORY_COLUMNS = """
+    ticket_id, ticket_type, urgency, status, triage_result, created_at, closed_at
+"""
+
+
+def encode_cursor(created_at: datetime, ticket_id: str) -> str:
+    """Build an opaque keyset cursor from the last row of a page.
+
+    Args:
+        created_at: ``created_at`` of the last row returned.
+        ticket_id: ``ticket_id`` of the last row returned.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = json.dumps([created_at.isoformat(), ticket_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Parse a cursor built by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string.
+
+    Returns:
+        Tuple of (created_at, ticket_id).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, ticket_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), ticket_id
+    except Exception as e:
+        raise ValueError(f"Invalid history cursor: {cursor!r}") from e
+
+
+def ticket_row(
+    ticket_id: str,
+    customer_id: str,
+    status: str,
+    urgency: str,
+    ticket_type: str,
+    triage_result: dict,
+    closed_at: Optional[datetime] = None,
+) -> tuple:
+    """Build ``UPSERT_TICKET_SQL`` parameters.
+
+    The ``TICKET_KEY_CTE`` parameter comes first, then the
+    ``INSERT_TICKET_SQL`` ones.
+
+    Args:
+        ticket_id: Unique ticket identifier.
+        customer_id: Customer identifier.
+        status: Ticket status (open, closed).
+        urgency: Urgency level.
+        ticket_type: Type of ticket (billing, technical, general).
+        triage_result: Triage result data.
+        closed_at: Timestamp when ticket was closed.
+
+    Returns:
+        Parameter tuple matching the statement's placeholders.
+    """
+    return (
+        ticket_id,
+        ticket_id,
+        customer_id,
+        status,
+        urgency,
+        ticket_type,
+        json.dumps(triage_result),
+        closed_at,
+    )
 
 
 class TicketRepository:
@@ -15,15 +122,27 @@ class TicketRepository:
 
     Attributes:
         _db_client: SQL database client.
+        _async_db_client: Async SQL client for ``a*`` methods (optional).
     """
 
-    def __init__(self, db_client: BaseSQLClient):
+    def __init__(
+        self,
+        db_client: BaseSQLClient,
+        async_db_client: Optional[BaseAsyncSQLClient] = None,
+    ):
         """Initialize ticket repository.
 
         Args:
             db_client: SQL database client.
+            async_db_client: Async SQL client (e.g. ``postgres_async``).
         """
         self._db_client = db_client
+        self._async_db_client = async_db_client
+
+    @property
+    def supports_async(self) -> bool:
+        """Whether ``a*`` methods are available."""
+        return self._async_db_client is not None
 
     def save_ticket(
         self,
@@ -47,26 +166,39 @@ class TicketRepository:
             closed_at: Timestamp when ticket was closed.
         """
         self._db_client.execute(
-            """
-            INSERT INTO tickets (
-                ticket_id, customer_id, status, urgency, ticket_type, triage_result, closed_at
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (ticket_id) DO UPDATE SET
-                status = EXCLUDED.status,
-                urgency = EXCLUDED.urgency,
-                ticket_type = EXCLUDED.ticket_type,
-                triage_result = EXCLUDED.triage_result,
-                closed_at = EXCLUDED.closed_at
-            """,
-            (
-                ticket_id,
-                customer_id,
-                status,
-                urgency,
-                ticket_type,
-                json.dumps(triage_result),
-                closed_at,
+            UPSERT_TICKET_SQL,
+            ticket_row(
+                ticket_id, customer_id, status, urgency, ticket_type,
+                triage_result, closed_at,
+            ),
+        )
+
+    async def asave_ticket(
+        self,
+        ticket_id: str,
+        customer_id: str,
+        status: str,
+        urgency: str,
+        ticket_type: str,
+        triage_result: dict,
+        closed_at: Optional[datetime] = None,
+    ) -> None:
+        """Insert or update ticket record on the async client.
+
+        Args:
+            ticket_id: Unique ticket identifier.
+            customer_id: Customer identifier.
+            status: Ticket status (open, closed).
+            urgency: Urgency level.
+            ticket_type: Type of ticket (billing, technical, general).
+            triage_result: Triage result data.
+            closed_at: Timestamp when ticket was closed.
+        """
+        await self._async_db_client.execute(
+            UPSERT_TICKET_SQL,
+            ticket_row(
+                ticket_id, customer_id, status, urgency, ticket_type,
+                triage_result, closed_at,
             ),
         )
 
@@ -97,28 +229,77 @@ class TicketRepository:
             limit: Maximum number of tickets to return.
 
         Returns:
-            List of ticket records.
+            List of ticket records, newest first.
         """
-        return self._db_client.fetch_all(
-            """
-            SELECT ticket_id, ticket_type, urgency, status, triage_result,
-                   created_at, closed_at
-            FROM tickets
-            WHERE customer_id = %s
-            ORDER BY created_at DESC
-            LIMIT %s
-            """,
-            (customer_id, limit),
-        )
+        tickets, _ = self.get_customer_history_page(customer_id, limit=limit)
+        return tickets
+
+    def get_customer_history_page(
+        self,
+        customer_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[dict], Optional[str]]:
+        """Get one page of a customer's tickets, newest first.
+
+        Keyset pagination on ``(created_at, ticket_id)``: each page is an
+        index range scan of ``idx_tickets_customer_created`` starting after
+        the previous page, so deep pages cost the same as the first one.
+        ``ticket_id`` breaks ties between tickets created in the same instant.
+
+        Args:
+            customer_id: Customer identifier.
+            limit: Maximum number of tickets per page.
+            cursor: ``next_cursor`` from the previous page; None for the first.
+
+        Returns:
+            Tuple of (tickets, next_cursor); next_cursor is None on the last
+            page.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if cursor is None:
+            rows = self._db_client.fetch_all(
+                f"""
+                SELECT {TICKET_HISTORY_COLUMNS}
+                FROM tickets
+                WHERE customer_id = %s
+                ORDER BY created_at DESC, ticket_id DESC
+                LIMIT %s
+                """,
+                (customer_id, limit + 1),
+            )
+        else:
+            created_at, ticket_id = decode_cursor(cursor)
+            rows = self._db_client.fetch_all(
+                f"""
+                SELECT {TICKET_HISTORY_COLUMNS}
+                FROM tickets
+                WHERE customer_id = %s AND (created_at, ticket_id) < (%s, %s)
+                ORDER BY created_at DESC, ticket_id DESC
+                LIMIT %s
+                """,
+                (customer_id, created_at, ticket_id, limit + 1),
+            )
+
+        # One extra row tells whether another page exists
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last["created_at"], last["ticket_id"])
 
     def get_open_tickets(self, customer_id: str) -> list[dict]:
         """Get open tickets for customer.
 
+        Served by ``idx_tickets_customer_status`` without a sort step.
+
         Args:
             customer_id: Customer identifier.
 
         Returns:
-            List of open ticket records.
+            List of open ticket records, newest first.
         """
         return self._db_client.fetch_all(
             """
@@ -129,3 +310,53 @@ class TicketRepository:
             """,
             (customer_id,),
         )
+
+    def find_tickets(
+        self,
+        urgency: Optional[str] = None,
+        product_area: Optional[str] = None,
+        recommended_action: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> list[dict]:
+        """Find tickets by triage fields within a time range.
+
+        Each filter matches an indexed expression (``idx_tickets_urgency_created``,
+        ``idx_tickets_product_area``, ``idx_tickets_recommended_action``), and
+        ``since`` / ``until`` prune the monthly partitions scanned.
+
+        Args:
+            urgency: Urgency level.
+            product_area: ``triage_result.extracted_info.product_area``.
+            recommended_action: ``triage_result.recommended_action``.
+            since: Inclusive lower bound on ``created_at``.
+            until: Exclusive upper bound on ``created_at``.
+            limit: Maximum number of tickets to return.
+
+        Returns:
+            List of ticket records, newest first.
+        """
+        conditions, params = [], []
+        for clause, value in (
+            ("urgency = %s", urgency),
+            ("triage_result->'extracted_info'->>'product_area' = %s", product_area),
+            ("triage_result->>'recommended_action' = %s", recommended_action),
+            ("created_at >= %s", since),
+            ("created_at < %s", until),
+        ):
+            if value is not None:
+                conditions.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        return self._db_client.fetch_all(
+            f"""
+            SELECT customer_id, {TICKET_HISTORY_COLUMNS}
+            FROM tickets
+            {where}
+            ORDER BY created_at DESC
+            LIMIT %s
+            """,
+            (*params, limit),
+        )
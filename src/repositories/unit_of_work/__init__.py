@@ -0,0 +1 @@
+"""Unit of work module."""
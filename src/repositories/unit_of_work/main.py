@@ -0,0 +1,158 @@
+"""Unit of work for persisting a ticket together with its conversation."""
+
+from typing import Optional
+
+from libs.database.tabular.sql.base import BaseAsyncSQLClient, BaseSQLClient, expand_values
+from src.repositories.chat.main import (
+    LOCK_TICKET_MESSAGES_SQL,
+    UPSERT_MESSAGES_SQL,
+    ChatRepository,
+    message_rows,
+)
+from src.repositories.ticket.main import (
+    INSERT_TICKET_SQL,
+    TICKET_KEY_CTE,
+    TicketRepository,
+    ticket_row,
+)
+
+
+def _ticket_with_messages_sql(ticket: dict, messages: list[dict]) -> tuple[str, list]:
+    """Combine the ticket and message upserts into one statement.
+
+    The ticket upsert (``ticket_ids`` claim, then ``tickets``) runs as
+    data-modifying CTEs, so all writes are a single statement. The caller
+    runs it after ``LOCK_TICKET_MESSAGES_SQL`` in the same transaction: the
+    CTEs are not guaranteed to run before the message upsert reads the
+    stored rows, so they do not serialize concurrent saves themselves.
+
+    Args:
+        ticket: Keyword arguments for ``TicketRepository.save_ticket``.
+        messages: List of message dicts with 'role' and 'content' keys.
+
+    Returns:
+        Tuple of (query, parameters)
+    """
+    messages_sql, message_params = expand_values(
+        UPSERT_MESSAGES_SQL,
+        message_rows(ticket["ticket_id"], ticket["customer_id"], messages),
+    )
+    query = (
+        f"WITH {TICKET_KEY_CTE.strip()},\n"
+        f"saved_ticket AS ({INSERT_TICKET_SQL.strip()} RETURNING ticket_id)\n"
+        f"{messages_sql.strip()}"
+    )
+    return query, [*ticket_row(**ticket), *message_params]
+
+
+class TicketUnitOfWork:
+    """Writes a ticket row and all its chat messages as one unit.
+
+    Either everything is stored or nothing is: a conversation up to
+    ``max_statement_rows`` messages is written with a single statement,
+    longer ones with the repositories' batched writes. Both run in one
+    transaction holding the ticket's message lock, so concurrent saves of
+    the same ticket cannot duplicate its conversation.
+
+    Attributes:
+        _db_client: SQL database client.
+        _async_db_client: Async SQL client for ``a*`` methods (optional).
+        _max_statement_rows: Largest conversation written as one statement.
+    """
+
+    def __init__(
+        self,
+        db_client: BaseSQLClient,
+        async_db_client: Optional[BaseAsyncSQLClient] = None,
+        max_statement_rows: int = 1000,
+    ):
+        """Initialize unit of work.
+
+        Args:
+            db_client: SQL database client with ``transaction()``.
+            async_db_client: Async SQL client (e.g. ``postgres_async``).
+            max_statement_rows: Largest conversation written as one
+                statement; longer ones use a transaction.
+        """
+        self._db_client = db_client
+        self._async_db_client = async_db_client
+        self._max_statement_rows = max_statement_rows
+
+    @property
+    def supports_async(self) -> bool:
+        """Whether ``a*`` methods are available."""
+        return self._async_db_client is not None
+
+    def save_ticket_with_messages(self, ticket: dict, messages: list[dict]) -> int:
+        """Upsert a ticket and its conversation atomically.
+
+        Args:
+            ticket: Keyword arguments for ``TicketRepository.save_ticket``.
+            messages: List of message dicts with 'role' and 'content' keys,
+                in conversation order.
+
+        Returns:
+            Number of messages saved.
+        """
+        if not messages:
+            TicketRepository(self._db_client).save_ticket(**ticket)
+            return 0
+        if len(messages) <= self._max_statement_rows:
+            with self._db_client.transaction() as tx:
+                tx.execute(LOCK_TICKET_MESSAGES_SQL, (ticket["ticket_id"],))
+                tx.execute(*_ticket_with_messages_sql(ticket, messages))
+            return len(messages)
+
+        with self._db_client.transaction() as tx:
+            # Same lock order as the single statement (lock, then ticket_ids row)
+            tx.execute(LOCK_TICKET_MESSAGES_SQL, (ticket["ticket_id"],))
+            TicketRepository(tx).save_ticket(**ticket)
+            return ChatRepository(tx).save_messages(
+                ticket["ticket_id"], ticket["customer_id"], messages
+            )
+
+    def save_batch(self, items: list[tuple[dict, list[dict]]]) -> int:
+        """Save several tickets with their conversations in one transaction.
+
+        Args:
+            items: List of (ticket, messages) pairs as taken by
+                ``save_ticket_with_messages``.
+
+        Returns:
+            Number of messages saved.
+        """
+        saved = 0
+        with self._db_client.transaction() as tx:
+            unit_of_work = TicketUnitOfWork(tx, max_statement_rows=self._max_statement_rows)
+            for ticket, messages in items:
+                saved += unit_of_work.save_ticket_with_messages(ticket, messages)
+        return saved
+
+    async def asave_ticket_with_messages(self, ticket: dict, messages: list[dict]) -> int:
+        """Upsert a ticket and its conversation atomically on the async client.
+
+        Args:
+            ticket: Keyword arguments for ``TicketRepository.save_ticket``.
+            messages: List of message dicts with 'role' and 'content' keys,
+                in conversation order.
+
+        Returns:
+            Number of messages saved.
+        """
+        if not messages:
+            await TicketRepository(self._db_client, self._async_db_client).asave_ticket(
+                **ticket
+            )
+            return 0
+        if len(messages) <= self._max_statement_rows:
+            async with self._async_db_client.transaction() as tx:
+                await tx.execute(LOCK_TICKET_MESSAGES_SQL, (ticket["ticket_id"],))
+                await tx.execute(*_ticket_with_messages_sql(ticket, messages))
+            return len(messages)
+
+        async with self._async_db_client.transaction() as tx:
+            await tx.execute(LOCK_TICKET_MESSAGES_SQL, (ticket["ticket_id"],))
+            await TicketRepository(self._db_client, tx).asave_ticket(**ticket)
+            return await ChatRepository(self._db_client, tx).asave_messages(
+                ticket["ticket_id"], ticket["customer_id"], messages
+            )
@@ -0,0 +1 @@
+"""Partition retention service module."""
@@ -0,0 +1,181 @@
+"""Partition retention use case - keep monthly partitions ahead, drop old ones."""
+
+from datetime import datetime
+from typing import Optional
+
+from src.repositories.partition.main import PartitionRepository
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+PARTITIONED_TABLES = ("tickets", "chat_messages")
+
+# Plain tables keyed on a partitioned table's rows, pruned with its partitions
+LOOKUP_TABLES = {"tickets": "ticket_ids"}
+
+
+def month_start(value: datetime, offset: int = 0) -> datetime:
+    """First instant of the month ``offset`` months after ``value``'s.
+
+    Args:
+        value: Any timestamp.
+        offset: Months to move (negative moves back).
+
+    Returns:
+        Midnight on the first day of the target month.
+    """
+    index = value.year * 12 + value.month - 1 + offset
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+class PartitionRetentionService:
+    """Use case for maintaining the monthly partitions of ticket storage.
+
+    ``tickets`` and ``chat_messages`` are range-partitioned by month on
+    ``created_at``. Each run creates partitions for the coming months before
+    inserts need them and drops monthly partitions whose whole range is older
+    than the retention period. Dropping a partition removes its rows without
+    the table bloat and vacuum work of a bulk ``DELETE``. Partitions with an
+    unbounded range (the legacy partition from the migration) are never
+    dropped, and the DEFAULT partition is not listed at all. Tables that are
+    not partitioned yet (migration 0004 not applied) are skipped.
+
+    Attributes:
+        _partition_repo: Repository for partition DDL.
+        _tables: Partitioned tables to maintain.
+        _premake_months: Future months that must have a partition.
+        _retention_months: Months of data kept; None keeps everything.
+        _unpartitioned: Tables already reported as not partitioned.
+    """
+
+    def __init__(
+        self,
+        partition_repo: PartitionRepository,
+        tables: tuple[str, ...] = PARTITIONED_TABLES,
+        premake_months: int = 3,
+        retention_months: Optional[int] = None,
+    ):
+        """Initialize partition retention service.
+
+        Args:
+            partition_repo: Repository for partition DDL.
+            tables: Partitioned tables to maintain.
+            premake_months: Future months that must have a partition.
+            retention_months: Months of data kept, counting the current
+                month; None keeps everything.
+        """
+        self._partition_repo = partition_repo
+        self._tables = tables
+        self._premake_months = premake_months
+        self._retention_months = retention_months
+        self._unpartitioned: set[str] = set()
+        logger.info(
+            f"PartitionRetentionService initialized (premake={premake_months} months, "
+            f"retention={retention_months or 'unlimited'} months)"
+        )
+
+    def run(self, now: Optional[datetime] = None) -> dict:
+        """Create upcoming partitions and drop expired ones.
+
+        A failure on one table is logged and does not stop the others. A
+        table that is not partitioned is skipped, with a warning on its first
+        run only.
+
+        Args:
+            now: Current time (UTC); defaults to ``datetime.utcnow()``.
+
+        Returns:
+            Dict with the ``created`` and ``dropped`` partition names.
+        """
+        now = now or datetime.utcnow()
+        created: list[str] = []
+        dropped: list[str] = []
+        for table in self._tables:
+            try:
+                if not self._partition_repo.is_partitioned(table):
+                    if table not in self._unpartitioned:
+                        self._unpartitioned.add(table)
+                        logger.warning(
+                            f"{table} is not partitioned; skipping partition maintenance "
+                            f"(apply migration 0004)"
+                        )
+                    continue
+                self._unpartitioned.discard(table)
+                partitions = self._partition_repo.list_partitions(table)
+                created += self._premake(table, partitions, now)
+                dropped += self._expire(table, partitions, now)
+            except Exception as e:
+                logger.error(f"Partition maintenance failed for {table}: {e}")
+
+        if created or dropped:
+            logger.info(f"Partitions created: {created}, dropped: {dropped}")
+        return {"created": created, "dropped": dropped}
+
+    def _premake(self, table: str, partitions: list[dict], now: datetime) -> list[str]:
+        """Create missing partitions from the current month onwards.
+
+        Months already covered by another partition (e.g. the legacy
+        partition from the migration) are skipped.
+
+        Args:
+            table: Partitioned table name.
+            partitions: Existing partitions from ``list_partitions``.
+            now: Current time.
+
+        Returns:
+            Names of the partitions created.
+        """
+        created = []
+        for offset in range(self._premake_months + 1):
+            start, end = month_start(now, offset), month_start(now, offset + 1)
+            if any(self._overlaps(p, start, end) for p in partitions):
+                continue
+            name = f"{table}_p{start:%Y%m}"
+            self._partition_repo.create_partition(table, name, start, end)
+            created.append(name)
+        return created
+
+    def _expire(self, table: str, partitions: list[dict], now: datetime) -> list[str]:
+        """Drop monthly partitions whose whole range is past the retention period.
+
+        Partitions with an unbounded lower side (``*_legacy``) hold all data
+        from before partitioning and are kept; they are dropped by hand.
+
+        Args:
+            table: Partitioned table name.
+            partitions: Existing partitions from ``list_partitions``.
+            now: Current time.
+
+        Returns:
+            Names of the partitions dropped.
+        """
+        if self._retention_months is None:
+            return []
+
+        cutoff = month_start(now, 1 - self._retention_months)
+        dropped = []
+        for partition in partitions:
+            if partition["lower"] is None or partition["upper"] is None:
+                continue
+            if partition["upper"] <= cutoff:
+                self._partition_repo.drop_partition(table, partition["name"])
+                dropped.append(partition["name"])
+                if table in LOOKUP_TABLES:
+                    self._partition_repo.delete_range(
+                        LOOKUP_TABLES[table], partition["lower"], partition["upper"]
+                    )
+        return dropped
+
+    def _overlaps(self, partition: dict, start: datetime, end: datetime) -> bool:
+        """Whether a partition's range intersects ``[start, end)``.
+
+        Args:
+            partition: Partition from ``list_partitions``.
+            start: Inclusive lower bound.
+            end: Exclusive upper bound.
+
+        Returns:
+            True if the ranges overlap.
+        """
+        lower, upper = partition["lower"], partition["upper"]
+        return (lower is None or lower < end) and (upper is None or upper > start)
@@ -0,0 +1 @@
+"""Ticket persistence service module."""
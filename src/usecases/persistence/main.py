@@ -0,0 +1,179 @@
+"""Ticket persistence use case - drain the write-behind queue."""
+
+import os
+import socket
+from typing import Optional
+
+from src.repositories.checkpoint.main import CheckpointRepository
+from src.repositories.persistence_queue.main import PersistenceQueueRepository
+from src.repositories.unit_of_work.main import TicketUnitOfWork
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TicketPersistenceService:
+    """Use case for writing queued completed tickets to PostgreSQL.
+
+    In write-behind mode ``TriageService`` enqueues completed tickets instead
+    of persisting them on the request path. Each ``drain()`` call takes a
+    batch of jobs, writes them in one transaction, acknowledges them, and
+    deletes the tickets' Redis checkpoints. Jobs that fail stay pending and
+    are retried after ``claim_idle_seconds``, by this or another worker; a
+    job that has failed ``max_deliveries`` times (e.g. a row violating a
+    constraint) is moved to the dead-letter stream instead.
+
+    Attributes:
+        _queue_repo: Repository for the persistence stream.
+        _unit_of_work: Atomic ticket + messages writer.
+        _checkpoint_repo: Repository for checkpoint/Redis operations.
+        _batch_size: Maximum jobs per drain.
+        _block_ms: Wait for new jobs when the queue is empty.
+        _claim_idle_ms: Idle time after which a pending job is retried.
+        _max_deliveries: Attempts before a job is dead-lettered.
+        _consumer: Consumer name of this worker.
+    """
+
+    def __init__(
+        self,
+        queue_repo: PersistenceQueueRepository,
+        unit_of_work: TicketUnitOfWork,
+        checkpoint_repo: CheckpointRepository,
+        batch_size: int = 50,
+        block_ms: int = 1000,
+        claim_idle_seconds: float = 60,
+        max_deliveries: int = 5,
+        consumer: Optional[str] = None,
+    ):
+        """Initialize ticket persistence service.
+
+        Args:
+            queue_repo: Repository for the persistence stream.
+            unit_of_work: Atomic ticket + messages writer.
+            checkpoint_repo: Repository for checkpoint/Redis operations.
+            batch_size: Maximum jobs per drain (and per transaction).
+            block_ms: Milliseconds to wait for new jobs when the queue is
+                empty. Keep below the Redis socket timeout.
+            claim_idle_seconds: Time after which a job read but not
+                acknowledged (failed, or its worker died) is retried.
+            max_deliveries: Attempts after which a failing job is moved to
+                the dead-letter stream.
+            consumer: Consumer name; defaults to ``<hostname>-<pid>``.
+        """
+        self._queue_repo = queue_repo
+        self._unit_of_work = unit_of_work
+        self._checkpoint_repo = checkpoint_repo
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._claim_idle_ms = int(claim_idle_seconds * 1000)
+        self._max_deliveries = max_deliveries
+        self._consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+        logger.info(f"TicketPersistenceService initialized (consumer={self._consumer})")
+
+    def drain(self) -> int:
+        """Persist one batch of queued tickets.
+
+        Blocks up to ``block_ms`` when the queue is empty, so it can be
+        called in a loop.
+
+        Returns:
+            Number of tickets persisted.
+        """
+        if not self._group_ready:
+            self._queue_repo.ensure_group()
+            self._group_ready = True
+
+        entries = self._queue_repo.read_batch(
+            consumer=self._consumer,
+            count=self._batch_size,
+            block_ms=self._block_ms,
+            claim_idle_ms=self._claim_idle_ms,
+        )
+        if not entries:
+            return 0
+
+        malformed = [entry_id for entry_id, job in entries if job is None]
+        if malformed:
+            logger.error(f"Dropping {len(malformed)} malformed persistence jobs: {malformed}")
+            self._queue_repo.ack(malformed)
+
+        jobs = [(entry_id, job) for entry_id, job in entries if job is not None]
+        persisted, errors = self._persist(jobs)
+        if persisted:
+            self._queue_repo.ack([entry_id for entry_id, _ in persisted])
+            for _, job in persisted:
+                self._purge_checkpoints(job["ticket"])
+            logger.info(f"Persisted {len(persisted)} queued tickets")
+        for entry_id, job in jobs:
+            if entry_id in errors:
+                self._retry_or_dead_letter(entry_id, job, errors[entry_id])
+        return len(persisted)
+
+    def _persist(
+        self, jobs: list[tuple[str, dict]]
+    ) -> tuple[list[tuple[str, dict]], dict[str, str]]:
+        """Write jobs in one transaction, one by one if the batch fails.
+
+        Args:
+            jobs: List of (entry ID, job) tuples.
+
+        Returns:
+            Tuple of (jobs written, error message by entry ID of the failed
+            jobs).
+        """
+        if not jobs:
+            return [], {}
+        try:
+            self._unit_of_work.save_batch(
+                [(job["ticket"], job["messages"]) for _, job in jobs]
+            )
+            return jobs, {}
+        except Exception as e:
+            if len(jobs) == 1:
+                logger.error(f"Failed to persist ticket {jobs[0][1]['ticket']['ticket_id']}: {e}")
+                return [], {jobs[0][0]: str(e)}
+            logger.warning(f"Batch persist failed, retrying tickets one by one: {e}")
+
+        persisted = []
+        errors = {}
+        for entry_id, job in jobs:
+            try:
+                self._unit_of_work.save_ticket_with_messages(job["ticket"], job["messages"])
+                persisted.append((entry_id, job))
+            except Exception as e:
+                logger.error(f"Failed to persist ticket {job['ticket']['ticket_id']}: {e}")
+                errors[entry_id] = str(e)
+        return persisted, errors
+
+    def _retry_or_dead_letter(self, entry_id: str, job: dict, error: str) -> None:
+        """Leave a failed job pending for retry, or dead-letter it.
+
+        Args:
+            entry_id: Stream entry ID of the job.
+            job: Job that failed.
+            error: Persist error message.
+        """
+        try:
+            if self._queue_repo.delivery_count(entry_id) < self._max_deliveries:
+                return
+            self._queue_repo.dead_letter(entry_id, job, error)
+            logger.error(
+                f"Dead-lettered ticket {job['ticket']['ticket_id']} after "
+                f"{self._max_deliveries} failed attempts: {error}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to dead-letter persistence job {entry_id}: {e}")
+
+    def _purge_checkpoints(self, ticket: dict) -> None:
+        """Delete a persisted ticket's checkpoint keys.
+
+        Args:
+            ticket: Ticket record from the job.
+        """
+        try:
+            self._checkpoint_repo.purge_checkpoint_keys(
+                ticket["customer_id"], ticket["ticket_id"]
+            )
+        except Exception as e:
+            logger.error(f"Checkpoint cleanup failed for ticket {ticket['ticket_id']}: {e}")
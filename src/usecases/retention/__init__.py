@@ -0,0 +1 @@
+"""Checkpoint retention service module."""
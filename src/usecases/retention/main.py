@@ -0,0 +1,152 @@
+"""Checkpoint retention use case - sweep abandoned activated tickets."""
+
+import time
+from typing import Any, Optional
+
+from src.repositories.checkpoint.main import CheckpointRepository
+from src.repositories.ticket.main import TicketRepository
+from src.repositories.chat.main import ChatRepository
+from src.repositories.unit_of_work.main import TicketUnitOfWork
+from libs.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CheckpointRetentionService:
+    """Use case for retiring activated tickets customers never followed up on.
+
+    Checkpoint keys carry a Redis TTL. Before it lapses, the sweeper picks up
+    tickets idle longer than ``abandon_after_seconds``, persists the ones with
+    a triage result to PostgreSQL as ``pending``, and removes them from Redis.
+
+    Attributes:
+        _checkpoint_repo: Repository for checkpoint/Redis operations.
+        _ticket_repo: Repository for ticket SQL operations.
+        _chat_repo: Repository for chat message SQL operations.
+        _unit_of_work: Atomic ticket + messages writer (optional).
+        _abandon_after_seconds: Idle time after which a ticket is swept.
+        _batch_size: Maximum tickets swept per run.
+    """
+
+    def __init__(
+        self,
+        checkpoint_repo: CheckpointRepository,
+        ticket_repo: TicketRepository,
+        chat_repo: ChatRepository,
+        abandon_after_seconds: float,
+        batch_size: int = 100,
+        unit_of_work: Optional[TicketUnitOfWork] = None,
+    ):
+        """Initialize retention service.
+
+        Args:
+            checkpoint_repo: Repository for checkpoint/Redis operations.
+            ticket_repo: Repository for ticket SQL operations.
+            chat_repo: Repository for chat message SQL operations.
+            abandon_after_seconds: Idle time after which a ticket is swept.
+                Must be shorter than the checkpoint TTL.
+            batch_size: Maximum tickets swept per run.
+            unit_of_work: Writes the ticket and its messages in one
+                statement/transaction (optional).
+        """
+        self._checkpoint_repo = checkpoint_repo
+        self._ticket_repo = ticket_repo
+        self._chat_repo = chat_repo
+        self._unit_of_work = unit_of_work
+        self._abandon_after_seconds = abandon_after_seconds
+        self._batch_size = batch_size
+        logger.info("CheckpointRetentionService initialized")
+
+    def sweep(self) -> int:
+        """Sweep one batch of abandoned tickets.
+
+        Returns:
+            Number of tickets swept.
+        """
+        cutoff = time.time() - self._abandon_after_seconds
+        stale = self._checkpoint_repo.get_stale_tickets(before=cutoff, limit=self._batch_size)
+
+        swept = 0
+        for customer_id, ticket_id, last_activity in stale:
+            if not self._checkpoint_repo.claim_stale_ticket(customer_id, ticket_id):
+                continue
+            try:
+                self._sweep_ticket(customer_id, ticket_id)
+                swept += 1
+            except Exception as e:
+                logger.error(f"Failed to sweep ticket {ticket_id}, retrying next run: {e}")
+                self._checkpoint_repo.release_stale_ticket(customer_id, ticket_id, last_activity)
+
+        if swept:
+            logger.info(f"Swept {swept} abandoned tickets")
+        return swept
+
+    def _sweep_ticket(self, customer_id: str, ticket_id: str) -> None:
+        """Persist an abandoned ticket if meaningful, then evict it from Redis.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+        """
+        checkpoint_tuple = self._checkpoint_repo.get_checkpoint(customer_id, ticket_id)
+        state = checkpoint_tuple.checkpoint.get("channel_values", {}) if checkpoint_tuple else {}
+
+        triage_result = self._as_dict(state.get("triage_result"))
+        if triage_result:
+            self._persist_pending(customer_id, ticket_id, triage_result, state.get("messages", []))
+        else:
+            logger.info(f"Ticket {ticket_id} has no triage result, evicting without persisting")
+
+        self._checkpoint_repo.delete_ticket_checkpoints(customer_id, ticket_id)
+
+    def _persist_pending(
+        self,
+        customer_id: str,
+        ticket_id: str,
+        triage_result: dict,
+        messages: list,
+    ) -> None:
+        """Save abandoned ticket and its messages with status pending.
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+            triage_result: Triage result as dict.
+            messages: LangChain messages from checkpoint state.
+        """
+        record = {
+            "ticket_id": ticket_id,
+            "customer_id": customer_id,
+            "status": "pending",
+            "urgency": triage_result.get("urgency"),
+            "ticket_type": (triage_result.get("extracted_info") or {}).get("product_area"),
+            "triage_result": triage_result,
+        }
+
+        msg_dicts = []
+        for msg in messages:
+            role = "human" if getattr(msg, "type", None) == "human" else "ai"
+            msg_dicts.append({"role": role, "content": msg.content})
+
+        if self._unit_of_work is not None:
+            self._unit_of_work.save_ticket_with_messages(record, msg_dicts)
+        else:
+            self._ticket_repo.save_ticket(**record)
+            if msg_dicts:
+                self._chat_repo.save_messages(ticket_id, customer_id, msg_dicts)
+        logger.info(f"Persisted abandoned ticket as pending: {ticket_id}")
+
+    def _as_dict(self, value: Any) -> dict:
+        """Normalize a checkpointed pydantic model or dict to a JSON-safe dict.
+
+        Args:
+            value: Deserialized channel value.
+
+        Returns:
+            Dict form, empty if value is missing.
+        """
+        if value is None:
+            return {}
+        if hasattr(value, "model_dump"):
+            return value.model_dump(mode="json")
+        return dict(value)
@@ -1,15 +1,23 @@
 """Triage use case - application business logic."""
 
+import asyncio
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Any
 
 from langchain.tools import BaseTool
+from pydantic import ValidationError
 
 from src.modules.graph.workflow import MultiAgentWorkflow
+from src.modules.graph.state import TicketMatchInput, TicketMatchResult
 from src.modules.agents.base import BaseAgent
+from src.modules.agents.ticket_matcher.prematch import EmbeddingTicketPrematcher
+from src.modules.agents.ticket_matcher.tools.ticket_summarize import format_ticket_summary
 from src.repositories.checkpoint.main import CheckpointRepository
 from src.repositories.ticket.main import TicketRepository
 from src.repositories.chat.main import ChatRepository
+from src.repositories.unit_of_work.main import TicketUnitOfWork
+from src.repositories.persistence_queue.main import PersistenceQueueRepository
 from src.entities.ticket import Ticket
 from src.entities.triage_result import RecommendedAction
 from libs.logger.logger import get_logger
@@ -21,7 +29,8 @@ class TriageService:
     """Use case for ticket triage operations.
 
     Handles:
-    - Pre-workflow: scan activated tickets, summarize, match
+    - Pre-workflow: scan activated tickets, pre-match by embedding,
+      summarize and LLM-match the ambiguous ones
     - Workflow execution: agent graph only
     - Post-workflow: persist completed tickets or keep activated
 
@@ -34,8 +43,14 @@ class TriageService:
         _checkpoint_repo: Repository for checkpoint/Redis operations.
         _ticket_repo: Repository for ticket SQL operations.
         _chat_repo: Repository for chat message SQL operations.
+        _unit_of_work: Atomic ticket + messages writer (optional).
+        _persistence_queue: Write-behind queue for completed tickets (optional).
         _ticket_matcher_agent: Agent for matching messages to activated tickets.
         _ticket_summarize_tool: Tool for summarizing activated tickets.
+        _ticket_prematcher: Embedding similarity pre-matcher (optional).
+        _summary_deadline_seconds: Per-request budget for tool summaries.
+        _summary_executor: Workers for tool summaries of activated tickets.
+        _cleanup_executor: Worker for Redis cleanup off the request path.
     """
 
     def __init__(
@@ -46,6 +61,13 @@ class TriageService:
         chat_repo: ChatRepository,
         ticket_matcher_agent: Optional[BaseAgent] = None,
         ticket_summarize_tool: Optional[BaseTool] = None,
+        background_cleanup: bool = False,
+        unit_of_work: Optional[TicketUnitOfWork] = None,
+        persistence_queue: Optional[PersistenceQueueRepository] = None,
+        ticket_prematcher: Optional[EmbeddingTicketPrematcher] = None,
+        trust_supplied_ticket_id: bool = False,
+        summary_workers: int = 4,
+        summary_deadline_seconds: Optional[float] = None,
     ):
         """Initialize triage service.
 
@@ -56,15 +78,60 @@ class TriageService:
             chat_repo: Repository for chat message SQL operations.
             ticket_matcher_agent: Optional agent for ticket matching.
             ticket_summarize_tool: Optional tool for ticket summarization.
+            background_cleanup: Delete completed tickets' checkpoint keys in a
+                background worker instead of on the request path.
+            unit_of_work: Writes a completed ticket and its messages in one
+                statement/transaction. Without it they are saved separately
+                through the ticket and chat repositories.
+            persistence_queue: Write-behind mode: completed tickets are
+                queued for ``TicketPersistenceService`` instead of written
+                to PostgreSQL on the request path.
+            ticket_prematcher: Scores new messages against activated
+                tickets' embeddings first; the LLM matcher only decides
+                the ambiguous cases. Also embeds tickets on activation.
+            trust_supplied_ticket_id: Skip matching when the request's
+                ticket_id is one of the customer's activated tickets
+                (for channels that track their own ticket IDs).
+            summary_workers: Maximum tool summaries running at once, shared
+                by all requests.
+            summary_deadline_seconds: Time a request waits for tool
+                summaries; tickets not summarized by then are left out of
+                matching (None = wait for all).
         """
         self._workflow = workflow
         self._checkpoint_repo = checkpoint_repo
         self._ticket_repo = ticket_repo
         self._chat_repo = chat_repo
+        self._unit_of_work = unit_of_work
+        self._persistence_queue = persistence_queue
         self._ticket_matcher_agent = ticket_matcher_agent
         self._ticket_summarize_tool = ticket_summarize_tool
+        self._ticket_prematcher = ticket_prematcher
+        self._trust_supplied_ticket_id = trust_supplied_ticket_id
+        self._summary_deadline_seconds = summary_deadline_seconds
+        self._summary_executor = (
+            ThreadPoolExecutor(max_workers=summary_workers, thread_name_prefix="ticket-summary")
+            if ticket_summarize_tool
+            else None
+        )
+        self._cleanup_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-cleanup")
+            if background_cleanup
+            else None
+        )
         logger.info("TriageService initialized")
 
+    def shutdown(self) -> None:
+        """Stop background workers.
+
+        Queued ticket summaries are cancelled without waiting; pending
+        background cleanup is waited for.
+        """
+        if self._summary_executor:
+            self._summary_executor.shutdown(wait=False, cancel_futures=True)
+        if self._cleanup_executor:
+            self._cleanup_executor.shutdown(wait=True)
+
     def triage_ticket(
         self,
         ticket: Ticket,
@@ -103,6 +170,46 @@ class TriageService:
         logger.info(f"Triage complete for ticket: {final_ticket_id}")
         return result
 
+    async def atriage_ticket(
+        self,
+        ticket: Ticket,
+        config: Optional[dict[str, Any]] = None,
+    ) -> dict:
+        """Execute full triage flow with the workflow on the event loop.
+
+        Use with an async checkpointer. Ticket matching makes sync Redis/LLM
+        calls and runs in a worker thread; the agent graph and its checkpoint
+        reads/writes run natively async, as does PostgreSQL persistence when
+        the repositories have an async client.
+
+        Args:
+            ticket: Ticket to triage.
+            config: Optional workflow configuration.
+
+        Returns:
+            Workflow result containing triage decision.
+        """
+        customer_id = ticket.customer_id
+        new_message = ticket.messages[-1].content if ticket.messages else ""
+
+        logger.info(f"Starting async triage for customer: {customer_id}")
+
+        # === PRE-WORKFLOW: Ticket matching ===
+        final_ticket_id = await asyncio.to_thread(
+            self._resolve_ticket_id, ticket, customer_id, new_message
+        )
+        ticket.ticket_id = final_ticket_id
+
+        # === WORKFLOW: Agent execution ===
+        run_config = self._build_config(config, customer_id, final_ticket_id)
+        result = await self._workflow.ainvoke(ticket, run_config)
+
+        # === POST-WORKFLOW: Persist or keep activated ===
+        await self._ahandle_persistence(result, ticket)
+
+        logger.info(f"Triage complete for ticket: {final_ticket_id}")
+        return result
+
     def _resolve_ticket_id(
         self,
         ticket: Ticket,
@@ -120,12 +227,20 @@ class TriageService:
             Resolved ticket ID.
         """
         if self._ticket_matcher_agent:
-            activated_ids = self._checkpoint_repo.scan_activated_ticket_ids(customer_id)
+            # Fast path: the client named an activated thread, nothing to match
+            if (
+                self._trust_supplied_ticket_id
+                and ticket.ticket_id
+                and self._checkpoint_repo.is_ticket_activated(customer_id, ticket.ticket_id)
+            ):
+                logger.info(f"Using supplied activated ticket: {ticket.ticket_id}")
+                return ticket.ticket_id
+
+            activated_ids = self._checkpoint_repo.get_activated_ticket_ids(customer_id)
             logger.info(f"Found {len(activated_ids)} activated tickets for customer")
 
             if activated_ids:
-                summaries = self._get_ticket_summaries(customer_id, activated_ids)
-                matched_id = self._match_ticket(new_message, summaries)
+                matched_id = self._find_activated_ticket(customer_id, activated_ids, new_message)
                 if matched_id:
                     logger.info(f"Matched to activated ticket: {matched_id}")
                     return matched_id
@@ -138,35 +253,97 @@ class TriageService:
         logger.info(f"Generated new ticket ID: {new_id}")
         return new_id
 
+    def _find_activated_ticket(
+        self,
+        customer_id: str,
+        activated_ids: list[str],
+        new_message: str,
+    ) -> Optional[str]:
+        """Match a message to one of the customer's activated tickets.
+
+        With a prematcher, clear matches and clear non-matches are decided
+        by embedding similarity; only the remaining candidates are sent to
+        the LLM matcher.
+
+        Args:
+            customer_id: Customer identifier.
+            activated_ids: Activated ticket IDs.
+            new_message: Latest message content.
+
+        Returns:
+            Matched ticket ID or None.
+        """
+        # All precomputed summary records for the customer in one round trip
+        records = self._checkpoint_repo.get_ticket_summaries(customer_id)
+
+        candidates = activated_ids
+        if self._ticket_prematcher:
+            prematch = self._ticket_prematcher.prematch(
+                new_message, {ticket_id: records.get(ticket_id) for ticket_id in activated_ids}
+            )
+            if prematch["matched_ticket_id"] or not prematch["candidates"]:
+                return prematch["matched_ticket_id"]
+            candidates = prematch["candidates"]
+
+        summaries = self._get_ticket_summaries(customer_id, candidates, records)
+        return self._match_ticket(new_message, summaries)
+
     def _get_ticket_summaries(
         self,
         customer_id: str,
         ticket_ids: list[str],
+        records: dict[str, dict],
     ) -> list[dict]:
         """Get summaries for activated tickets.
 
+        Uses the precomputed summary records; tickets without a record fall
+        back to the summarize tool. Tool summaries run concurrently, and
+        those not finished within the summary deadline are skipped.
+
         Args:
             customer_id: Customer identifier.
             ticket_ids: List of activated ticket IDs.
+            records: Summary records by ticket ID.
 
         Returns:
             List of ticket summaries.
         """
-        if not self._ticket_summarize_tool:
-            return []
-
-        summaries = []
+        summaries = {}
+        futures = {}
         for ticket_id in ticket_ids:
-            try:
-                summary = self._ticket_summarize_tool._run(
+            record = records.get(ticket_id)
+            if record:
+                summaries[ticket_id] = format_ticket_summary(ticket_id, record)
+            elif self._summary_executor:
+                futures[ticket_id] = self._summary_executor.submit(
+                    self._ticket_summarize_tool._run,
                     ticket_id=ticket_id,
                     customer_id=customer_id,
                 )
-                summaries.append({"ticket_id": ticket_id, "summary": summary})
-            except Exception as e:
-                logger.warning(f"Failed to summarize ticket {ticket_id}: {e}")
 
-        return summaries
+        if futures:
+            done, not_done = wait(futures.values(), timeout=self._summary_deadline_seconds)
+            for ticket_id, future in futures.items():
+                if future not in done:
+                    continue
+                try:
+                    summaries[ticket_id] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to summarize ticket {ticket_id}: {e}")
+
+            if not_done:
+                for future in not_done:
+                    future.cancel()
+                logger.warning(
+                    f"Skipped {len(not_done)} ticket summaries after "
+                    f"{self._summary_deadline_seconds}s deadline"
+                )
+
+        return [
+            {"ticket_id": ticket_id, "summary": summaries[ticket_id]}
+            for ticket_id in ticket_ids
+            if ticket_id in summaries
+        ]
 
     def _match_ticket(
         self,
@@ -185,16 +362,19 @@ class TriageService:
         if not self._ticket_matcher_agent or not activated_tickets:
             return None
 
-        state = {
-            "new_message": new_message,
-            "activated_tickets": activated_tickets,
-        }
-        result = self._ticket_matcher_agent.execute(state)
-        match_result = result.get("match_result", {})
+        try:
+            match_input = TicketMatchInput(
+                new_message=new_message,
+                activated_tickets=activated_tickets,
+            )
+            result = self._ticket_matcher_agent.execute(match_input.model_dump())
+            match_result = TicketMatchResult.model_validate(result.get("match_result") or {})
+        except ValidationError as e:
+            logger.warning(f"Invalid ticket match input or result, creating new ticket: {e}")
+            return None
 
-        confidence = match_result.get("confidence", "low")
-        if confidence in ("high", "medium"):
-            return match_result.get("matched_ticket_id")
+        if match_result.confidence in ("high", "medium"):
+            return match_result.matched_ticket_id
 
         return None
 
@@ -234,10 +414,106 @@ class TriageService:
         action = triage_result.recommended_action
 
         if action in (RecommendedAction.AUTO_RESPOND, RecommendedAction.ESCALATE_HUMAN):
+            if self._persistence_queue is not None:
+                self._enqueue_ticket(result, ticket)
+                return
             logger.info(f"Ticket completed ({action.value}), persisting to PostgreSQL")
             self._persist_ticket(result, ticket)
         else:
             logger.info(f"Ticket needs continuation ({action.value}), keeping activated in Redis")
+            self._checkpoint_repo.mark_ticket_activated(
+                ticket.customer_id,
+                ticket.ticket_id,
+                summary=self._build_summary_record(result, ticket),
+            )
+
+    async def _ahandle_persistence(self, result: dict, ticket: Ticket) -> None:
+        """Persist completed ticket or keep as activated, without blocking.
+
+        Uses the repositories' async PostgreSQL client when both have one;
+        Redis steps and sync-only repositories run in a worker thread.
+
+        Args:
+            result: Workflow result.
+            ticket: Ticket being processed.
+        """
+        if self._unit_of_work is not None:
+            async_repos = self._unit_of_work.supports_async
+        else:
+            async_repos = self._ticket_repo.supports_async and self._chat_repo.supports_async
+        triage_result = result.get("triage_result")
+        completed = triage_result is not None and triage_result.recommended_action in (
+            RecommendedAction.AUTO_RESPOND,
+            RecommendedAction.ESCALATE_HUMAN,
+        )
+        if self._persistence_queue is not None or not (async_repos and completed):
+            await asyncio.to_thread(self._handle_persistence, result, ticket)
+            return
+
+        logger.info(
+            f"Ticket completed ({triage_result.recommended_action.value}), "
+            f"persisting to PostgreSQL"
+        )
+        record = self._ticket_record(result, ticket)
+        msg_dicts = self._message_dicts(result)
+        if self._unit_of_work is not None:
+            await self._unit_of_work.asave_ticket_with_messages(record, msg_dicts)
+            logger.info(
+                f"Saved ticket record and {len(msg_dicts)} messages: {ticket.ticket_id}"
+            )
+        else:
+            await self._ticket_repo.asave_ticket(**record)
+            logger.info(f"Saved ticket record: {ticket.ticket_id}")
+            if msg_dicts:
+                await self._chat_repo.asave_messages(
+                    ticket.ticket_id, ticket.customer_id, msg_dicts
+                )
+                logger.info(f"Saved {len(msg_dicts)} messages for ticket: {ticket.ticket_id}")
+
+        await asyncio.to_thread(self._cleanup_checkpoints, ticket)
+
+    def _build_summary_record(self, result: dict, ticket: Ticket) -> dict:
+        """Build compact summary record for an activated ticket.
+
+        Args:
+            result: Workflow result.
+            ticket: Ticket being processed.
+
+        Returns:
+            Summary record with ticket_type, urgency, stage, last_message
+            and, with a prematcher, the thread's running ``customer_text``
+            and its ``embedding``.
+        """
+        triage_result = result.get("triage_result")
+        supervisor_decision = result.get("supervisor_decision")
+
+        ticket_type = (
+            supervisor_decision.ticket_type.value
+            if supervisor_decision
+            else triage_result.extracted_info.product_area or "unknown"
+        )
+        last_message = ticket.messages[-1].content[:100] if ticket.messages else "No messages"
+
+        record = {
+            "ticket_type": ticket_type,
+            "urgency": triage_result.urgency.value,
+            "stage": result.get("current_agent") or "unknown",
+            "last_message": last_message,
+        }
+        if self._ticket_prematcher:
+            # Extend the text stored for earlier turns of this thread
+            previous = self._checkpoint_repo.get_ticket_summaries(ticket.customer_id).get(
+                ticket.ticket_id, {}
+            )
+            customer_text = self._ticket_prematcher.ticket_text(
+                [msg.content for msg in ticket.messages if msg.role == "customer"],
+                previous_text=previous.get("customer_text"),
+            )
+            record["customer_text"] = customer_text
+            embedding = self._ticket_prematcher.embed_ticket(customer_text)
+            if embedding:
+                record["embedding"] = embedding
+        return record
 
     def _persist_ticket(self, result: dict, ticket: Ticket) -> None:
         """Save ticket to PostgreSQL and cleanup Redis.
@@ -246,36 +522,121 @@ class TriageService:
             result: Workflow result.
             ticket: Ticket to persist.
         """
-        triage_result = result.get("triage_result")
-        messages = result.get("messages", [])
+        record = self._ticket_record(result, ticket)
+        msg_dicts = self._message_dicts(result)
+        if self._unit_of_work is not None:
+            # Ticket row and messages in one transaction, all or nothing
+            self._unit_of_work.save_ticket_with_messages(record, msg_dicts)
+            logger.info(
+                f"Saved ticket record and {len(msg_dicts)} messages: {ticket.ticket_id}"
+            )
+            self._cleanup_checkpoints(ticket)
+            return
 
         # Save ticket record
-        self._ticket_repo.save_ticket(
-            ticket_id=ticket.ticket_id,
-            customer_id=ticket.customer_id,
-            status="closed",
-            urgency=triage_result.urgency.value,
-            ticket_type=triage_result.extracted_info.product_area,
-            triage_result=triage_result.model_dump() if hasattr(triage_result, "model_dump") else {},
-        )
+        self._ticket_repo.save_ticket(**record)
         logger.info(f"Saved ticket record: {ticket.ticket_id}")
 
         # Save chat messages
+        if msg_dicts:
+            self._chat_repo.save_messages(ticket.ticket_id, ticket.customer_id, msg_dicts)
+            logger.info(f"Saved {len(msg_dicts)} messages for ticket: {ticket.ticket_id}")
+
+        self._cleanup_checkpoints(ticket)
+
+    def _enqueue_ticket(self, result: dict, ticket: Ticket) -> None:
+        """Queue a completed ticket for write-behind persistence.
+
+        The ticket is deactivated right away so matching never sees it;
+        the worker writes it to PostgreSQL and deletes its checkpoints.
+        Falls back to persisting inline if the queue is unavailable.
+
+        Args:
+            result: Workflow result.
+            ticket: Completed ticket.
+        """
+        try:
+            entry_id = self._persistence_queue.enqueue(
+                self._ticket_record(result, ticket), self._message_dicts(result)
+            )
+        except Exception as e:
+            logger.warning(f"Persistence queue unavailable, persisting inline: {e}")
+            self._persist_ticket(result, ticket)
+            return
+
+        self._checkpoint_repo.deactivate_ticket(ticket.customer_id, ticket.ticket_id)
+        logger.info(f"Queued ticket {ticket.ticket_id} for persistence ({entry_id})")
+
+    def _ticket_record(self, result: dict, ticket: Ticket) -> dict:
+        """Build the closed ticket record for PostgreSQL.
+
+        Args:
+            result: Workflow result.
+            ticket: Ticket to persist.
+
+        Returns:
+            Keyword arguments for ``TicketRepository.save_ticket``.
+        """
+        triage_result = result.get("triage_result")
+        return {
+            "ticket_id": ticket.ticket_id,
+            "customer_id": ticket.customer_id,
+            "status": "closed",
+            "urgency": triage_result.urgency.value,
+            "ticket_type": triage_result.extracted_info.product_area,
+            "triage_result": (
+                triage_result.model_dump() if hasattr(triage_result, "model_dump") else {}
+            ),
+        }
+
+    def _message_dicts(self, result: dict) -> list[dict]:
+        """Convert workflow messages to chat message records.
+
+        Args:
+            result: Workflow result.
+
+        Returns:
+            List of dicts with 'role' and 'content'.
+        """
         msg_dicts = []
-        for msg in messages:
+        for msg in result.get("messages", []):
             role = "human" if hasattr(msg, "type") and msg.type == "human" else "ai"
             msg_dicts.append({"role": role, "content": msg.content})
+        return msg_dicts
 
-        if msg_dicts:
-            self._chat_repo.save_messages(ticket.ticket_id, ticket.customer_id, msg_dicts)
-            logger.info(f"Saved {len(msg_dicts)} messages for ticket: {ticket.ticket_id}")
+    def _cleanup_checkpoints(self, ticket: Ticket) -> None:
+        """Deactivate a persisted ticket and delete its Redis checkpoints.
+
+        Args:
+            ticket: Persisted ticket.
+        """
+        if self._cleanup_executor:
+            # Deactivate now so matching never sees the ticket; delete keys later
+            self._checkpoint_repo.deactivate_ticket(ticket.customer_id, ticket.ticket_id)
+            self._cleanup_executor.submit(
+                self._purge_checkpoints, ticket.customer_id, ticket.ticket_id
+            )
+            logger.info(f"Scheduled Redis cleanup for ticket: {ticket.ticket_id}")
+            return
 
-        # Cleanup Redis checkpoints
         deleted = self._checkpoint_repo.delete_ticket_checkpoints(
             ticket.customer_id, ticket.ticket_id
         )
         logger.info(f"Deleted {deleted} Redis keys for ticket: {ticket.ticket_id}")
 
+    def _purge_checkpoints(self, customer_id: str, ticket_id: str) -> None:
+        """Delete checkpoint keys for a completed ticket (background worker).
+
+        Args:
+            customer_id: Customer identifier.
+            ticket_id: Ticket identifier.
+        """
+        try:
+            deleted = self._checkpoint_repo.purge_checkpoint_keys(customer_id, ticket_id)
+            logger.info(f"Deleted {deleted} Redis keys for ticket: {ticket_id}")
+        except Exception as e:
+            logger.error(f"Background cleanup failed for ticket {ticket_id}: {e}")
+
     def _generate_ticket_id(self) -> str:
         """Generate new ticket ID.
 